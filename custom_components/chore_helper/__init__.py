@@ -6,93 +6,120 @@ https://github.com/bmcclure/ha-chore-helper
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import timedelta
+from itertools import islice
+from typing import Any
 
 import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_HIDDEN,
-    CONF_ENTITIES,
-    CONF_ENTITY_ID,
-    WEEKDAYS,
+from homeassistant.const import ATTR_AREA_ID, CONF_ENTITY_ID, CONF_NAME, CONF_PATH
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
 )
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.discovery import async_load_platform
 import voluptuous as vol
 
 from . import const, helpers
+from .blackout import async_load_blackouts, blackout_date
+from .bulk import BulkRecompute
+from .completion_log import CompletionLog
 from .const import LOGGER
+from .ics import ChoreCalendarView
+from .importer import async_import_chores, entry_chore_ids, load_chore_file
+from .index import ChoreIndex
+from .overrides import OverrideStore
+from .sensor import async_reconfigure_entry
+from .statistics import StatisticsStore
+from .summary import ChoreSummary
+from .timers import DueTimers
+from .websocket import async_setup_websocket
 
 PLATFORMS: list[str] = [const.SENSOR_PLATFORM]
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=30)
 
-months = [m["value"] for m in const.MONTH_OPTIONS]
-frequencies = [f["value"] for f in const.FREQUENCY_OPTIONS]
-
-SENSOR_SCHEMA = vol.Schema(
-    {
-        vol.Required(const.CONF_FREQUENCY): vol.In(frequencies),
-        vol.Required(const.CONF_ICON_NORMAL): cv.icon,
-        vol.Optional(const.CONF_ICON_TODAY): cv.icon,
-        vol.Optional(const.CONF_ICON_TOMORROW): cv.icon,
-        vol.Optional(ATTR_HIDDEN): cv.boolean,
-        vol.Optional(const.CONF_MANUAL): cv.boolean,
-        vol.Optional(const.CONF_DATE): helpers.month_day_text,
-        vol.Optional(const.CONF_TIME): cv.time,
-        vol.Optional(CONF_ENTITIES): cv.entity_ids,
-        vol.Optional(const.CONF_CHORE_DAY): vol.In(WEEKDAYS),
-        vol.Optional(const.CONF_FIRST_MONTH): vol.In(months),
-        vol.Optional(const.CONF_LAST_MONTH): vol.In(months),
-        vol.Optional(const.CONF_WEEKDAY_ORDER_NUMBER): vol.All(
-            vol.Coerce(int), vol.Range(min=1, max=5)
-        ),
-        vol.Optional(const.CONF_PERIOD): vol.All(
-            vol.Coerce(int), vol.Range(min=1, max=1000)
-        ),
-        vol.Optional(const.CONF_FIRST_WEEK): vol.All(
-            vol.Coerce(int), vol.Range(min=1, max=52)
-        ),
-        vol.Optional(const.CONF_START_DATE): cv.date,
-        vol.Optional(const.CONF_DATE_FORMAT): cv.string,
-    },
-    extra=vol.ALLOW_EXTRA,
-)
-
 CONFIG_SCHEMA = vol.Schema(
     {
         const.DOMAIN: vol.Schema(
-            {vol.Optional(const.CONF_SENSORS): vol.All(cv.ensure_list, [SENSOR_SCHEMA])}
+            {
+                # Validated chore by chore when imported
+                vol.Optional(const.CONF_SENSORS): vol.All(cv.ensure_list, [dict]),
+                vol.Optional(const.CONF_CHORE_LIST): cv.string,
+                vol.Optional(const.CONF_BULK_RECOMPUTE_WORKERS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=64)
+                ),
+                vol.Optional(const.CONF_BLACKOUTS): vol.All(
+                    cv.ensure_list,
+                    [
+                        vol.Schema(
+                            {
+                                vol.Required(CONF_NAME): cv.string,
+                                vol.Optional(const.CONF_DATES): vol.All(
+                                    cv.ensure_list, [blackout_date]
+                                ),
+                                vol.Optional(CONF_PATH): cv.string,
+                            }
+                        )
+                    ],
+                ),
+            }
         )
     },
     extra=vol.ALLOW_EXTRA,
 )
 
-COMPLETE_NOW_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional(const.ATTR_LAST_COMPLETED): cv.datetime,
-    }
+# The chores to call a service for: entities, or all chores in areas, labels or groups
+TARGET_FIELDS = {
+    vol.Optional(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(const.ATTR_LABEL_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(const.CONF_GROUP): vol.All(cv.ensure_list, [cv.string]),
+}
+TARGET_SCOPES = {
+    ATTR_AREA_ID: const.SCOPE_AREA,
+    const.ATTR_LABEL_ID: const.SCOPE_LABEL,
+    const.CONF_GROUP: const.SCOPE_GROUP,
+}
+
+COMPLETE_NOW_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **TARGET_FIELDS,
+            vol.Optional(const.ATTR_LAST_COMPLETED): cv.datetime,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ENTITY_ID, *TARGET_SCOPES),
 )
 
-UPDATE_STATE_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
-    }
+UPDATE_STATE_SCHEMA = vol.All(
+    vol.Schema(TARGET_FIELDS),
+    cv.has_at_least_one_key(CONF_ENTITY_ID, *TARGET_SCOPES),
 )
 
-ADD_DATE_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
-        vol.Required(const.CONF_DATE): cv.date,
-    }
+ADD_DATE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **TARGET_FIELDS,
+            vol.Required(const.CONF_DATE): cv.date,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ENTITY_ID, *TARGET_SCOPES),
 )
 
-REMOVE_DATE_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional(const.CONF_DATE): cv.date,
-    }
+REMOVE_DATE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **TARGET_FIELDS,
+            vol.Optional(const.CONF_DATE): cv.date,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ENTITY_ID, *TARGET_SCOPES),
 )
 
 ADD_REMOVE_TIME_SCHEMA = vol.Schema(
@@ -102,24 +129,105 @@ ADD_REMOVE_TIME_SCHEMA = vol.Schema(
     }
 )
 
-OFFSET_DATE_SCHEMA = vol.Schema(
+OFFSET_DATE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **TARGET_FIELDS,
+            vol.Optional(const.CONF_DATE): cv.date,
+            vol.Required(const.CONF_OFFSET): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=-const.MAX_DATE_OFFSET, max=const.MAX_DATE_OFFSET),
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ENTITY_ID, *TARGET_SCOPES),
+)
+
+GET_SCHEDULE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **TARGET_FIELDS,
+            vol.Optional(const.CONF_START): cv.date,
+            vol.Optional(const.CONF_END): cv.date,
+            vol.Optional(const.CONF_COUNT): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=const.MAX_SCHEDULE_COUNT)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ENTITY_ID, *TARGET_SCOPES),
+)
+
+IMPORT_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
-        vol.Required(const.CONF_DATE): cv.date,
-        vol.Required(const.CONF_OFFSET): vol.All(
-            vol.Coerce(int), vol.Range(min=-31, max=31)
-        ),
+        vol.Optional(CONF_PATH): cv.string,
+        vol.Optional(const.CONF_CHORE_LIST): cv.string,
     }
 )
 
 
+def target_entity_ids(hass: HomeAssistant, data: Mapping[str, Any]) -> list[str]:
+    """Return the entity IDs of the targeted chores, resolved with the index."""
+    entity_ids = list(data.get(CONF_ENTITY_ID, []))
+    scopes = [
+        (scope, value)
+        for key, scope in TARGET_SCOPES.items()
+        for value in data.get(key, [])
+    ]
+    if scopes:
+        index: ChoreIndex = hass.data[const.DOMAIN][const.CHORE_INDEX]
+        listed = set(entity_ids)
+        entity_ids.extend(sorted(index.entities_in(scopes).difference(listed)))
+    return entity_ids
+
+
+def chore_schedules(hass: HomeAssistant, data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the due dates of the targeted chores within a window, or the next ones.
+
+    The dates come from the forecasts where possible, and are calculated lazily
+    after them. At most MAX_SCHEDULE_DATES dates are returned in total, chores
+    left with fewer dates than requested are marked truncated.
+    """
+    start = data.get(const.CONF_START, helpers.now().date())
+    end = data.get(const.CONF_END)
+    count = data.get(const.CONF_COUNT)
+    if end is None:
+        count = count or const.DEFAULT_SCHEDULE_COUNT
+        end = start + timedelta(days=const.MAX_SCHEDULE_DAYS)
+    elif end < start:
+        raise HomeAssistantError(f"The end date {end} is before {start}")
+    elif (end - start).days > const.MAX_SCHEDULE_DAYS:
+        raise HomeAssistantError(
+            f"The schedule can be read for up to {const.MAX_SCHEDULE_DAYS} days"
+        )
+    entities = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    remaining = const.MAX_SCHEDULE_DATES
+    response: dict[str, Any] = {}
+    for entity_id in target_entity_ids(hass, data):
+        if (entity := entities.get(entity_id)) is None:
+            LOGGER.error("Failed reading the schedule of %s - not a chore", entity_id)
+            continue
+        wanted = remaining + 1 if count is None else count
+        limit = min(wanted, remaining)
+        # One more date than the limit, to tell if any were left out
+        due_dates = list(islice(entity.scheduled_dates(start, end), limit + 1))
+        chore: dict[str, Any] = {
+            CONF_NAME: entity.name,
+            "due_dates": helpers.dates_to_texts(due_dates[:limit]),
+        }
+        if len(due_dates) > limit and limit < wanted:
+            chore["truncated"] = True
+        remaining -= len(chore["due_dates"])
+        response[entity_id] = chore
+    return response
+
+
 # pylint: disable=unused-argument
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up platform - register services, initialize data structure."""
 
     async def handle_add_date(call: ServiceCall) -> None:
         """Handle the add_date service call."""
-        entity_ids = call.data.get(CONF_ENTITY_ID, [])
+        entity_ids = target_entity_ids(hass, call.data)
         chore_date = call.data.get(const.CONF_DATE)
         for entity_id in entity_ids:
             LOGGER.debug("called add_date %s from %s", chore_date, entity_id)
@@ -136,7 +244,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
     async def handle_remove_date(call: ServiceCall) -> None:
         """Handle the remove_date service call."""
-        entity_ids = call.data.get(CONF_ENTITY_ID, [])
+        entity_ids = target_entity_ids(hass, call.data)
         chore_date = call.data.get(const.CONF_DATE, None)
         for entity_id in entity_ids:
             LOGGER.debug("called remove_date %s from %s", chore_date, entity_id)
@@ -153,7 +261,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
     async def handle_offset_date(call: ServiceCall) -> None:
         """Handle the offset_date service call."""
-        entity_ids = call.data.get(CONF_ENTITY_ID, [])
+        entity_ids = target_entity_ids(hass, call.data)
         offset = call.data.get(const.CONF_OFFSET)
         chore_date = call.data.get(const.CONF_DATE, None)
         for entity_id in entity_ids:
@@ -172,32 +280,78 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
     async def handle_update_state(call: ServiceCall) -> None:
         """Handle the update_state service call."""
-        entity_ids = call.data.get(CONF_ENTITY_ID, [])
+        entity_ids = target_entity_ids(hass, call.data)
         for entity_id in entity_ids:
             LOGGER.debug("called update_state for %s", entity_id)
             try:
                 entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                entity.update_state()
+                await entity.async_update_state()
             except KeyError as err:
                 LOGGER.error("Failed updating state for %s - %s", entity_id, err)
 
     async def handle_complete_chore(call: ServiceCall) -> None:
         """Handle the complete_chore service call."""
-        entity_ids = call.data.get(CONF_ENTITY_ID, [])
+        entity_ids = target_entity_ids(hass, call.data)
         last_completed = call.data.get(const.ATTR_LAST_COMPLETED, helpers.now())
         for entity_id in entity_ids:
             LOGGER.debug("called complete for %s", entity_id)
             try:
                 entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                entity.last_completed = dt_util.as_local(last_completed)
-                entity.update_state()
+                await entity.complete(
+                    dt_util.as_local(last_completed), call.context.user_id
+                )
             except KeyError as err:
                 LOGGER.error(
                     "Failed setting last completed for %s - %s", entity_id, err
                 )
 
+    async def handle_get_schedule(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_schedule service call."""
+        return chore_schedules(hass, call.data)
+
+    async def handle_import(call: ServiceCall) -> ServiceResponse:
+        """Handle the import service call."""
+        chore_list = call.data.get(const.CONF_CHORE_LIST)
+        if (path := call.data.get(CONF_PATH)) is None:
+            definitions = yaml_chores
+            chore_list = chore_list or yaml_chore_list
+        else:
+            path = hass.config.path(path)
+            if not hass.config.is_allowed_path(path):
+                raise HomeAssistantError(f"Importing chores from {path} is not allowed")
+            try:
+                definitions = await hass.async_add_executor_job(load_chore_file, path)
+            except (OSError, ValueError, HomeAssistantError) as err:
+                raise HomeAssistantError(
+                    f"Failed loading chores from {path} ({err})"
+                ) from err
+        result = await async_import_chores(hass, definitions, chore_list)
+        return result if call.return_response else None
+
+    yaml_chores = config.get(const.DOMAIN, {}).get(const.CONF_SENSORS, [])
+    yaml_chore_list = config.get(const.DOMAIN, {}).get(const.CONF_CHORE_LIST)
     hass.data.setdefault(const.DOMAIN, {})
     hass.data[const.DOMAIN].setdefault(const.SENSOR_PLATFORM, {})
+    hass.data[const.DOMAIN].setdefault(const.CHORE_INDEX, ChoreIndex())
+    completion_log = CompletionLog(hass)
+    await completion_log.async_load()
+    hass.data[const.DOMAIN][const.COMPLETION_LOG] = completion_log
+    statistics = StatisticsStore(hass)
+    await statistics.async_load()
+    hass.data[const.DOMAIN][const.STATISTICS] = statistics
+    overrides = OverrideStore(hass)
+    await overrides.async_load()
+    hass.data[const.DOMAIN][const.OVERRIDES] = overrides
+    hass.data[const.DOMAIN][const.DUE_TIMERS] = DueTimers(hass)
+    hass.data[const.DOMAIN][const.SUMMARY] = ChoreSummary(hass)
+    hass.data[const.DOMAIN][const.BLACKOUTS] = await async_load_blackouts(
+        hass, config.get(const.DOMAIN, {}).get(const.CONF_BLACKOUTS, [])
+    )
+    if (
+        workers := config.get(const.DOMAIN, {}).get(const.CONF_BULK_RECOMPUTE_WORKERS)
+    ) is not None:
+        LOGGER.debug("Recomputing chore schedules with %d workers", workers)
+        hass.data[const.DOMAIN][const.BULK_RECOMPUTE] = BulkRecompute(hass, workers)
     hass.services.async_register(
         const.DOMAIN,
         "complete",
@@ -222,16 +376,49 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     hass.services.async_register(
         const.DOMAIN, "offset_date", handle_offset_date, schema=OFFSET_DATE_SCHEMA
     )
+    hass.services.async_register(
+        const.DOMAIN,
+        "get_schedule",
+        handle_get_schedule,
+        schema=GET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        const.DOMAIN,
+        "import",
+        handle_import,
+        schema=IMPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.http.register_view(ChoreCalendarView())
+    async_setup_websocket(hass)
+
+    # The summary sensors are not part of any chore
+    hass.async_create_task(
+        async_load_platform(hass, const.SENSOR_PLATFORM, const.DOMAIN, {}, config)
+    )
+
+    # Create or update the chores defined in YAML
+    if yaml_chores:
+        hass.async_create_task(async_import_chores(hass, yaml_chores, yaml_chore_list))
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
-    LOGGER.debug(
-        "Setting %s (%s) from ConfigFlow",
-        config_entry.title,
-        config_entry.options[const.CONF_FREQUENCY],
-    )
+    if const.CONF_CHORES in config_entry.options:
+        LOGGER.debug(
+            "Setting chore list %s (%d chores)",
+            config_entry.title,
+            len(config_entry.options[const.CONF_CHORES]),
+        )
+    else:
+        LOGGER.debug(
+            "Setting %s (%s) from ConfigFlow",
+            config_entry.title,
+            config_entry.options[const.CONF_FREQUENCY],
+        )
     config_entry.add_update_listener(update_listener)
 
     # Add sensor
@@ -248,10 +435,15 @@ async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         LOGGER.info("Successfully removed sensor from the chore_helper integration")
     except ValueError:
         pass
+    for chore_id in entry_chore_ids(config_entry):
+        hass.data[const.DOMAIN][const.STATISTICS].remove(chore_id)
+        hass.data[const.DOMAIN][const.OVERRIDES].remove(chore_id)
 
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update listener - to re-create device after options update."""
+    """Update listener - apply the options in place, or re-create the device."""
+    if await async_reconfigure_entry(hass, entry):
+        return
     await hass.config_entries.async_forward_entry_unload(entry, const.SENSOR_PLATFORM)
     hass.async_add_job(
         hass.config_entries.async_forward_entry_setup(entry, const.SENSOR_PLATFORM)
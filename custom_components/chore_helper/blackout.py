@@ -0,0 +1,158 @@
+"""Blackout calendars - dates when chores are not due, like holidays."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import date, timedelta
+import json
+from pathlib import Path
+from typing import Any
+
+from homeassistant.const import CONF_NAME, CONF_PATH
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.yaml import load_yaml
+import voluptuous as vol
+
+from . import const
+from .const import LOGGER
+
+
+def parse_blackout(value: Any) -> tuple[date, date] | tuple[int, int]:
+    """Parse a blackout date.
+
+    Either a date (2024-12-25), a range of dates (2024-08-01/2024-08-14), or a
+    day of every year (12-25). Returns the first and last date of the range, or
+    the month and day of a yearly date.
+    """
+    text = str(value).strip()
+    try:
+        if "/" in text:
+            first, last = (date.fromisoformat(d.strip()) for d in text.split("/"))
+            if last < first:
+                raise ValueError
+            return first, last
+        if text.count("-") == 1:
+            month, day = (int(x) for x in text.split("-"))
+            date(2000, month, day)  # A leap year, to accept 02-29
+            return month, day
+        day = date.fromisoformat(text)
+    except ValueError as error:
+        raise vol.Invalid(f"Invalid blackout date: {value}") from error
+    return day, day
+
+
+def blackout_date(value: Any) -> str:
+    """Validate a blackout date."""
+    parse_blackout(value)
+    return str(value).strip()
+
+
+class BlackoutCalendar:
+    """Set of dates, compiled to the day ordinals of each year when first used."""
+
+    __slots__ = "name", "_dates", "_yearly", "_years"
+
+    def __init__(self, name: str, blackouts: Iterable[Any]) -> None:
+        """Create the calendar from the blackout dates."""
+        self.name = name
+        # Day ordinals of the dates and ranges, by year
+        self._dates: dict[int, set[int]] = {}
+        # Month and day of the dates of every year
+        self._yearly: list[tuple[int, int]] = []
+        self._years: dict[int, frozenset[int]] = {}
+        for blackout in blackouts:
+            first, last = parse_blackout(blackout)
+            if isinstance(first, int):
+                self._yearly.append((first, last))
+                continue
+            for ordinal in range(first.toordinal(), last.toordinal() + 1):
+                self._dates.setdefault(date.fromordinal(ordinal).year, set()).add(
+                    ordinal
+                )
+
+    def _year(self, year: int) -> frozenset[int]:
+        """Return the day ordinals of the year, compiled on first use."""
+        if (ordinals := self._years.get(year)) is None:
+            yearly = set()
+            for month, day in self._yearly:
+                try:
+                    yearly.add(date(year, month, day).toordinal())
+                except ValueError:
+                    continue  # 02-29 outside of leap years
+            ordinals = self._years[year] = frozenset(
+                self._dates.get(year, set()) | yearly
+            )
+        return ordinals
+
+    def __contains__(self, day: date) -> bool:
+        """Return if the day is blacked out."""
+        return day.toordinal() in self._year(day.year)
+
+
+def blacked_out(calendars: tuple[BlackoutCalendar, ...], day: date) -> bool:
+    """Return if the day is blacked out in any of the calendars."""
+    return any(day in calendar for calendar in calendars)
+
+
+def apply_blackouts(
+    calendars: tuple[BlackoutCalendar, ...], policy: str, due_date: date
+) -> date | None:
+    """Skip the due date or shift it to the nearest day that is not blacked out."""
+    if not calendars or not blacked_out(calendars, due_date):
+        return due_date
+    if policy == const.BLACKOUT_SKIP:
+        return None
+    step = timedelta(days=1 if policy == const.BLACKOUT_SHIFT_FORWARD else -1)
+    for _ in range(const.MAX_BLACKOUT_SHIFT):
+        due_date += step
+        if not blacked_out(calendars, due_date):
+            return due_date
+    return None
+
+
+def load_blackout_file(path: str) -> list:
+    """Load the blackout dates from a JSON or YAML file."""
+    if Path(path).suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as file:
+            content = json.load(file)
+    else:
+        content = load_yaml(path)
+    if not isinstance(content, list):
+        raise HomeAssistantError(f"{path} does not contain a list of dates")
+    return content
+
+
+async def async_load_blackouts(
+    hass: HomeAssistant, definitions: list[Mapping[str, Any]]
+) -> dict[str, BlackoutCalendar]:
+    """Compile the blackout calendars, with the dates loaded from their files."""
+    calendars: dict[str, BlackoutCalendar] = {}
+    for definition in definitions:
+        name = definition[CONF_NAME]
+        blackouts = list(definition.get(const.CONF_DATES, []))
+        if (path := definition.get(CONF_PATH)) is not None:
+            path = hass.config.path(path)
+            try:
+                blackouts += await hass.async_add_executor_job(load_blackout_file, path)
+            except (OSError, ValueError, HomeAssistantError) as err:
+                LOGGER.error("Failed loading blackout dates from %s (%s)", path, err)
+        try:
+            calendars[name] = BlackoutCalendar(name, blackouts)
+        except vol.Invalid as err:
+            LOGGER.error("Invalid blackout calendar %s (%s)", name, err)
+    return calendars
+
+
+def chore_blackouts(
+    hass: HomeAssistant, options: Mapping[str, Any]
+) -> tuple[BlackoutCalendar, ...]:
+    """Return the blackout calendars the chore options refer to."""
+    calendars = hass.data.get(const.DOMAIN, {}).get(const.BLACKOUTS, {})
+    found = []
+    for name in options.get(const.CONF_BLACKOUTS) or []:
+        if (calendar := calendars.get(name)) is None:
+            LOGGER.warning("Blackout calendar %s is not defined", name)
+            continue
+        found.append(calendar)
+    return tuple(found)
@@ -0,0 +1,122 @@
+"""Recompute the schedules of many chores at once in a process pool."""
+
+from __future__ import annotations
+
+from array import array
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import copy
+import multiprocessing
+import pickle
+from datetime import date
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from . import const, helpers
+from .const import LOGGER
+from .schedule import ChoreSchedule, forecast_schedules
+
+if TYPE_CHECKING:
+    from .chore import Chore
+
+
+class BulkRecompute:
+    """Shard chore schedules across worker processes and merge the results."""
+
+    __slots__ = "_hass", "_workers", "_executor", "_task"
+
+    def __init__(self, hass: HomeAssistant, workers: int) -> None:
+        """Create the bulk recompute for the given number of worker processes."""
+        self._hass = hass
+        self._workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._task: asyncio.Task | None = None
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_shutdown)
+
+    @property
+    def workers(self) -> int:
+        """Return the number of worker processes."""
+        return self._workers
+
+    async def async_recompute(self) -> None:
+        """Recompute all chores waiting for an update.
+
+        Chores requesting an update while a recompute is running wait for it,
+        instead of starting another one.
+        """
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_task(self._async_recompute_all())
+        await asyncio.shield(self._task)
+
+    async def _async_recompute_all(self) -> None:
+        """Compute the forecasts of all chores that are ready for the update."""
+        chores: list[Chore] = [
+            chore
+            for chore in list(
+                self._hass.data[const.DOMAIN][const.SENSOR_PLATFORM].values()
+            )
+            if await chore.async_ready_for_update()
+        ]
+        if not chores:
+            return
+        today = helpers.now().date()
+        # Snapshot the schedules, later changes must not leak into the workers
+        schedules = [copy.copy(chore.schedule) for chore in chores]
+        LOGGER.debug(
+            "Recomputing %d chores using %d workers", len(chores), self._workers
+        )
+        results = await self._async_forecast(schedules, today)
+        entities = self._hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+        for chore, schedule, due_dates in zip(chores, schedules, results):
+            if entities.get(chore.entity_id) is not chore:  # Removed meanwhile
+                continue
+            await chore.async_set_due_dates(due_dates, today, schedule.runtime_state)
+
+    async def _async_forecast(
+        self, schedules: list[ChoreSchedule], today: date
+    ) -> list[array]:
+        """Forecast the schedules in shards, one per worker."""
+        shards = [
+            list(range(i, len(schedules), self._workers))
+            for i in range(min(self._workers, len(schedules)))
+        ]
+        loop = asyncio.get_running_loop()
+        try:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            shard_results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self._executor,
+                        forecast_schedules,
+                        [schedules[i] for i in shard],
+                        today,
+                    )
+                    for shard in shards
+                )
+            )
+        except (BrokenProcessPool, pickle.PicklingError, OSError) as err:
+            LOGGER.error("Bulk recompute failed, computing in process (%s)", err)
+            self._executor = None
+            return await self._hass.async_add_executor_job(
+                forecast_schedules, schedules, today
+            )
+
+        results: list[array] = [array("i") for _ in schedules]
+        for shard, shard_result in zip(shards, shard_results):
+            for i, due_dates in zip(shard, shard_result):
+                results[i] = due_dates
+        return results
+
+    @callback
+    def _async_shutdown(self, _: Event) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
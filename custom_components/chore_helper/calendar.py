@@ -1,27 +1,120 @@
 """Chore Helper calendar."""
 
 from __future__ import annotations
+from collections import OrderedDict
 import contextlib
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import Throttle
 
-from .const import CALENDAR_NAME, CALENDAR_PLATFORM, DOMAIN, SENSOR_PLATFORM
+from . import helpers
+from .const import (
+    CALENDAR_ADD_ENTITIES,
+    CALENDAR_NAME,
+    CALENDAR_PLATFORM,
+    DOMAIN,
+    DUE_TIME_EVENT_DURATION,
+    LOGGER,
+    SCOPE_AREA,
+    SCOPE_ASSIGNEE,
+    SCOPED_CALENDARS,
+    SENSOR_PLATFORM,
+)
+from .index import Scope
+
+if TYPE_CHECKING:
+    from .chore import Chore
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=1)
+CACHE_SIZE = 32
 
 
 # pylint: disable=unused-argument
 async def async_setup_entry(
-    _: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Add calendar entity to HA."""
-    async_add_entities([ChoreCalendar()], True)
+    """Add calendar entities to HA."""
+    hass.data[DOMAIN][CALENDAR_ADD_ENTITIES] = async_add_entities
+    calendars = [ChoreCalendar()]
+    for scope, data in hass.data[DOMAIN].get(SCOPED_CALENDARS, {}).items():
+        if data.calendar is None:
+            data.calendar = ChoreCalendar(scope, _scope_name(hass, scope))
+            calendars.append(data.calendar)
+    async_add_entities(calendars, True)
+
+
+@callback
+def async_add_to_scope(hass: HomeAssistant, scope: Scope, entity_id: str) -> None:
+    """Add the chore to the calendar of the scope, creating it if needed."""
+    calendars = hass.data[DOMAIN].setdefault(SCOPED_CALENDARS, {})
+    if (data := calendars.get(scope)) is None:
+        data = calendars[scope] = EntitiesCalendarData(
+            hass, scope[1] if scope[0] == SCOPE_ASSIGNEE else None
+        )
+        # Without the platform yet, the calendar is added when it is set up
+        if (add_entities := hass.data[DOMAIN].get(CALENDAR_ADD_ENTITIES)) is not None:
+            LOGGER.debug("Creating chore calendar for %s %s", *scope)
+            data.calendar = ChoreCalendar(scope, _scope_name(hass, scope))
+            add_entities([data.calendar], True)
+    data.add_entity(entity_id)
+
+
+@callback
+def async_remove_from_scope(hass: HomeAssistant, scope: Scope, entity_id: str) -> None:
+    """Remove the chore from the calendar of the scope, and the empty calendar."""
+    calendars = hass.data[DOMAIN].get(SCOPED_CALENDARS, {})
+    if (data := calendars.get(scope)) is None:
+        return
+    data.remove_entity(entity_id)
+    if not data.entities:
+        del calendars[scope]
+        if data.calendar is not None and data.calendar.hass is not None:
+            LOGGER.debug("Removing chore calendar for %s %s", *scope)
+            hass.async_create_task(data.calendar.async_remove())
+
+
+def _scope_name(hass: HomeAssistant, scope: Scope) -> str:
+    """Return the calendar name for the scope."""
+    kind, value = scope
+    if kind == SCOPE_AREA and (area := ar.async_get(hass).async_get_area(value)):
+        value = area.name
+    elif kind == SCOPE_ASSIGNEE and (state := hass.states.get(value)) is not None:
+        value = state.name  # e.g. a person entity
+    return f"{CALENDAR_NAME} {value}"
+
+
+def _event_times(
+    chore: Chore, due_date: date
+) -> tuple[date, date] | tuple[datetime, datetime]:
+    """Return the start and end of the chore event on the due date."""
+    if chore.due_time is None:
+        return due_date, due_date + timedelta(days=1)
+    start = chore.due_datetime(due_date)
+    return start, start + DUE_TIME_EVENT_DURATION
+
+
+def _chore_event(
+    chore: Chore, due_date: date, assignee: str | None, event_date: date | None = None
+) -> CalendarEvent:
+    """Return the event of the chore on the due date, shown on the event date."""
+    start, end = _event_times(chore, due_date if event_date is None else event_date)
+    return CalendarEvent(
+        summary=chore.name if chore.name is not None else "Unknown",
+        start=start,
+        end=end,
+        description=None if assignee is None else f"Assigned to {assignee}",
+        # Stable for the occurrence, even when shown on another day
+        uid=f"{chore.unique_id}-{due_date.isoformat()}",
+    )
 
 
 class ChoreCalendar(CalendarEntity):
@@ -29,16 +122,27 @@ class ChoreCalendar(CalendarEntity):
 
     instances = False
 
-    def __init__(self) -> None:
-        """Create empty calendar."""
+    def __init__(self, scope: Scope | None = None, name: str = CALENDAR_NAME) -> None:
+        """Create empty calendar, for all chores or the chores in the scope."""
         self._cal_data: dict = {}
-        self._attr_name = CALENDAR_NAME
+        self._attr_name = name
+        self._scope = scope
         ChoreCalendar.instances = True
 
+    @property
+    def _data(self) -> EntitiesCalendarData | None:
+        """Return the events of the chores in the calendar.
+
+        None when the last chore left the scope, before the calendar is removed.
+        """
+        if self._scope is None:
+            return self.hass.data[DOMAIN][CALENDAR_PLATFORM]
+        return self.hass.data[DOMAIN].get(SCOPED_CALENDARS, {}).get(self._scope)
+
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        return self.hass.data[DOMAIN][CALENDAR_PLATFORM].event
+        return None if (data := self._data) is None else data.event
 
     @property
     def name(self) -> str | None:
@@ -47,20 +151,21 @@ class ChoreCalendar(CalendarEntity):
 
     async def async_update(self) -> None:
         """Update all calendars."""
-        await self.hass.data[DOMAIN][CALENDAR_PLATFORM].async_update()
+        if (data := self._data) is not None:
+            await data.async_update()
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
         """Get all events in a specific time frame."""
-        return await self.hass.data[DOMAIN][CALENDAR_PLATFORM].async_get_events(
-            hass, start_date, end_date
-        )
+        if (data := self._data) is None:
+            return []
+        return await data.async_get_events(hass, start_date, end_date)
 
     @property
     def extra_state_attributes(self) -> dict | None:
         """Return the device state attributes."""
-        if self.hass.data[DOMAIN][CALENDAR_PLATFORM].event is None:
+        if self.event is None:
             # No tasks, we don't need to show anything.
             return None
         return {}
@@ -69,23 +174,77 @@ class ChoreCalendar(CalendarEntity):
 class EntitiesCalendarData:
     """Class used by the Entities Calendar class to hold all entity events."""
 
-    __slots__ = "_hass", "event", "entities", "_throttle"
+    __slots__ = (
+        "_hass",
+        "event",
+        "entities",
+        "calendar",
+        "assignee",
+        "_throttle",
+        "_cache",
+        "_version",
+        "_revision",
+    )
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize an Entities Calendar Data."""
+    def __init__(self, hass: HomeAssistant, assignee: str | None = None) -> None:
+        """Initialize an Entities Calendar Data, of the assignee's turns if set."""
         self._hass = hass
         self.event: CalendarEvent | None = None
         self.entities: list[str] = []
+        self.calendar: ChoreCalendar | None = None
+        self.assignee = assignee
+        # (start, end, version, today) -> (events, entity IDs with events)
+        self._cache: OrderedDict[
+            tuple[date, date, int, date], tuple[list[CalendarEvent], set[str]]
+        ] = OrderedDict()
+        self._version = 0
+        self._revision = 0
+
+    @property
+    def version(self) -> int:
+        """Return the version of the set of chores in the calendar."""
+        return self._version
+
+    @property
+    def revision(self) -> int:
+        """Return a counter changed with every change of the chores or their dates."""
+        return self._revision
 
     def add_entity(self, entity_id: str) -> None:
         """Append entity ID to the calendar."""
         if entity_id not in self.entities:
             self.entities.append(entity_id)
+            # A new chore can have events in any window
+            self._version += 1
+            self._revision += 1
+            self._cache.clear()
 
     def remove_entity(self, entity_id: str) -> None:
         """Remove entity ID from the calendar."""
         with contextlib.suppress(ValueError):
             self.entities.remove(entity_id)
+            self.invalidate(entity_id)
+
+    def invalidate(
+        self, entity_id: str, since: date = date.max, until: date = date.min
+    ) -> None:
+        """Drop the cached windows affected by a change of the chore.
+
+        These are the windows overlapping the since - until range, where the
+        chore dates might have changed, or without a range all the windows the
+        chore has events in (e.g. when it was removed).
+        """
+        self._revision += 1
+        for key in [
+            key
+            for key, (_, entity_ids) in self._cache.items()
+            if (
+                entity_id in entity_ids
+                if since > until
+                else key[0] <= until and key[1] >= since
+            )
+        ]:
+            del self._cache[key]
 
     async def async_get_events(
         self, hass: HomeAssistant, start_datetime: datetime, end_datetime: datetime
@@ -96,6 +255,12 @@ class EntitiesCalendarData:
             return events
         start_date = start_datetime.date()
         end_date = end_datetime.date()
+        today = helpers.now().date()
+        key = (start_date, end_date, self._version, today)
+        if (cached := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            return list(cached[0])
+        entity_ids: set[str] = set()
         for entity in self.entities:
             if (
                 entity not in hass.data[DOMAIN][SENSOR_PLATFORM]
@@ -103,45 +268,31 @@ class EntitiesCalendarData:
             ):
                 continue
             chore = hass.data[DOMAIN][SENSOR_PLATFORM][entity]
-            start = chore.get_next_due_date(start_date, True)
-            today = datetime.now().date()
-            while start is not None and start_date <= start <= end_date:
-                if chore.show_overdue_today and (start < today):
-                    start = today
-
-                try:
-                    end = start + timedelta(days=1)
-                except TypeError:
-                    end = start
-                name = chore.name if chore.name is not None else "Unknown"
-                event = CalendarEvent(
-                    summary=name,
-                    start=start,
-                    end=end,
+            for due_date in chore.due_dates_between(start_date, end_date):
+                assignee = chore.schedule.assignee(due_date, today)
+                if self.assignee is not None and assignee != self.assignee:
+                    continue
+                event_date = (
+                    today if chore.show_overdue_today and due_date < today else None
                 )
-                events.append(event)
-                start = chore.get_next_due_date(start + timedelta(days=1), True)
-        return events
+                events.append(_chore_event(chore, due_date, assignee, event_date))
+                entity_ids.add(entity)
+        self._cache[key] = (events, entity_ids)
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return list(events)
 
     @Throttle(MIN_TIME_BETWEEN_UPDATES)
     async def async_update(self) -> None:
         """Get the latest data."""
         next_due_dates = {}
         for entity in self.entities:
-            if (
-                self._hass.data[DOMAIN][SENSOR_PLATFORM][entity].next_due_date
-                is not None
+            chore = self._hass.data[DOMAIN][SENSOR_PLATFORM][entity]
+            if chore.next_due_date is not None and (
+                self.assignee is None or chore.assignee == self.assignee
             ):
-                next_due_dates[entity] = self._hass.data[DOMAIN][SENSOR_PLATFORM][
-                    entity
-                ].next_due_date
+                next_due_dates[entity] = chore.next_due_date
         if len(next_due_dates) > 0:
             entity_id = min(next_due_dates.keys(), key=lambda k: next_due_dates[k])
-            start = next_due_dates[entity_id]
-            end = start + timedelta(days=1)
-            name = self._hass.data[DOMAIN][SENSOR_PLATFORM][entity_id].name
-            self.event = CalendarEvent(
-                summary=name,
-                start=start,
-                end=end,
-            )
+            chore = self._hass.data[DOMAIN][SENSOR_PLATFORM][entity_id]
+            self.event = _chore_event(chore, next_due_dates[entity_id], chore.assignee)
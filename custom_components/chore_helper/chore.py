@@ -2,79 +2,152 @@
 
 from __future__ import annotations
 
+from array import array
+import asyncio
+from bisect import bisect_left
 from datetime import date, datetime, time, timedelta
 from typing import Any
-from collections.abc import Generator
-from dateutil.relativedelta import relativedelta
+from collections.abc import Generator, Mapping
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
     ATTR_HIDDEN,
     CONF_NAME,
+    CONF_UNIQUE_ID,
 )
+from homeassistant.core import Event, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_entity_registry_updated_event
 from homeassistant.helpers.restore_state import RestoreEntity
+import homeassistant.util.dt as dt_util
 
 from . import const, helpers
 from .const import LOGGER
-from .calendar import EntitiesCalendarData
+from .calendar import (
+    EntitiesCalendarData,
+    async_add_to_scope,
+    async_remove_from_scope,
+)
+from .blackout import BlackoutCalendar
+from .index import Scope
+from .schedule import ChoreSchedule
+from .statistics import ChoreStatistics
 
 PLATFORMS: list[str] = [const.CALENDAR_PLATFORM]
 
+# Options of the chore itself shown in its calendar events
+EVENT_OPTIONS = frozenset(
+    {CONF_NAME, ATTR_HIDDEN, const.CONF_TIME, const.CONF_SHOW_OVERDUE_TODAY}
+)
+# Options read by the chore itself, changed without a new schedule
+CHORE_OPTIONS = frozenset(
+    {
+        CONF_NAME,
+        CONF_UNIQUE_ID,
+        ATTR_HIDDEN,
+        const.CONF_GROUP,
+        const.CONF_TIME,
+        const.CONF_MANUAL,
+        const.CONF_ICON_NORMAL,
+        const.CONF_ICON_TODAY,
+        const.CONF_ICON_TOMORROW,
+        const.CONF_ICON_OVERDUE,
+        const.CONF_DATE_FORMAT,
+        const.CONF_SHOW_OVERDUE_TODAY,
+    }
+)
+
 
 class Chore(RestoreEntity):
     """Chore Sensor class."""
 
+    schedule_class: type[ChoreSchedule] = ChoreSchedule
+
+    # Changes on every update - not worth recording
+    _unrecorded_attributes = frozenset({const.ATTR_LAST_UPDATED})
+
     __slots__ = (
         "_attr_icon",
         "_attr_name",
         "_attr_state",
+        "_attributes",
+        "_chore_id",
         "_due_dates",
+        "_due_dates_key",
         "_date_format",
         "_days",
-        "_first_month",
+        "_due_time",
+        "_group",
         "_hidden",
         "_icon_normal",
         "_icon_today",
         "_icon_tomorrow",
         "_icon_overdue",
-        "_last_month",
         "_last_updated",
+        "_lock",
         "_manual",
         "_next_due_date",
-        "_forecast_dates",
+        "_options",
         "_overdue",
         "_overdue_days",
-        "_frequency",
-        "_start_date",
-        "_offset_dates",
-        "_add_dates",
-        "_remove_dates",
+        "_schedule",
+        "_statistics",
+        "_update_task",
         "show_overdue_today",
         "config_entry",
-        "last_completed",
     )
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
-        """Read configuration and initialise class variables."""
-        config = config_entry.options
+    def __init__(
+        self, config_entry: ConfigEntry, chore: Mapping[str, Any] | None = None
+    ) -> None:
+        """Read configuration and initialise class variables.
+
+        The chore is given for one of the chores of a chore list entry, with its
+        unique_id, name and options.
+        """
+        config = config_entry.options if chore is None else chore
         self.config_entry = config_entry
-        self._attr_name = (
-            config_entry.title
-            if config_entry.title is not None
-            else config.get(CONF_NAME)
-        )
+        self._chore_id: str | None = None if chore is None else chore[CONF_UNIQUE_ID]
+        if chore is not None:
+            self._attr_name = chore[CONF_NAME]
+        else:
+            self._attr_name = (
+                config_entry.title
+                if config_entry.title is not None
+                else config.get(CONF_NAME)
+            )
         self._hidden = config.get(ATTR_HIDDEN, False)
-        self._manual = config.get(const.CONF_MANUAL)
-        first_month = config.get(const.CONF_FIRST_MONTH, const.DEFAULT_FIRST_MONTH)
-        months = [m["value"] for m in const.MONTH_OPTIONS]
-        self._first_month: int = (
-            months.index(first_month) + 1 if first_month in months else 1
-        )
-        last_month = config.get(const.CONF_LAST_MONTH, const.DEFAULT_LAST_MONTH)
-        self._last_month: int = (
-            months.index(last_month) + 1 if last_month in months else 12
+        self._read_options(config)
+        self._schedule = self.schedule_class(config, self._attr_name)
+        # Day ordinals, converted to dates only when needed
+        self._due_dates: array = array("i")
+        # The day and schedule state the due dates were forecast for
+        self._due_dates_key: tuple | None = None
+        self._next_due_date: date | None = None
+        self._last_updated: datetime | None = None
+        self._days: int | None = None
+        self._overdue: bool = False
+        self._overdue_days: int | None = None
+        self._attr_state = self._days
+        self._attr_icon = self._icon_normal
+        self._attributes: dict[str, Any] | None = None
+        self._statistics: ChoreStatistics | None = None
+        # Recomputes and date changes of the chore are applied one at a time
+        self._lock = asyncio.Lock()
+        self._update_task: asyncio.Task | None = None
+
+    def _read_options(self, config: Mapping[str, Any]) -> None:
+        """Read the options of the chore itself, those in CHORE_OPTIONS."""
+        self._options = config
+        self._group: str | None = config.get(const.CONF_GROUP) or None
+        self._due_time: time | None = (
+            dt_util.parse_time(config[const.CONF_TIME])
+            if config.get(const.CONF_TIME)
+            else None
         )
+        self._manual = config.get(const.CONF_MANUAL)
         self._icon_normal = config.get(const.CONF_ICON_NORMAL)
         self._icon_today = config.get(const.CONF_ICON_TODAY)
         self._icon_tomorrow = config.get(const.CONF_ICON_TOMORROW)
@@ -82,28 +155,64 @@ class Chore(RestoreEntity):
         self._date_format = config.get(
             const.CONF_DATE_FORMAT, const.DEFAULT_DATE_FORMAT
         )
-        self._forecast_dates: int = config.get(const.CONF_FORECAST_DATES) or 0
         self.show_overdue_today: bool = (
             config.get(const.CONF_SHOW_OVERDUE_TODAY) or False
         )
-        self._due_dates: list[date] = []
-        self._next_due_date: date | None = None
-        self._last_updated: datetime | None = None
-        self.last_completed: datetime | None = None
-        self._days: int | None = None
-        self._overdue: bool = False
-        self._overdue_days: int | None = None
-        self._frequency: str = config.get(const.CONF_FREQUENCY)
-        self._attr_state = self._days
-        self._attr_icon = self._icon_normal
-        self._start_date: date | None
-        self._offset_dates: str = None
-        self._add_dates: str = None
-        self._remove_dates: str = None
-        try:
-            self._start_date = helpers.to_date(config.get(const.CONF_START_DATE))
-        except ValueError:
-            self._start_date = None
+
+    async def async_reconfigure(
+        self,
+        config: Mapping[str, Any],
+        name: str | None,
+        blackouts: tuple[BlackoutCalendar, ...],
+    ) -> None:
+        """Apply changed options, keeping the state and overrides of the chore.
+
+        A cosmetic change (e.g. the icons) only reads the options of the chore
+        itself again. The forecast length recalculates the due dates, and the
+        other options create a new schedule with the last completion and
+        overrides of the old one. The cached calendar events are dropped when
+        the changes show in them. A change of the chore class, or of hidden,
+        needs the chore to be set up again instead.
+        """
+        changed = {
+            key
+            for key in {*self._options, *config}
+            if self._options.get(key) != config.get(key)
+        }
+        async with self._lock:
+            LOGGER.debug("(%s) Reconfiguring %s", self._attr_name, sorted(changed))
+            previous_name = self._attr_name
+            self._attr_name = name
+            self._read_options(config)
+            schedule = self._schedule
+            schedule.name = name
+            dates_changed = True
+            schedule_changed = bool(
+                changed - CHORE_OPTIONS - {const.CONF_FORECAST_DATES}
+            )
+            if schedule_changed:
+                new_schedule = self.schedule_class(config, name)
+                new_schedule.last_completed = schedule.last_completed
+                new_schedule.add_dates = schedule.add_dates
+                new_schedule.remove_dates = schedule.remove_dates
+                new_schedule.offset_dates = schedule.offset_dates
+                new_schedule.blackouts = blackouts
+                self._schedule = new_schedule
+            elif const.CONF_FORECAST_DATES in changed:
+                schedule.forecast_dates = config.get(const.CONF_FORECAST_DATES) or 0
+            else:
+                dates_changed = False
+            if schedule_changed or changed & EVENT_OPTIONS or name != previous_name:
+                self._invalidate_calendar()
+            # The schedule has the assignees, scopes of the chore too
+            if schedule_changed or const.CONF_GROUP in changed:
+                self._async_update_scopes()
+            if dates_changed:
+                await self._async_load_due_dates()
+                self._async_dates_loaded()
+            else:
+                self.update_state()
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """When sensor is added to HA, restore state and add it to calendar."""
@@ -130,9 +239,26 @@ class Chore(RestoreEntity):
             )
             self._overdue = state.attributes.get(const.ATTR_OVERDUE, False)
             self._overdue_days = state.attributes.get(const.ATTR_OVERDUE_DAYS, None)
-            self._offset_dates = state.attributes.get(const.ATTR_OFFSET_DATES, None)
-            self._add_dates = state.attributes.get(const.ATTR_ADD_DATES, None)
-            self._remove_dates = state.attributes.get(const.ATTR_REMOVE_DATES, None)
+            self._attributes = None
+
+        # Restore the overrides, moved from the state attributes they were in before
+        overrides = self.hass.data[const.DOMAIN][const.OVERRIDES]
+        if (stored := overrides.get(self.unique_id)) is not None:
+            (
+                self._schedule.add_dates,
+                self._schedule.remove_dates,
+                self._schedule.offset_dates,
+            ) = stored
+        elif state is not None:
+            schedule = self._schedule
+            schedule.add_dates = state.attributes.get(const.ATTR_ADD_DATES) or None
+            schedule.remove_dates = (
+                state.attributes.get(const.ATTR_REMOVE_DATES) or None
+            )
+            schedule.offset_dates = (
+                state.attributes.get(const.ATTR_OFFSET_DATES) or None
+            )
+            overrides.set(self.unique_id, *self._override_state().values())
 
         # Create or add to calendar
         if not self.hidden:
@@ -149,17 +275,37 @@ class Chore(RestoreEntity):
                 self.entity_id
             )
 
+        # Add to the area, label and group calendars, and follow registry changes
+        self._async_update_scopes()
+        self.async_on_remove(
+            async_track_entity_registry_updated_event(
+                self.hass, self.entity_id, self._async_entity_registry_updated
+            )
+        )
+        self._async_schedule_due_time()
+        self._async_notify("added", **self.snapshot())
+
     async def async_will_remove_from_hass(self) -> None:
         """When sensor is removed from HA, remove it and its calendar entity."""
         await super().async_will_remove_from_hass()
         del self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM][self.entity_id]
+        self._async_notify("removed")
+        if (timers := self.hass.data[const.DOMAIN].get(const.DUE_TIMERS)) is not None:
+            timers.cancel(self.entity_id)
         self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].remove_entity(
             self.entity_id
         )
+        for scope in self.hass.data[const.DOMAIN][const.CHORE_INDEX].remove(
+            self.entity_id
+        ):
+            if not self.hidden:
+                async_remove_from_scope(self.hass, scope, self.entity_id)
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID to use for this sensor."""
+        if self._chore_id is not None:  # One of the chores of a chore list
+            return self._chore_id
         if "unique_id" in self.config_entry.data:  # From legacy config
             return self.config_entry.data["unique_id"]
         return self.config_entry.entry_id
@@ -174,6 +320,54 @@ class Chore(RestoreEntity):
         """Return next date attribute."""
         return self._next_due_date
 
+    @property
+    def due_dates(self) -> list[date]:
+        """Return the forecasted due dates."""
+        return [date.fromordinal(ordinal) for ordinal in self._due_dates]
+
+    @property
+    def due_time(self) -> time | None:
+        """Return the time of the day the chore is due, if any."""
+        return self._due_time
+
+    def due_datetime(self, due_date: date) -> datetime:
+        """Return the time the chore is due on the due date."""
+        return datetime.combine(
+            due_date, self._due_time or time(), tzinfo=dt_util.DEFAULT_TIME_ZONE
+        )
+
+    @property
+    def last_completed(self) -> datetime | None:
+        """Return last_completed attribute."""
+        return self._schedule.last_completed
+
+    @last_completed.setter
+    def last_completed(self, value: datetime | None) -> None:
+        """Set last_completed attribute."""
+        old_start_date = self._calculate_start_date()
+        self._schedule.last_completed = value
+        self._attributes = None
+        # Dates from the earlier start date on can move, offsets included
+        self._invalidate_calendar(
+            min(old_start_date, self._calculate_start_date())
+            - timedelta(days=const.MAX_DATE_MOVE)
+        )
+
+    @property
+    def schedule(self) -> ChoreSchedule:
+        """Return the schedule calculating the chore due dates."""
+        return self._schedule
+
+    @property
+    def statistics(self) -> ChoreStatistics | None:
+        """Return the completion statistics of the chore."""
+        if self._statistics is None and self.hass is not None:
+            if (
+                store := self.hass.data[const.DOMAIN].get(const.STATISTICS)
+            ) is not None:
+                self._statistics = store.get(self.unique_id)
+        return self._statistics
+
     @property
     def overdue(self) -> bool:
         """Return overdue attribute."""
@@ -185,19 +379,53 @@ class Chore(RestoreEntity):
         return self._overdue_days
 
     @property
-    def offset_dates(self) -> str:
+    def offset_dates(self) -> str | None:
         """Return offset_dates attribute."""
-        return self._offset_dates
+        return self._schedule.offset_dates
 
     @property
-    def add_dates(self) -> str:
+    def add_dates(self) -> str | None:
         """Return add_dates attribute."""
-        return self._add_dates
+        return self._schedule.add_dates
 
     @property
-    def remove_dates(self) -> str:
+    def remove_dates(self) -> str | None:
         """Return remove_dates attribute."""
-        return self._remove_dates
+        return self._schedule.remove_dates
+
+    @property
+    def assignee(self) -> str | None:
+        """Return who is assigned the next due date."""
+        if self._next_due_date is None:
+            return None
+        return self._schedule.assignee(self._next_due_date, helpers.now().date())
+
+    @property
+    def group(self) -> str | None:
+        """Return the group of the chore."""
+        return self._group
+
+    @property
+    def scopes(self) -> set[Scope]:
+        """Return the scopes (area, labels, group, assignees) the chore belongs to."""
+        scopes: set[Scope] = set()
+        if self._group is not None:
+            scopes.add((const.SCOPE_GROUP, self._group))
+        scopes.update(
+            (const.SCOPE_ASSIGNEE, assignee) for assignee in self._schedule.assignees
+        )
+        if (
+            self.hass is None
+            or (entry := er.async_get(self.hass).async_get(self.entity_id)) is None
+        ):
+            return scopes
+        if entry.area_id is not None:
+            scopes.add((const.SCOPE_AREA, entry.area_id))
+        # Labels are only available in recent Home Assistant versions
+        scopes.update(
+            (const.SCOPE_LABEL, label) for label in getattr(entry, "labels", ())
+        )
+        return scopes
 
     @property
     def hidden(self) -> bool:
@@ -226,21 +454,98 @@ class Chore(RestoreEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+        """Return the state attributes.
+
+        Built again only after the fields they are made of have changed.
+        """
+        if self._attributes is None:
+            self._attributes = self._build_attributes()
+        return self._attributes
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the state attributes."""
         return {
             const.ATTR_LAST_COMPLETED: self.last_completed,
             const.ATTR_LAST_UPDATED: self.last_updated,
             const.ATTR_OVERDUE: self.overdue,
             const.ATTR_OVERDUE_DAYS: self.overdue_days,
             const.ATTR_NEXT_DATE: self.next_due_date,
-            const.ATTR_OFFSET_DATES: self.offset_dates,
-            const.ATTR_ADD_DATES: self.add_dates,
-            const.ATTR_REMOVE_DATES: self.remove_dates,
+            const.ATTR_ASSIGNEE: self.assignee,
+            const.ATTR_OVERRIDES: self._override_summary(),
+            **self._statistics_attributes(),
             ATTR_UNIT_OF_MEASUREMENT: self.native_unit_of_measurement,
             # Needed for translations to work
             ATTR_DEVICE_CLASS: self.DEVICE_CLASS,
         }
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the schedule state sent to the subscribers."""
+        return {
+            "name": self.name,
+            **self._schedule_state(),
+            const.ATTR_LAST_COMPLETED: (
+                None if self.last_completed is None else self.last_completed.isoformat()
+            ),
+            **self._override_state(),
+        }
+
+    def _schedule_state(self) -> dict[str, Any]:
+        """Return the next due date state sent to the subscribers."""
+        return {
+            const.ATTR_NEXT_DATE: (
+                None if self._next_due_date is None else self._next_due_date.isoformat()
+            ),
+            const.ATTR_OVERDUE: self._overdue,
+            const.ATTR_DAYS: self._days,
+        }
+
+    def _override_summary(self) -> dict[str, int]:
+        """Return the number of added, removed and offset dates."""
+        return {
+            "added": len((self.add_dates or "").split()),
+            "removed": len((self.remove_dates or "").split()),
+            "offset": len((self.offset_dates or "").split()),
+        }
+
+    def _override_state(self) -> dict[str, Any]:
+        """Return the added, removed and offset dates sent to the subscribers."""
+        return {
+            const.ATTR_ADD_DATES: self.add_dates,
+            const.ATTR_REMOVE_DATES: self.remove_dates,
+            const.ATTR_OFFSET_DATES: self.offset_dates,
+        }
+
+    @callback
+    def _async_overrides_changed(self) -> None:
+        """Save the changed overrides, and send them to the subscribers."""
+        self.hass.data[const.DOMAIN][const.OVERRIDES].set(
+            self.unique_id, *self._override_state().values()
+        )
+        self._async_notify("dates", **self._override_state())
+
+    @callback
+    def _async_notify(self, change: str, **data: Any) -> None:
+        """Send a change of the chore to the subscribers."""
+        if self.hass is None or self.entity_id is None:
+            return
+        async_dispatcher_send(
+            self.hass,
+            const.SIGNAL_CHORE_CHANGED,
+            {"entity_id": self.entity_id, "change": change, **data},
+        )
+
+    def _statistics_attributes(self) -> dict[str, Any]:
+        """Return the completion statistics attributes."""
+        if (statistics := self.statistics) is None:
+            return {}
+        return {
+            const.ATTR_ON_TIME_RATE: statistics.on_time_rate,
+            const.ATTR_AVERAGE_LATENESS: statistics.average_lateness,
+            const.ATTR_CURRENT_STREAK: statistics.current_streak,
+            const.ATTR_BEST_STREAK: statistics.best_streak,
+            const.ATTR_RECENT_COMPLETIONS: statistics.recent_completions,
+        }
+
     @property
     def DEVICE_CLASS(self) -> str:  # pylint: disable=C0103
         """Return the class of the sensor."""
@@ -255,15 +560,7 @@ class Chore(RestoreEntity):
             f"attributes={self.extra_state_attributes})"
         )
 
-    def _find_candidate_date(self, day1: date) -> date | None:
-        """Find the next possible date starting from day1.
-
-        Only based on calendar, not looking at include/exclude days.
-        Must be implemented for each child class.
-        """
-        raise NotImplementedError
-
-    async def _async_ready_for_update(self) -> bool:
+    async def async_ready_for_update(self) -> bool:
         """Check if the entity is ready for the update.
 
         Skip the update if the sensor was updated today
@@ -285,91 +582,96 @@ class Chore(RestoreEntity):
             pass
         return ready_for_update
 
-    def date_inside(self, dat: date) -> bool:
-        """Check if the date is inside first and last date."""
-        month = dat.month
-        if self._first_month <= self._last_month:
-            return bool(self._first_month <= month <= self._last_month)
-        return bool(self._first_month <= month or month <= self._last_month)
-
-    def move_to_range(self, day: date) -> date:
-        """If the date is not in range, move to the range."""
-        if not self.date_inside(day):
-            year = day.year
-            month = day.month
-            months = [m["label"] for m in const.MONTH_OPTIONS]
-            if self._first_month <= self._last_month < month:
-                LOGGER.debug(
-                    "(%s) %s outside the range, looking from %s next year",
-                    self._attr_name,
-                    day,
-                    months[self._first_month - 1],
-                )
-                return date(year + 1, self._first_month, 1)
-            LOGGER.debug(
-                "(%s) %s outside the range, searching from %s",
-                self._attr_name,
-                day,
-                months[self._first_month - 1],
-            )
-            return date(year, self._first_month, 1)
-        return day
-
     def chore_schedule(self) -> Generator[date, None, None]:
         """Get dates within configured date range."""
-        start_date: date = self._calculate_start_date()
-        for _ in range(int(self._forecast_dates) + 1):
-            try:
-                next_due_date = self._find_candidate_date(start_date)
-            except (TypeError, ValueError):
-                break
-            if next_due_date is None:
-                break
-            if (new_date := self.move_to_range(next_due_date)) != next_due_date:
-                start_date = new_date
-            else:
-                should_remove = False
-                if self._remove_dates is not None:
-                    for remove_date in self._remove_dates.split(" "):
-                        if remove_date == (next_due_date.strftime("%Y-%m-%d")):
-                            should_remove = True
-                            break
-                if not should_remove:
-                    offset = None
-                    if self._offset_dates is not None:
-                        offset_compare = next_due_date.strftime("%Y-%m-%d")
-                        for offset_date in self._offset_dates.split(" "):
-                            if offset_date.startswith(offset_compare):
-                                offset = int(offset_date.split(":")[1])
-                                break
-                    yield (
-                        next_due_date
-                        if offset is None
-                        else next_due_date + relativedelta(days=offset)
-                    )
-                start_date = next_due_date + relativedelta(
-                    days=1
-                )  # look from the next day
-        if self._add_dates is not None:
-            for add_date_str in self._add_dates.split(" "):
-                yield datetime.strptime(add_date_str, "%Y-%m-%d").date()
-        return
+        return self._schedule.due_dates(helpers.now().date())
+
+    def due_dates_between(self, start: date, end: date) -> Generator[date, None, None]:
+        """Lazily generate the chore dates within start and end (inclusive)."""
+        return self._schedule.dates_between(start, end, helpers.now().date())
+
+    def scheduled_dates(self, start: date, end: date) -> Generator[date, None, None]:
+        """Lazily generate the chore dates within start and end (inclusive).
+
+        Taken from the forecast as far as it has all due dates, calculated after.
+        """
+        if (complete_until := self._forecast_complete_until()) is not None:
+            last = min(end, complete_until).toordinal()
+            index = bisect_left(self._due_dates, start.toordinal())
+            while index < len(self._due_dates) and self._due_dates[index] <= last:
+                yield date.fromordinal(self._due_dates[index])
+                index += 1
+            start = max(start, complete_until + timedelta(days=1))
+        if start <= end:
+            yield from self.due_dates_between(start, end)
+
+    def _forecast_complete_until(self) -> date | None:
+        """Return the date until which the forecast has all due dates.
+
+        None if the forecast is out of date, or the added dates make it unclear.
+        """
+        schedule = self._schedule
+        if (
+            not self._due_dates
+            or schedule.add_dates
+            or self._due_dates_key != (helpers.now().date(), schedule.runtime_state)
+        ):
+            return None
+        complete_until = date.fromordinal(self._due_dates[-1])
+        if schedule.offset_dates or schedule.blackouts:
+            # Later dates can be moved before the last forecast date
+            complete_until -= timedelta(days=const.MAX_DATE_MOVE)
+        return complete_until
 
     async def _async_load_due_dates(self) -> None:
         """Fill the chore dates list."""
-        self._due_dates.clear()
-        for chore_date in self.chore_schedule():
-            self._due_dates.append(chore_date)
-        self._due_dates.sort()
+        today = helpers.now().date()
+        self._due_dates = self._schedule.forecast(today)
+        self._due_dates_key = (today, self._schedule.runtime_state)
+
+    def _refresh_due_dates(self) -> None:
+        """Forecast the due dates again, if dates were changed since the forecast."""
+        today = helpers.now().date()
+        if self._due_dates_key is None or self._due_dates_key == (
+            today,
+            self._schedule.runtime_state,
+        ):
+            return
+        self._due_dates = self._schedule.forecast(today)
+        self._due_dates_key = (today, self._schedule.runtime_state)
+
+    def set_due_dates(self, due_dates: array, today: date) -> None:
+        """Set due dates calculated outside of the entity (bulk recompute)."""
+        self._due_dates = due_dates
+        self._due_dates_key = (today, self._schedule.runtime_state)
+        self._async_dates_loaded()
+
+    async def async_set_due_dates(
+        self, due_dates: array, today: date, runtime_state: tuple
+    ) -> None:
+        """Set the due dates of a bulk recompute, of the schedule in runtime_state."""
+        async with self._lock:
+            if self._schedule.runtime_state != runtime_state:
+                # Completed or dates changed meanwhile, the result is out of date
+                due_dates = self._schedule.forecast(today)
+            self.set_due_dates(due_dates, today)
+            self.async_write_ha_state()
 
     async def add_date(self, chore_date: date) -> None:
         """Add date to due dates."""
-        add_dates = self._add_dates.split(" ") if self._add_dates else []
+        async with self._lock:
+            self._add_date(chore_date)
+
+    def _add_date(self, chore_date: date) -> None:
+        """Add date to due dates, while holding the lock."""
+        add_dates = self.add_dates.split(" ") if self.add_dates else []
         date_str = chore_date.strftime("%Y-%m-%d")
         if date_str not in add_dates:
             add_dates.append(date_str)
             add_dates.sort()
-            self._add_dates = " ".join(add_dates)
+            self._schedule.add_dates = " ".join(add_dates)
+            self._invalidate_calendar(chore_date, chore_date)
+            self._async_overrides_changed()
         else:
             LOGGER.warning(
                 "%s was already added to %s",
@@ -380,17 +682,24 @@ class Chore(RestoreEntity):
 
     async def remove_date(self, chore_date: date | None = None) -> None:
         """Remove date from chore dates."""
+        async with self._lock:
+            self._remove_date(chore_date)
+
+    def _remove_date(self, chore_date: date | None) -> None:
+        """Remove date from chore dates, while holding the lock."""
         if chore_date is None:
             chore_date = self.next_due_date
         if chore_date is None:
             LOGGER.warning("No date to remove from %s", self.name)
             return
-        remove_dates = self._remove_dates.split(" ") if self._remove_dates else []
+        remove_dates = self.remove_dates.split(" ") if self.remove_dates else []
         date_str = chore_date.strftime("%Y-%m-%d")
         if date_str not in remove_dates:
             remove_dates.append(date_str)
             remove_dates.sort()
-            self._remove_dates = " ".join(remove_dates)
+            self._schedule.remove_dates = " ".join(remove_dates)
+            self._invalidate_calendar_around(chore_date)
+            self._async_overrides_changed()
         else:
             LOGGER.warning(
                 "%s was already removed from %s",
@@ -401,6 +710,11 @@ class Chore(RestoreEntity):
 
     async def offset_date(self, offset: int, chore_date: date | None = None) -> None:
         """Offset date in chore dates."""
+        async with self._lock:
+            self._offset_date(offset, chore_date)
+
+    def _offset_date(self, offset: int, chore_date: date | None) -> None:
+        """Offset date in chore dates, while holding the lock."""
         if chore_date is None:
             chore_date = self.next_due_date
         if chore_date is None:
@@ -409,25 +723,56 @@ class Chore(RestoreEntity):
         offset_dates = (
             [
                 x
-                for x in self._offset_dates.split(" ")
+                for x in self.offset_dates.split(" ")
                 if not x.startswith(chore_date.strftime("%Y-%m-%d"))
             ]
-            if self._offset_dates is not None
+            if self.offset_dates is not None
             else []
         )
         date_str = chore_date.strftime("%Y-%m-%d")
         offset_dates.append(f"{date_str}:{offset}")
         offset_dates.sort()
-        self._offset_dates = " ".join(offset_dates)
+        self._schedule.offset_dates = " ".join(offset_dates)
+        self._invalidate_calendar_around(chore_date)
+        self._async_overrides_changed()
+        self.update_state()
+
+    async def complete(
+        self, last_completed: datetime, user_id: str | None = None
+    ) -> None:
+        """Mark the chore as completed, and log the completion."""
+        async with self._lock:
+            self._complete(last_completed, user_id)
+
+    def _complete(self, last_completed: datetime, user_id: str | None) -> None:
+        """Mark the chore as completed, while holding the lock."""
+        lateness = (
+            None
+            if self._next_due_date is None
+            else (last_completed.date() - self._next_due_date).days
+        )
+        self.last_completed = last_completed
+        domain_data = self.hass.data[const.DOMAIN]
+        if (statistics := self.statistics) is not None:
+            statistics.completed(last_completed.date(), helpers.now().date(), lateness)
+            domain_data[const.STATISTICS].async_schedule_save()
+        if (completion_log := domain_data.get(const.COMPLETION_LOG)) is not None:
+            completion_log.append(self.unique_id, last_completed, user_id, lateness)
+        self._async_notify(
+            "completed",
+            last_completed=last_completed.isoformat(),
+            user_id=user_id,
+        )
         self.update_state()
 
     def get_next_due_date(self, start_date: date, ignore_today=False) -> date | None:
         """Get next date from self._due_dates."""
         current_date_time = helpers.now()
-        for d in self._due_dates:  # pylint: disable=invalid-name
-            if d < start_date:
-                continue
-            if not ignore_today and d == current_date_time.date():
+        today = current_date_time.date().toordinal()
+        for ordinal in self._due_dates[
+            bisect_left(self._due_dates, start_date.toordinal()) :
+        ]:
+            if not ignore_today and ordinal == today:
                 expiration = time(23, 59, 59)
 
                 if current_date_time.time() > expiration or (
@@ -436,31 +781,57 @@ class Chore(RestoreEntity):
                     and current_date_time.time() >= self.last_completed.time()
                 ):
                     continue
-            return d
+            return date.fromordinal(ordinal)
         return None
 
     async def async_update(self) -> None:
-        """Get the latest data and updates the states."""
-        if not await self._async_ready_for_update() or not self.hass.is_running:
-            return
+        """Get the latest data and updates the states.
 
+        Updates requested while one is running wait for it, instead of
+        computing the same dates again.
+        """
+        if self._update_task is None or self._update_task.done():
+            if not await self.async_ready_for_update() or not self.hass.is_running:
+                return
+            self._update_task = self.hass.async_create_task(self._async_update())
+        await asyncio.shield(self._update_task)
+
+    async def _async_update(self) -> None:
+        """Recompute the chore dates, holding back date changes meanwhile."""
         LOGGER.debug("(%s) Calling update", self._attr_name)
-        await self._async_load_due_dates()
+        if (bulk := self.hass.data[const.DOMAIN].get(const.BULK_RECOMPUTE)) is not None:
+            # Takes the lock of each chore to set its dates
+            await bulk.async_recompute()
+            return
+        async with self._lock:
+            await self._async_load_due_dates()
+            self._async_dates_loaded()
+
+    def _async_dates_loaded(self) -> None:
+        """Fire the loaded event and update the state with the new chore dates."""
         LOGGER.debug(
             "(%s) Dates loaded, firing a chore_helper_loaded event",
             self._attr_name,
         )
         event_data = {
             "entity_id": self.entity_id,
-            "due_dates": helpers.dates_to_texts(self._due_dates),
+            "due_dates": helpers.dates_to_texts(self.due_dates),
         }
         self.hass.bus.async_fire("chore_helper_loaded", event_data)
         if not self._manual:
             self.update_state()
 
+    async def async_update_state(self) -> None:
+        """Update the state, after a running recompute of the chore dates."""
+        async with self._lock:
+            self.update_state()
+
     def update_state(self) -> None:
         """Pick the first event from chore dates, update attributes."""
         LOGGER.debug("(%s) Looking for next chore date", self._attr_name)
+        self._refresh_due_dates()
+        schedule_state = self._schedule_state()
+        self._attributes = None
         self._last_updated = helpers.now()
         today = self._last_updated.date()
         self._next_due_date = self.get_next_due_date(self._calculate_start_date())
@@ -487,8 +858,20 @@ class Chore(RestoreEntity):
                 self._attr_icon = self._icon_today
             elif self._days == 1:
                 self._attr_icon = self._icon_tomorrow
-            self._overdue = self._days < 0
+            self._overdue = self._days < 0 or (
+                self._days == 0
+                and self._due_time is not None
+                and self._last_updated.time() >= self._due_time
+            )
+            if self._overdue:
+                self._attr_icon = self._icon_overdue
             self._overdue_days = 0 if self._days > -1 else abs(self._days)
+            if (
+                self._overdue
+                and (statistics := self.statistics) is not None
+                and statistics.missed(self._next_due_date)
+            ):
+                self.hass.data[const.DOMAIN][const.STATISTICS].async_schedule_save()
         else:
             self._days = None
             self._attr_state = None
@@ -496,81 +879,124 @@ class Chore(RestoreEntity):
             self._overdue = False
             self._overdue_days = None
 
+        self._async_schedule_due_time()
+        if (statistics := self.statistics) is not None and statistics.roll(today):
+            self.hass.data[const.DOMAIN][const.STATISTICS].async_schedule_save()
+
         start_date = self._calculate_start_date()
-        if self._add_dates is not None:
-            self._add_dates = " ".join(
-                [
+        schedule = self._schedule
+        overrides = (schedule.add_dates, schedule.remove_dates, schedule.offset_dates)
+        # Nothing left is None, an empty text would not parse as dates
+        if schedule.add_dates is not None:
+            schedule.add_dates = (
+                " ".join(
                     x
-                    for x in self._add_dates.split(" ")
+                    for x in schedule.add_dates.split()
                     if datetime.strptime(x, "%Y-%m-%d").date() >= start_date
-                ]
+                )
+                or None
             )
-        if self._remove_dates is not None:
-            self._remove_dates = " ".join(
-                [
+        if schedule.remove_dates is not None:
+            schedule.remove_dates = (
+                " ".join(
                     x
-                    for x in self._remove_dates.split(" ")
+                    for x in schedule.remove_dates.split()
                     if datetime.strptime(x, "%Y-%m-%d").date() >= start_date
-                ]
+                )
+                or None
             )
-        if self._offset_dates is not None:
-            self._offset_dates = " ".join(
-                [
+        if schedule.offset_dates is not None:
+            schedule.offset_dates = (
+                " ".join(
                     x
-                    for x in self._offset_dates.split(" ")
+                    for x in schedule.offset_dates.split()
                     if datetime.strptime(x.split(":")[0], "%Y-%m-%d").date()
                     >= start_date
-                ]
+                )
+                or None
             )
 
-    def calculate_day1(self, day1: date, schedule_start_date: date) -> date:
-        """Calculate day1."""
-        start_date = self._calculate_start_date()
-        if start_date > day1:
-            day1 = start_date
-        if schedule_start_date > day1:
-            day1 = schedule_start_date
-        today = helpers.now().date()
-        if (
-            day1 == today
-            and self.last_completed is not None
-            and self.last_completed.date() == today
+        if overrides != (
+            schedule.add_dates,
+            schedule.remove_dates,
+            schedule.offset_dates,
         ):
-            day1 = day1 + relativedelta(days=1)
-        return day1
-
-    def _calculate_start_date(self) -> date:
-        """Calculate start date based on the last completed date."""
-
-        start_date = (
-            self._start_date
-            if self._start_date is not None
-            else date(helpers.now().date().year - 1, 1, 1)
+            self._invalidate_calendar(until=start_date)
+            self._async_overrides_changed()
+        if (changed := self._schedule_state()) != schedule_state:
+            self._async_notify("schedule", **changed)
+
+    @callback
+    def _async_update_scopes(self) -> None:
+        """Index the chore by its scopes, and update the scoped calendars."""
+        added, removed = self.hass.data[const.DOMAIN][const.CHORE_INDEX].update(
+            self.entity_id, self.scopes
         )
+        if self.hidden:
+            return
+        for scope in removed:
+            async_remove_from_scope(self.hass, scope, self.entity_id)
+        for scope in added:
+            async_add_to_scope(self.hass, scope, self.entity_id)
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Move the chore to other scopes when its area or labels change."""
+        if event.data["action"] == "update" and {"area_id", "labels"} & set(
+            event.data.get("changes", {})
+        ):
+            self._async_update_scopes()
 
-        if self.last_completed is not None:
-            last_completed = self.last_completed.date()
-
-            if last_completed > start_date:
-                start_date = last_completed
-            elif last_completed == start_date:
-                start_date += timedelta(days=1)
-
-        return self.move_to_range(start_date)
-
-    def _calculate_schedule_start_date(self) -> date:
-        """Calculate start date for scheduling offsets."""
-
-        after = self._frequency[:6] == "after-"
-        start_date = self._start_date
+    @callback
+    def _async_schedule_due_time(self) -> None:
+        """Update the state when the chore gets overdue at its due time."""
+        if self.hass is None or self.entity_id is None:
+            return
+        if (timers := self.hass.data[const.DOMAIN].get(const.DUE_TIMERS)) is None:
+            return
+        if self._due_time is None or self._next_due_date is None or self._overdue:
+            timers.cancel(self.entity_id)
+            return
+        timers.schedule(
+            self.entity_id, self.due_datetime(self._next_due_date), self._async_due
+        )
 
-        if after and self.last_completed is not None:
-            earliest_date = self._add_period_offset(self.last_completed.date())
+    @callback
+    def _async_due(self) -> None:
+        """Update the state at the due time."""
+        if (
+            self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM].get(self.entity_id)
+            is self
+        ):
+            self.hass.async_create_task(self._async_due_state())
 
-            if earliest_date > start_date:
-                start_date = earliest_date
+    async def _async_due_state(self) -> None:
+        """Update the state at the due time, after a running recompute."""
+        async with self._lock:
+            self.update_state()
+            self.async_write_ha_state()
 
-        return start_date
+    def _invalidate_calendar(
+        self, since: date = date.min, until: date = date.max
+    ) -> None:
+        """Drop the cached calendar windows where the chore dates might change."""
+        if self.hass is None or self.hidden:
+            return
+        domain_data = self.hass.data[const.DOMAIN]
+        scoped_calendars = domain_data.get(const.SCOPED_CALENDARS, {})
+        calendars = [domain_data.get(const.CALENDAR_PLATFORM)] + [
+            scoped_calendars.get(scope)
+            for scope in domain_data[const.CHORE_INDEX].scopes(self.entity_id)
+        ]
+        for calendar in calendars:
+            if calendar is not None:
+                calendar.invalidate(self.entity_id, since, until)
+
+    def _invalidate_calendar_around(self, chore_date: date) -> None:
+        """Drop the cached calendar windows the chore date can be offset into."""
+        margin = timedelta(days=const.MAX_DATE_MOVE)
+        self._invalidate_calendar(chore_date - margin, chore_date + margin)
 
-    def _add_period_offset(self, start_date: date) -> date:
-        return start_date + timedelta(days=1)
+    def _calculate_start_date(self) -> date:
+        """Calculate start date based on the last completed date."""
+        return self._schedule.calculate_start_date(helpers.now().date())
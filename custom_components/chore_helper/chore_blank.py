@@ -2,34 +2,51 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import date
 
 from .chore import Chore
-from .const import LOGGER
+from .schedule import ChoreSchedule
 
 
-class BlankChore(Chore):
-    """No chore due date - for manual update."""
+class BlankSchedule(ChoreSchedule):
+    """No schedule - due dates are filled in by the blueprint or imported."""
+
+    __slots__ = ()
 
-    def _find_candidate_date(self, day1: date) -> date | None:
+    def _find_candidate_date(self, day1: date, today: date) -> date | None:
         """Do not return any date for blank frequency."""
         return None
 
-    async def _async_load_due_dates(self) -> None:
-        """Clear chore dates (filled in by the blueprint)."""
-        self._due_dates.clear()
-        return
+    def _scheduled_dates(self) -> list[date]:
+        """Return the sorted added dates that are not removed."""
+        removed = set((self.remove_dates or "").split())
+        return sorted({d for d in self._added_dates() if d.isoformat() not in removed})
+
+    def due_dates(self, today: date) -> Generator[date, None, None]:
+        """Generate the added dates, the only dates of a blank frequency."""
+        yield from self._scheduled_dates()
+
+    def dates_between(
+        self, start: date, end: date, today: date, deadline: float | None = None
+    ) -> Generator[date, None, None]:
+        """Generate the added dates within start and end (inclusive)."""
+        yield from (d for d in self._scheduled_dates() if start <= d <= end)
+
+
+class BlankChore(Chore):
+    """No chore due date - for manual update."""
+
+    schedule_class = BlankSchedule
+
+    def _async_dates_loaded(self) -> None:
+        """Fire the loaded event, and update the state from the added dates.
 
-    async def async_update(self) -> None:
-        """Get the latest data and updates the states."""
-        if not await self._async_ready_for_update() or not self.hass.is_running:
+        Without added dates, the state update is left to the blueprint.
+        """
+        if self._schedule.add_dates:
+            super()._async_dates_loaded()
             return
-        LOGGER.debug("(%s) Calling update", self._attr_name)
-        await self._async_load_due_dates()
-        LOGGER.debug(
-            "(%s) Dates loaded, firing a chore_helper_loaded event",
-            self._attr_name,
-        )
         event_data = {
             "entity_id": self.entity_id,
             "due_dates": [],
@@ -2,33 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import date, timedelta
+from typing import Any
 
 from dateutil.relativedelta import relativedelta
-from homeassistant.config_entries import ConfigEntry
 
-from . import const
+from . import const, vectorized
 from .chore import Chore
+from .schedule import ChoreSchedule
 
 
-class DailyChore(Chore):
-    """Chore every n days."""
+class DailySchedule(ChoreSchedule):
+    """Schedule every n days."""
 
     __slots__ = ("_period",)
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
+    def __init__(self, options: Mapping[str, Any], name: str | None = None) -> None:
         """Read parameters specific for Daily Chore Frequency."""
-        super().__init__(config_entry)
-        config = config_entry.options
-        self._period = config.get(const.CONF_PERIOD)
+        super().__init__(options, name)
+        self._period = options.get(const.CONF_PERIOD)
 
     def _add_period_offset(self, start_date: date) -> date:
         return start_date + timedelta(days=self._period)
 
-    def _find_candidate_date(self, day1: date) -> date | None:
+    def _forecast_rule(self, schedule_start_date: date) -> tuple | None:
+        if not isinstance(self._period, int) or self._period < 1:
+            return None
+        return (vectorized.RULE_DAILY, self._period, schedule_start_date)
+
+    def _occurrence(self, due_date: date) -> int | None:
+        return (due_date - self.start_date).days // (self._period or 1)
+
+    def _find_candidate_date(self, day1: date, today: date) -> date | None:
         """Calculate possible date, for every-n-days and after-n-days frequency."""
         schedule_start_date = self._calculate_schedule_start_date()
-        day1 = self.calculate_day1(day1, schedule_start_date)
+        day1 = self.calculate_day1(day1, schedule_start_date, today)
 
         try:
             remainder = (day1 - schedule_start_date).days % self._period  # type: ignore
@@ -37,8 +46,14 @@ class DailyChore(Chore):
             offset = self._period - remainder
         except TypeError as error:
             raise ValueError(
-                f"({self._attr_name}) Please configure start_date and period "
+                f"({self.name}) Please configure start_date and period "
                 "for every-n-days or after-n-days chore frequency."
             ) from error
 
         return day1 + relativedelta(days=offset)
+
+
+class DailyChore(Chore):
+    """Chore every n days."""
+
+    schedule_class = DailySchedule
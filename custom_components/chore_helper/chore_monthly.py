@@ -3,18 +3,20 @@
 from __future__ import annotations
 
 from calendar import monthrange
+from collections.abc import Mapping
 from datetime import date, timedelta
+from typing import Any
 
 from dateutil.relativedelta import relativedelta
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import WEEKDAYS
 
-from . import const
+from . import const, vectorized
 from .chore import Chore
+from .schedule import ChoreSchedule
 
 
-class MonthlyChore(Chore):
-    """Chore every nth weekday of each month."""
+class MonthlySchedule(ChoreSchedule):
+    """Schedule every nth weekday of each month."""
 
     __slots__ = (
         "_day_of_month",
@@ -26,10 +28,10 @@ class MonthlyChore(Chore):
         "_due_date_offset",
     )
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
+    def __init__(self, options: Mapping[str, Any], name: str | None = None) -> None:
         """Read parameters specific for Monthly Chore Frequency."""
-        super().__init__(config_entry)
-        config = config_entry.options
+        super().__init__(options, name)
+        config = options
         day_of_month = config.get(const.CONF_DAY_OF_MONTH)
         self._day_of_month: int | None = (
             int(day_of_month) if day_of_month is not None and day_of_month > 0 else None
@@ -78,7 +80,7 @@ class MonthlyChore(Chore):
             week_number
             if week_number > 0
             else max(
-                MonthlyChore.viable_weeks_in_month(date_of_month, chore_day, False)
+                MonthlySchedule.viable_weeks_in_month(date_of_month, chore_day, False)
                 + week_number
                 + 1,
                 1,
@@ -99,7 +101,7 @@ class MonthlyChore(Chore):
             weekday_number
             if weekday_number > 0
             else max(
-                MonthlyChore.viable_weeks_in_month(date_of_month, chore_day, True)
+                MonthlySchedule.viable_weeks_in_month(date_of_month, chore_day, True)
                 + weekday_number
                 + 1,
                 1,
@@ -121,10 +123,11 @@ class MonthlyChore(Chore):
             + (actual_weekday_number - 1) * 7
         )
 
-    def _monthly_candidate(self, day1: date, start_date: date) -> tuple[date, int]:
+    def _monthly_candidate(self, day1: date, start_date: date) -> tuple[date, date]:
         """Calculate possible date, for monthly frequency.
 
-        2nd value is the month to consider the date in, even if different.
+        2nd value is the first day of the month to consider the date in, even if
+        different.
         """
         if self._chore_day is None:
             day_of_month = self._day_of_month
@@ -137,79 +140,139 @@ class MonthlyChore(Chore):
                 )
 
             if day1.day <= day_of_month:
-                return (date(day1.year, day1.month, day_of_month), day1.month)
+                return (
+                    date(day1.year, day1.month, day_of_month),
+                    date(day1.year, day1.month, 1),
+                )
             if day1.month == 12:
-                return (date(day1.year + 1, 1, day_of_month), 1)
-            return (date(day1.year, day1.month + 1, day_of_month), day1.month + 1)
+                return (
+                    date(day1.year + 1, 1, day_of_month),
+                    date(day1.year + 1, 1, 1),
+                )
+            return (
+                date(day1.year, day1.month + 1, day_of_month),
+                date(day1.year, day1.month + 1, 1),
+            )
         if self._monthly_force_week_numbers:
             if self._week_order_number is not None:
-                candidate_date = MonthlyChore.nth_week_date(
+                candidate_date = MonthlySchedule.nth_week_date(
                     self._week_order_number, day1, WEEKDAYS.index(self._chore_day)
                 )
                 # date is today or in the future -> we have the date
                 if candidate_date >= day1:
-                    return (candidate_date, day1.month)
+                    return (candidate_date, date(day1.year, day1.month, 1))
         else:
             if self._weekday_order_number is not None:
-                candidate_date = MonthlyChore.nth_weekday_date(
+                candidate_date = MonthlySchedule.nth_weekday_date(
                     self._weekday_order_number,
                     day1,
                     WEEKDAYS.index(self._chore_day),
                 )
                 # date is today or in the future -> we have the date
                 if candidate_date >= day1:
-                    return (candidate_date, day1.month)
+                    return (candidate_date, date(day1.year, day1.month, 1))
         if day1.month == 12:
             next_chore_month = date(day1.year + 1, 1, 1)
         else:
             next_chore_month = date(day1.year, day1.month + 1, 1)
         if self._monthly_force_week_numbers:
             return (
-                MonthlyChore.nth_week_date(
+                MonthlySchedule.nth_week_date(
                     self._week_order_number,
                     next_chore_month,
                     WEEKDAYS.index(self._chore_day),
                 ),
-                next_chore_month.month,
+                next_chore_month,
             )
         return (
-            MonthlyChore.nth_weekday_date(
+            MonthlySchedule.nth_weekday_date(
                 self._weekday_order_number,
                 next_chore_month,
                 WEEKDAYS.index(self._chore_day),
             ),
-            next_chore_month.month,
+            next_chore_month,
         )
 
     def _add_period_offset(self, start_date: date) -> date:
         return start_date + relativedelta(months=self._period)
 
-    def _find_candidate_date(self, day1: date) -> date | None:
+    def _forecast_rule(self, schedule_start_date: date) -> tuple | None:
+        """Return the rule for the days of the month that are valid in all months."""
+        period = 1 if self._period is None else self._period
+        if not isinstance(period, int) or period < 1 or self._due_date_offset:
+            return None
+        day_of_month = weekday = order = None
+        if self._chore_day is None:
+            day_of_month = self._day_of_month or schedule_start_date.day
+            if day_of_month > 28:
+                return None
+        else:
+            # The 1st to 4th weekday, always within the month
+            order = self._weekday_order_number
+            if self._monthly_force_week_numbers or order is None or not 0 < order < 5:
+                return None
+            weekday = WEEKDAYS.index(self._chore_day)
+        # No date in the month of the last completion, as in _find_candidate_date
+        skipped_month = (
+            None
+            if self.last_completed is None
+            else (self.last_completed.year - 1970) * 12 + self.last_completed.month - 1
+        )
+        return (
+            vectorized.RULE_MONTHLY,
+            period,
+            (schedule_start_date.year - 1970) * 12 + schedule_start_date.month - 1,
+            day_of_month,
+            weekday,
+            order,
+            skipped_month,
+        )
+
+    def _occurrence(self, due_date: date) -> int | None:
+        # The month the date was calculated in, before the due date offset
+        day = due_date - timedelta(days=self._due_date_offset or 0)
+        months = (day.year - self.start_date.year) * 12 + day.month
+        return (months - self.start_date.month) // (self._period or 1)
+
+    def _find_candidate_date(self, day1: date, today: date) -> date | None:
+        """Calculate possible date, for monthly frequency."""
         schedule_start_date = self._calculate_schedule_start_date()
-        day1 = self.calculate_day1(day1, schedule_start_date)
-        if self.last_completed is not None and self.last_completed.month == day1.month:
+        day1 = self.calculate_day1(day1, schedule_start_date, today)
+        if self.last_completed is not None and (
+            self.last_completed.year,
+            self.last_completed.month,
+        ) == (day1.year, day1.month):
             if day1.month == 12:
                 day1 = date(day1.year + 1, 1, 1)
             else:
                 day1 = date(day1.year, day1.month + 1, 1)
         if self._period is None or self._period == 1:
             return self._monthly_candidate(day1, schedule_start_date)[0]
-        result = self._monthly_candidate(day1, schedule_start_date)
-
-        candidate_date = result[0]
-        candidate_month = result[1]
-        while (candidate_month - schedule_start_date.month) % self._period != 0:
-            remainder = (
-                candidate_date.month - schedule_start_date.month
-            ) % self._period
-            result = self._monthly_candidate(
-                candidate_date + relativedelta(months=remainder, day=1),
+        candidate_date, candidate_month = self._monthly_candidate(
+            day1, schedule_start_date
+        )
+        # Move forward to the next month that is a whole number of periods
+        # from the schedule start
+        while (
+            remainder := (
+                (candidate_month.year - schedule_start_date.year) * 12
+                + candidate_month.month
+                - schedule_start_date.month
+            )
+            % self._period
+        ) != 0:
+            candidate_date, candidate_month = self._monthly_candidate(
+                candidate_month + relativedelta(months=self._period - remainder),
                 schedule_start_date,
             )
-            candidate_date = result[0]
-            candidate_month = result[1]
 
         if self._due_date_offset is not None:
             candidate_date += timedelta(days=self._due_date_offset)
 
         return candidate_date
+
+
+class MonthlyChore(Chore):
+    """Chore every nth weekday of each month."""
+
+    schedule_class = MonthlySchedule
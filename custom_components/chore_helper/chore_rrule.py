@@ -0,0 +1,118 @@
+"""Entity for a chore scheduled by a recurrence rule (RFC 5545 RRULE)."""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Mapping
+from datetime import date, datetime, time, timedelta
+from time import monotonic
+from typing import Any
+
+from dateutil.rrule import rruleset, rrulestr
+
+from . import const
+from .chore import Chore
+from .schedule import ChoreSchedule
+
+
+def parse_rrule(text: str, start_date: date) -> rruleset:
+    """Compile the recurrence rule, starting from the start date."""
+    return rrulestr(
+        text.strip(),
+        dtstart=datetime.combine(start_date, time()),
+        cache=True,
+        forceset=True,
+    )
+
+
+class RRuleSchedule(ChoreSchedule):
+    """Schedule by a recurrence rule, with the added and removed dates in the set."""
+
+    __slots__ = "_rrule", "_rules", "_rules_key"
+
+    def __init__(self, options: Mapping[str, Any], name: str | None = None) -> None:
+        """Read the recurrence rule."""
+        super().__init__(options, name)
+        self._rrule: str | None = options.get(const.CONF_RRULE)
+        # The months are part of the rule
+        self.first_month = 1
+        self.last_month = 12
+        self._rules: rruleset | None = None
+        self._rules_key: tuple | None = None
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Leave out the compiled rule, which has a lock and is compiled on use."""
+        _, state = super().__getstate__()
+        return None, {**state, "_rules": None, "_rules_key": None}
+
+    def _compiled(self) -> rruleset | None:
+        """Return the compiled rule set, compiled again after the overrides change."""
+        if self._rrule is None or self.start_date is None:
+            return None
+        key = (self.add_dates, self.remove_dates)
+        if self._rules is None or self._rules_key != key:
+            rules = parse_rrule(self._rrule, self.start_date)
+            for added in super()._added_dates():
+                rules.rdate(datetime.combine(added, time()))
+            for removed in (self.remove_dates or "").split():
+                rules.exdate(datetime.strptime(removed, "%Y-%m-%d"))
+            self._rules = rules
+            self._rules_key = key
+        return self._rules
+
+    def _added_dates(self) -> list[date]:
+        """Return no separately added dates, they are in the rule set."""
+        return []
+
+    def _apply_overrides(self, candidate: date) -> date | None:
+        """Apply the offsets and blackouts, the removed dates are excluded already."""
+        return self._move(candidate)
+
+    def _occurrence(self, due_date: date) -> int | None:
+        if (rules := self._compiled()) is None:
+            return None
+        # The occurrences up to and including the due date, the first one is 0
+        occurrences = rules.between(
+            datetime.combine(self.start_date, time()),
+            datetime.combine(due_date, time()),
+            inc=True,
+        )
+        return max(len(occurrences) - 1, 0)
+
+    def _find_candidate_date(self, day1: date, today: date) -> date | None:
+        """Return the first date of the rule from day1."""
+        if (rules := self._compiled()) is None:
+            return None
+        day1 = self.calculate_day1(day1, self.start_date, today)
+        occurrence = rules.after(datetime.combine(day1, time()), inc=True)
+        return None if occurrence is None else occurrence.date()
+
+    def dates_between(
+        self, start: date, end: date, today: date, deadline: float | None = None
+    ) -> Generator[date, None, None]:
+        """Generate the sorted due dates within start and end (inclusive).
+
+        The rule set expands the whole window, or until the deadline, at once.
+        """
+        if (rules := self._compiled()) is None:
+            return
+        margin = timedelta(days=const.MAX_DATE_MOVE)
+        first = self.calculate_day1(
+            max(self.calculate_start_date(today), start - margin),
+            self.start_date,
+            today,
+        )
+        last = datetime.combine(end + margin, time())
+        due_dates = set()
+        for occurrence in rules.xafter(datetime.combine(first, time()), inc=True):
+            if occurrence > last or (deadline is not None and monotonic() > deadline):
+                break
+            due_date = self._move(occurrence.date())
+            if due_date is not None and start <= due_date <= end:
+                due_dates.add(due_date)
+        yield from sorted(due_dates)
+
+
+class RRuleChore(Chore):
+    """Chore scheduled by a recurrence rule."""
+
+    schedule_class = RRuleSchedule
@@ -2,40 +2,58 @@
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Mapping
+from datetime import date, timedelta
+from typing import Any
 
 from dateutil.relativedelta import relativedelta
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import WEEKDAYS
 
-from . import const
+from . import const, vectorized
 from .chore import Chore
+from .schedule import ChoreSchedule
 
 
-class WeeklyChore(Chore):
-    """Chore every n weeks, odd weeks or even weeks."""
+class WeeklySchedule(ChoreSchedule):
+    """Schedule every n weeks, odd weeks or even weeks."""
 
     __slots__ = "_chore_day", "_first_week", "_period"
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
+    def __init__(self, options: Mapping[str, Any], name: str | None = None) -> None:
         """Read parameters specific for Weekly Chore Frequency."""
-        super().__init__(config_entry)
-        config = config_entry.options
-        self._chore_day = config.get(const.CONF_CHORE_DAY, None)
-        self._period: int
-        self._first_week: int
-        config.get(const.CONF_FREQUENCY)
-        self._period = config.get(const.CONF_PERIOD, 1)
-        self._first_week = config.get(const.CONF_FIRST_WEEK, 1)
+        super().__init__(options, name)
+        self._chore_day = options.get(const.CONF_CHORE_DAY, None)
+        self._period: int = options.get(const.CONF_PERIOD, 1)
+        self._first_week: int = options.get(const.CONF_FIRST_WEEK, 1)
 
     def _add_period_offset(self, start_date: date) -> date:
         return start_date + relativedelta(weeks=self._period)
 
-    def _find_candidate_date(self, day1: date) -> date | None:
+    def _forecast_rule(self, schedule_start_date: date) -> tuple | None:
+        if not isinstance(self._period, int) or self._period < 1:
+            return None
+        return (
+            vectorized.RULE_WEEKLY,
+            self._period,
+            schedule_start_date.weekday()
+            if self._chore_day is None
+            else WEEKDAYS.index(self._chore_day),
+            schedule_start_date.isocalendar()[1],
+        )
+
+    def _occurrence(self, due_date: date) -> int | None:
+        # Weeks between the mondays of the start date and the due date
+        weeks = (
+            (due_date - timedelta(days=due_date.weekday()))
+            - (self.start_date - timedelta(days=self.start_date.weekday()))
+        ).days // 7
+        return weeks // (self._period or 1)
+
+    def _find_candidate_date(self, day1: date, today: date) -> date | None:
         """Calculate possible date, for weekly frequency."""
         start_date = self._calculate_schedule_start_date()
         start_week = start_date.isocalendar()[1]
-        day1 = self.calculate_day1(day1, start_date)
+        day1 = self.calculate_day1(day1, start_date, today)
         week = day1.isocalendar()[1]
         weekday = day1.weekday()
         offset = -1
@@ -56,3 +74,9 @@ class WeeklyChore(Chore):
                 break
             iterate_by_week += 7
         return day1 + relativedelta(days=offset)
+
+
+class WeeklyChore(Chore):
+    """Chore every n weeks, odd weeks or even weeks."""
+
+    schedule_class = WeeklySchedule
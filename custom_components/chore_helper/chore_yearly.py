@@ -2,38 +2,59 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import date, datetime
+from typing import Any
 
 from dateutil.relativedelta import relativedelta
-from homeassistant.config_entries import ConfigEntry
 
-from . import const
+from . import const, vectorized
 from .chore import Chore
+from .schedule import ChoreSchedule
 
 
-class YearlyChore(Chore):
-    """Chore every year."""
+class YearlySchedule(ChoreSchedule):
+    """Schedule every year."""
 
     __slots__ = (
         "_period",
         "_date",
     )
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
+    def __init__(self, options: Mapping[str, Any], name: str | None = None) -> None:
         """Read parameters specific for Yearly Chore Frequency."""
-        super().__init__(config_entry)
-        config = config_entry.options
-        self._period = config.get(const.CONF_PERIOD, 1)
-        due_date = config.get(const.CONF_DATE, None)
+        super().__init__(options, name)
+        self._period = options.get(const.CONF_PERIOD, 1)
+        due_date = options.get(const.CONF_DATE, None)
         self._date = due_date if due_date is not None and due_date != "0" else None
 
     def _add_period_offset(self, start_date: date) -> date:
         return start_date + relativedelta(years=self._period)
 
-    def _find_candidate_date(self, day1: date) -> date | None:
+    def _forecast_rule(self, schedule_start_date: date) -> tuple | None:
+        if not isinstance(self._period, int) or self._period < 1:
+            return None
+        if self._date is None or self._date == "":
+            day = schedule_start_date
+        else:
+            day = datetime.strptime(self._date, "%m/%d")
+        if (day.month, day.day) == (2, 29):
+            return None
+        return (
+            vectorized.RULE_YEARLY,
+            self._period,
+            day.month,
+            day.day,
+            schedule_start_date.year,
+        )
+
+    def _occurrence(self, due_date: date) -> int | None:
+        return (due_date.year - self.start_date.year) // (self._period or 1)
+
+    def _find_candidate_date(self, day1: date, today: date) -> date | None:
         """Calculate possible date, for yearly frequency."""
         start_date = self._calculate_schedule_start_date()
-        day1 = self.calculate_day1(day1, start_date)
+        day1 = self.calculate_day1(day1, start_date, today)
         conf_date = self._date
         if conf_date is None or conf_date == "":
             conf_date = start_date
@@ -52,3 +73,9 @@ class YearlyChore(Chore):
                     candidate_date.day,
                 )
         return candidate_date
+
+
+class YearlyChore(Chore):
+    """Chore every year."""
+
+    schedule_class = YearlySchedule
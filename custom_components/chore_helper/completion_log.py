@@ -0,0 +1,163 @@
+"""Log of the chore completions, kept in the Home Assistant storage."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from datetime import datetime, timedelta
+import itertools
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from . import const
+from .const import LOGGER
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{const.DOMAIN}.completions"
+ARCHIVE_STORAGE_KEY = f"{const.DOMAIN}.completions_archive"
+SAVE_DELAY = 30  # seconds
+COMPACT_INTERVAL = timedelta(hours=1)
+RETENTION = timedelta(days=365)
+MAX_RECORDS = 100000
+# The recent records written with every save, before they are archived
+SEGMENT_RECORDS = 1000
+
+# Records are stored as lists to keep the file small
+RECORD_CHORE = 0
+RECORD_TIMESTAMP = 1
+RECORD_USER = 2
+RECORD_LATENESS = 3
+
+
+class CompletionLog:
+    """Append-only log of completions, compacted to the retention limits.
+
+    The recent records are saved separately from the archived ones, so that a
+    save after a completion writes at most SEGMENT_RECORDS records. The archive
+    is only written when the recent records are moved to it, or compacted.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_store",
+        "_archive_store",
+        "_records",
+        "_archive",
+        "_unsub_compact",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the log, call async_load before use."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._archive_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, ARCHIVE_STORAGE_KEY
+        )
+        self._records: list[list] = []
+        self._archive: list[list] = []
+        self._unsub_compact = None
+
+    async def async_load(self) -> None:
+        """Load the stored records and start the periodic compaction."""
+        if (data := await self._archive_store.async_load()) is not None:
+            self._archive = data.get("records", [])
+        if (data := await self._store.async_load()) is not None:
+            self._records = data.get("records", [])
+        if len(self._records) >= SEGMENT_RECORDS:
+            self._rotate()
+        self.compact()
+        self._unsub_compact = async_track_time_interval(
+            self._hass, self._async_compact, COMPACT_INTERVAL
+        )
+        self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self._archive) + len(self._records)
+
+    @callback
+    def append(
+        self,
+        chore_id: str,
+        completed: datetime,
+        user_id: str | None = None,
+        lateness: int | None = None,
+    ) -> None:
+        """Log a completion, lateness in days after the due date."""
+        self._records.append([chore_id, int(completed.timestamp()), user_id, lateness])
+        if len(self._records) >= SEGMENT_RECORDS:
+            self._rotate()
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _rotate(self) -> None:
+        """Move the recent records to the archive."""
+        self._archive.extend(self._records)
+        self._records = []
+        # Amortized, the records are only copied when the log grew by a quarter
+        if len(self._archive) > MAX_RECORDS * 5 // 4:
+            self.compact()
+        self._archive_store.async_delay_save(self._archive_to_save, SAVE_DELAY)
+
+    def records(
+        self, chore_id: str | None = None
+    ) -> Generator[tuple[str, datetime, str | None, int | None], None, None]:
+        """Generate the logged completions, of all chores or one chore."""
+        for record in itertools.chain(self._archive, self._records):
+            if chore_id is None or record[RECORD_CHORE] == chore_id:
+                yield (
+                    record[RECORD_CHORE],
+                    dt_util.utc_from_timestamp(record[RECORD_TIMESTAMP]),
+                    record[RECORD_USER],
+                    record[RECORD_LATENESS],
+                )
+
+    @callback
+    def compact(self) -> None:
+        """Drop the records past the retention period or the maximum count."""
+        cutoff = int((dt_util.utcnow() - RETENTION).timestamp())
+        archive = [r for r in self._archive if r[RECORD_TIMESTAMP] >= cutoff]
+        records = [r for r in self._records if r[RECORD_TIMESTAMP] >= cutoff]
+        # The oldest records go first, the archived ones
+        if (excess := len(archive) + len(records) - MAX_RECORDS) > 0:
+            records = records[max(excess - len(archive), 0) :]
+            archive = archive[excess:]
+        if len(archive) + len(records) == len(self):
+            return
+        LOGGER.debug(
+            "Compacted the completion log from %d to %d records",
+            len(self),
+            len(archive) + len(records),
+        )
+        if len(archive) != len(self._archive):
+            self._archive = archive
+            self._archive_store.async_delay_save(self._archive_to_save, SAVE_DELAY)
+        if len(records) != len(self._records):
+            self._records = records
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _async_compact(self, _: datetime) -> None:
+        """Compact the log periodically."""
+        self.compact()
+
+    @callback
+    def _async_stop(self, _: Event) -> None:
+        """Stop the periodic compaction, pending saves are written on stop."""
+        if self._unsub_compact is not None:
+            self._unsub_compact()
+            self._unsub_compact = None
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the recent records to store, a copy that is not appended to."""
+        return {"records": list(self._records)}
+
+    @callback
+    def _archive_to_save(self) -> dict[str, Any]:
+        """Return the archived records to store, a copy that is not appended to."""
+        return {"records": list(self._archive)}
@@ -5,12 +5,15 @@ from __future__ import annotations
 # import uuid
 from collections.abc import Mapping
 from typing import Any, cast
+from weakref import WeakValueDictionary
 
 import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_HIDDEN, CONF_NAME
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.schema_config_entry_flow import (
+    SchemaCommonFlowHandler,
     SchemaConfigFlowHandler,
     SchemaFlowError,
     SchemaFlowFormStep,
@@ -49,6 +52,12 @@ async def _validate_config(
 
     if const.CONF_CHORE_DAY in data and data[const.CONF_CHORE_DAY] == "0":
         data[const.CONF_CHORE_DAY] = None
+
+    if const.CONF_RRULE in data:
+        try:
+            data[const.CONF_RRULE] = helpers.rrule_text(data[const.CONF_RRULE])
+        except vol.Invalid as exc:
+            raise SchemaFlowError("rrule") from exc
     return data
 
 
@@ -110,6 +119,17 @@ def general_schema_definition(
                 step=1,
             )
         ),
+        optional(const.CONF_GROUP, handler.options): selector.TextSelector(),
+        optional(const.CONF_TIME, handler.options): selector.TimeSelector(),
+        optional(const.CONF_ASSIGNEES, handler.options): selector.TextSelector(
+            selector.TextSelectorConfig(multiple=True)
+        ),
+        optional(const.CONF_ROTATION_OFFSET, handler.options): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, max=100, mode=selector.NumberSelectorMode.BOX, step=1
+            )
+        ),
+        **blackout_schema_definition(handler),
         optional(ATTR_HIDDEN, handler.options, False): bool,
         optional(const.CONF_MANUAL, handler.options, False): bool,
         optional(
@@ -122,6 +142,29 @@ def general_schema_definition(
     return schema
 
 
+def blackout_schema_definition(
+    handler: SchemaConfigFlowHandler | SchemaOptionsFlowHandler,
+) -> Mapping[str, Any]:
+    """Create the blackout schema, if blackout calendars are configured."""
+    calendars = handler.parent_handler.hass.data.get(const.DOMAIN, {}).get(
+        const.BLACKOUTS
+    )
+    if not calendars:
+        return {}
+    return {
+        optional(const.CONF_BLACKOUTS, handler.options): selector.SelectSelector(
+            selector.SelectSelectorConfig(options=sorted(calendars), multiple=True)
+        ),
+        optional(
+            const.CONF_BLACKOUT_POLICY,
+            handler.options,
+            const.DEFAULT_BLACKOUT_POLICY,
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(options=const.BLACKOUT_POLICY_OPTIONS)
+        ),
+    }
+
+
 async def general_config_schema(
     handler: SchemaConfigFlowHandler | SchemaOptionsFlowHandler,
 ) -> vol.Schema:
@@ -139,7 +182,7 @@ async def general_options_schema(
 
 
 async def detail_config_schema(
-    handler: SchemaConfigFlowHandler | SchemaOptionsFlowHandler,
+    handler: SchemaCommonFlowHandler,
 ) -> vol.Schema:
     """Generate options schema."""
     options_schema: dict[vol.Optional | vol.Required, Any] = {}
@@ -178,6 +221,11 @@ async def detail_config_schema(
                 selector.TextSelector()
             )
 
+        if frequency in const.RRULE_FREQUENCY:
+            options_schema[required(const.CONF_RRULE, handler.options)] = (
+                selector.TextSelector()
+            )
+
         if frequency in const.MONTHLY_FREQUENCY:
             options_schema[optional(const.CONF_DAY_OF_MONTH, handler.options)] = (
                 selector.NumberSelector(
@@ -236,7 +284,7 @@ async def detail_config_schema(
                 )
             )
 
-        if frequency not in const.YEARLY_FREQUENCY:
+        if frequency not in const.YEARLY_FREQUENCY + const.RRULE_FREQUENCY:
             options_schema[
                 optional(
                     const.CONF_FIRST_MONTH, handler.options, const.DEFAULT_FIRST_MONTH
@@ -259,21 +307,44 @@ async def detail_config_schema(
     return vol.Schema(options_schema)
 
 
+async def _register_preview_flow(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Let the preview of the detail step find the options entered before it."""
+    flow = handler.parent_handler
+    flow.hass.data.setdefault(const.DOMAIN, {}).setdefault(
+        const.PREVIEW_FLOWS, WeakValueDictionary()
+    )[flow.flow_id] = handler
+    return user_input
+
+
 async def choose_details_step(_: dict[str, Any]) -> str:
     """Return next step_id for options flow."""
     return "detail"
 
 
 CONFIG_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
-    "user": SchemaFlowFormStep(general_config_schema, next_step=choose_details_step),
+    "user": SchemaFlowFormStep(
+        general_config_schema,
+        validate_user_input=_register_preview_flow,
+        next_step=choose_details_step,
+    ),
     "detail": SchemaFlowFormStep(
-        detail_config_schema, validate_user_input=_validate_config
+        detail_config_schema,
+        validate_user_input=_validate_config,
+        preview=const.DOMAIN,
     ),
 }
 OPTIONS_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
-    "init": SchemaFlowFormStep(general_options_schema, next_step=choose_details_step),
+    "init": SchemaFlowFormStep(
+        general_options_schema,
+        validate_user_input=_register_preview_flow,
+        next_step=choose_details_step,
+    ),
     "detail": SchemaFlowFormStep(
-        detail_config_schema, validate_user_input=_validate_config
+        detail_config_schema,
+        validate_user_input=_validate_config,
+        preview=const.DOMAIN,
     ),
 }
 
@@ -286,6 +357,12 @@ class ChoreHelperConfigFlowHandler(SchemaConfigFlowHandler, domain=const.DOMAIN)
     options_flow = OPTIONS_FLOW
     VERSION = const.CONFIG_VERSION
 
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry: ConfigEntry) -> bool:
+        """Return options flow support, chore lists are changed by importing."""
+        return const.CONF_CHORES not in config_entry.options
+
     @callback
     def async_config_entry_title(self, options: Mapping[str, Any]) -> str:
         """Return config entry title.
@@ -294,3 +371,11 @@ class ChoreHelperConfigFlowHandler(SchemaConfigFlowHandler, domain=const.DOMAIN)
         input from the config flow steps.
         """
         return cast(str, options["name"]) if "name" in options else ""
+
+    @staticmethod
+    async def async_setup_preview(hass: HomeAssistant) -> None:
+        """Set up the preview of the next due dates."""
+        # pylint: disable=import-outside-toplevel
+        from .preview import async_setup_preview
+
+        async_setup_preview(hass)
@@ -1,5 +1,6 @@
 """Constants for the Chore Helper integration."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 from homeassistant.helpers import selector
@@ -10,6 +11,19 @@ DOMAIN = "chore_helper"
 CALENDAR_NAME = "Chores"
 SENSOR_PLATFORM = "sensor"
 CALENDAR_PLATFORM = "calendar"
+BULK_RECOMPUTE = "bulk_recompute"
+CHORE_INDEX = "index"
+SCOPED_CALENDARS = "scoped_calendars"
+CALENDAR_ADD_ENTITIES = "calendar_add_entities"
+PREVIEW_FLOWS = "preview_flows"
+COMPLETION_LOG = "completion_log"
+STATISTICS = "statistics"
+OVERRIDES = "overrides"
+DUE_TIMERS = "due_timers"
+BLACKOUTS = "blackouts"
+SUMMARY = "summary"
+SIGNAL_CHORE_CHANGED = f"{DOMAIN}_chore_changed"
+SIGNAL_SUMMARY_CHANGED = f"{DOMAIN}_summary_changed"
 ATTRIBUTION = "Data is provided by chore_helper"
 CONFIG_VERSION = 6
 
@@ -22,6 +36,15 @@ ATTR_OVERDUE_DAYS = "overdue_days"
 ATTR_OFFSET_DATES = "offset_dates"
 ATTR_ADD_DATES = "add_dates"
 ATTR_REMOVE_DATES = "remove_dates"
+ATTR_ON_TIME_RATE = "on_time_rate"
+ATTR_AVERAGE_LATENESS = "average_lateness"
+ATTR_CURRENT_STREAK = "current_streak"
+ATTR_BEST_STREAK = "best_streak"
+ATTR_RECENT_COMPLETIONS = "completions_30_days"
+ATTR_ASSIGNEE = "assignee"
+ATTR_OVERRIDES = "overrides"
+# Not in homeassistant.const of all supported versions
+ATTR_LABEL_ID = "label_id"
 
 BINARY_SENSOR_DEVICE_CLASS = "connectivity"
 DEVICE_CLASS = "chore_helper__schedule"
@@ -50,7 +73,20 @@ CONF_PERIOD = "period"
 CONF_FIRST_WEEK = "first_week"
 CONF_START_DATE = "start_date"
 CONF_SENSORS = "sensors"
+CONF_CHORE_LIST = "chore_list"
+CONF_CHORES = "chores"
 CONF_DATE_FORMAT = "date_format"
+CONF_BULK_RECOMPUTE_WORKERS = "bulk_recompute_workers"
+CONF_GROUP = "group"
+CONF_BLACKOUTS = "blackouts"
+CONF_BLACKOUT_POLICY = "blackout_policy"
+CONF_DATES = "dates"
+CONF_ASSIGNEES = "assignees"
+CONF_ROTATION_OFFSET = "rotation_offset"
+CONF_RRULE = "rrule"
+CONF_START = "start"
+CONF_END = "end"
+CONF_COUNT = "count"
 
 DEFAULT_NAME = DOMAIN
 DEFAULT_FIRST_MONTH = "jan"
@@ -61,6 +97,17 @@ DEFAULT_FIRST_WEEK = 1
 DEFAULT_DATE_FORMAT = "%b-%d-%Y"
 DEFAULT_FORECAST_DATES = 10
 DEFAULT_SHOW_OVERDUE_TODAY = False
+DUE_TIME_EVENT_DURATION = timedelta(hours=1)
+MAX_DATE_OFFSET = 31
+MAX_BLACKOUT_SHIFT = 14
+# The furthest an offset and a blackout shift can move a calculated date
+MAX_DATE_MOVE = MAX_DATE_OFFSET + MAX_BLACKOUT_SHIFT
+
+# Limits of the get_schedule service
+DEFAULT_SCHEDULE_COUNT = 5
+MAX_SCHEDULE_COUNT = 100
+MAX_SCHEDULE_DAYS = 3660
+MAX_SCHEDULE_DATES = 1000
 
 DEFAULT_ICON_NORMAL = "mdi:broom"
 DEFAULT_ICON_TODAY = "mdi:bell"
@@ -71,6 +118,16 @@ ICON = DEFAULT_ICON_NORMAL
 STATE_TODAY = "today"
 STATE_TOMORROW = "tomorrow"
 
+SCOPE_AREA = "area"
+SCOPE_LABEL = "label"
+SCOPE_GROUP = "group"
+SCOPE_ASSIGNEE = "assignee"
+
+BLACKOUT_SKIP = "skip"
+BLACKOUT_SHIFT_FORWARD = "shift_forward"
+BLACKOUT_SHIFT_BACK = "shift_back"
+DEFAULT_BLACKOUT_POLICY = BLACKOUT_SKIP
+
 FREQUENCY_OPTIONS = [
     selector.SelectOptionDict(value="every-n-days", label="Every [x] days"),
     selector.SelectOptionDict(value="every-n-weeks", label="Every [x] weeks"),
@@ -80,13 +137,25 @@ FREQUENCY_OPTIONS = [
     selector.SelectOptionDict(value="after-n-weeks", label="After [x] weeks"),
     selector.SelectOptionDict(value="after-n-months", label="After [x] months"),
     selector.SelectOptionDict(value="after-n-years", label="After [x] years"),
+    selector.SelectOptionDict(value="rrule", label="Recurrence rule (RRULE)"),
     selector.SelectOptionDict(value="blank", label="Manual"),
 ]
 
+BLACKOUT_POLICY_OPTIONS = [
+    selector.SelectOptionDict(value=BLACKOUT_SKIP, label="Skip the due date"),
+    selector.SelectOptionDict(
+        value=BLACKOUT_SHIFT_FORWARD, label="Move to the next available day"
+    ),
+    selector.SelectOptionDict(
+        value=BLACKOUT_SHIFT_BACK, label="Move to the previous available day"
+    ),
+]
+
 DAILY_FREQUENCY = ["every-n-days", "after-n-days"]
 WEEKLY_FREQUENCY = ["every-n-weeks", "after-n-weeks"]
 MONTHLY_FREQUENCY = ["every-n-months", "after-n-months"]
 YEARLY_FREQUENCY = ["every-n-years", "after-n-years"]
+RRULE_FREQUENCY = ["rrule"]
 BLANK_FREQUENCY = ["blank"]
 
 WEEKDAY_OPTIONS = [
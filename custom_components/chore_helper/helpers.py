@@ -9,6 +9,7 @@ from typing import Any
 import homeassistant.util.dt as dt_util
 import voluptuous as vol
 from dateutil.parser import ParserError, parse
+from dateutil.rrule import rrulestr
 
 
 def now() -> datetime:
@@ -67,3 +68,12 @@ def month_day_text(value: Any) -> str:
         return datetime.strptime(value, "%m/%d").date().strftime("%m/%d")
     except ValueError as error:
         raise vol.Invalid(f"Invalid date: {value}") from error
+
+
+def rrule_text(value: Any) -> str:
+    """Validate a recurrence rule (RFC 5545), e.g. FREQ=MONTHLY;BYDAY=-1FR."""
+    try:
+        rrulestr(str(value).strip(), dtstart=datetime(2000, 1, 1), forceset=True)
+    except (ValueError, TypeError) as error:
+        raise vol.Invalid(f"Invalid recurrence rule: {value}") from error
+    return str(value).strip()
@@ -0,0 +1,137 @@
+"""iCalendar (.ics) feed of the chore calendars, for external calendar clients."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from datetime import date, datetime, timedelta
+from http import HTTPStatus
+
+from aiohttp import web
+from homeassistant.components.calendar import CalendarEvent
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from . import const, helpers
+from .calendar import EntitiesCalendarData
+
+PAST_DAYS = 30
+FUTURE_DAYS = 365
+SCOPES = (
+    const.SCOPE_AREA,
+    const.SCOPE_LABEL,
+    const.SCOPE_GROUP,
+    const.SCOPE_ASSIGNEE,
+)
+
+
+def _escape(text: str) -> str:
+    """Escape a text value."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line to lines of at most 75 octets."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    lines = []
+    while encoded:
+        size = 75 if not lines else 74  # Continuation lines start with a space
+        while size > 0 and encoded[size : size + 1] and encoded[size] & 0xC0 == 0x80:
+            size -= 1  # Don't split a UTF-8 character
+        lines.append(encoded[:size].decode())
+        encoded = encoded[size:]
+    return "\r\n ".join(lines) + "\r\n"
+
+
+def _time_property(name: str, value: date | datetime) -> str:
+    """Return a DTSTART or DTEND property, a date or a UTC time."""
+    if isinstance(value, datetime):
+        return f"{name}:{dt_util.as_utc(value).strftime('%Y%m%dT%H%M%SZ')}"
+    return f"{name};VALUE=DATE:{value.strftime('%Y%m%d')}"
+
+
+def event_lines(event: CalendarEvent, stamp: str) -> Generator[str, None, None]:
+    """Generate the folded content lines of the event."""
+    yield "BEGIN:VEVENT\r\n"
+    yield _fold(f"UID:{event.uid}@{const.DOMAIN}")
+    yield f"DTSTAMP:{stamp}\r\n"
+    yield _time_property("DTSTART", event.start) + "\r\n"
+    yield _time_property("DTEND", event.end) + "\r\n"
+    yield _fold(f"SUMMARY:{_escape(event.summary)}")
+    if event.description:
+        yield _fold(f"DESCRIPTION:{_escape(event.description)}")
+    yield "END:VEVENT\r\n"
+
+
+class ChoreCalendarView(HomeAssistantView):
+    """Serve a chore calendar as an iCalendar feed.
+
+    The calendar of all chores, or of a scope with e.g. ?area=kitchen. Clients
+    polling with the ETag of an unchanged calendar get 304 Not Modified.
+    """
+
+    url = f"/api/{const.DOMAIN}/calendar.ics"
+    name = f"api:{const.DOMAIN}:calendar"
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream the events of the calendar."""
+        hass: HomeAssistant = request.app["hass"]
+        domain_data = hass.data.get(const.DOMAIN, {})
+        scopes = [
+            (kind, request.query[kind]) for kind in SCOPES if kind in request.query
+        ]
+        if len(scopes) > 1:
+            return self.json_message(
+                "Only one scope can be requested", HTTPStatus.BAD_REQUEST
+            )
+        data: EntitiesCalendarData | None
+        if scopes:
+            data = domain_data.get(const.SCOPED_CALENDARS, {}).get(scopes[0])
+            if data is None:
+                return self.json_message("Unknown calendar", HTTPStatus.NOT_FOUND)
+            calendar_name = f"{const.CALENDAR_NAME} {scopes[0][1]}"
+        else:
+            data = domain_data.get(const.CALENDAR_PLATFORM)
+            calendar_name = const.CALENDAR_NAME
+
+        # The events depend on the chores and their dates, and on today
+        today = helpers.now().date()
+        etag = f'W/"{0 if data is None else data.revision}-{today.toordinal()}"'
+        if etag in request.headers.get("If-None-Match", ""):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/calendar; charset=utf-8",
+                "Content-Disposition": 'inline; filename="chores.ics"',
+                "ETag": etag,
+                "Cache-Control": "no-cache",
+            }
+        )
+        await response.prepare(request)
+        await response.write(
+            (
+                "BEGIN:VCALENDAR\r\n"
+                "VERSION:2.0\r\n"
+                f"PRODID:-//{const.DOMAIN}//Chore Helper//EN\r\n"
+                + _fold(f"X-WR-CALNAME:{_escape(calendar_name)}")
+            ).encode()
+        )
+        if data is not None:
+            start = dt_util.start_of_local_day(today - timedelta(days=PAST_DAYS))
+            events = await data.async_get_events(
+                hass, start, start + timedelta(days=PAST_DAYS + FUTURE_DAYS)
+            )
+            stamp = dt_util.utcnow().strftime("%Y%m%dT%H%M%SZ")
+            for event in events:
+                await response.write("".join(event_lines(event, stamp)).encode())
+        await response.write(b"END:VCALENDAR\r\n")
+        await response.write_eof()
+        return response
@@ -0,0 +1,556 @@
+"""Import chore definitions from YAML or a file into config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator, Iterable, Mapping
+from datetime import date, datetime, time
+import json
+from pathlib import Path
+from typing import Any
+
+import homeassistant.helpers.config_validation as cv
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
+from homeassistant.const import (
+    ATTR_HIDDEN,
+    CONF_ENTITIES,
+    CONF_NAME,
+    CONF_UNIQUE_ID,
+    WEEKDAYS,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+import homeassistant.util.dt as dt_util
+from homeassistant.util import slugify
+from homeassistant.util.yaml import load_yaml
+import voluptuous as vol
+
+from . import const, helpers
+from .const import LOGGER
+
+months = [m["value"] for m in const.MONTH_OPTIONS]
+frequencies = [f["value"] for f in const.FREQUENCY_OPTIONS]
+
+SENSOR_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_UNIQUE_ID): cv.string,
+        vol.Required(CONF_NAME): cv.string,
+        vol.Required(const.CONF_FREQUENCY): vol.In(frequencies),
+        vol.Optional(
+            const.CONF_ICON_NORMAL, default=const.DEFAULT_ICON_NORMAL
+        ): cv.icon,
+        vol.Optional(const.CONF_ICON_TODAY): cv.icon,
+        vol.Optional(const.CONF_ICON_TOMORROW): cv.icon,
+        vol.Optional(const.CONF_ICON_OVERDUE): cv.icon,
+        vol.Optional(
+            const.CONF_FORECAST_DATES, default=const.DEFAULT_FORECAST_DATES
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        vol.Optional(ATTR_HIDDEN): cv.boolean,
+        vol.Optional(const.CONF_MANUAL): cv.boolean,
+        vol.Optional(const.CONF_SHOW_OVERDUE_TODAY): cv.boolean,
+        vol.Optional(const.CONF_GROUP): cv.string,
+        vol.Optional(const.CONF_DATE): helpers.month_day_text,
+        vol.Optional(const.CONF_RRULE): helpers.rrule_text,
+        vol.Optional(const.CONF_TIME): cv.time,
+        vol.Optional(const.CONF_BLACKOUTS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(const.CONF_ASSIGNEES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(const.CONF_ROTATION_OFFSET): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(const.CONF_BLACKOUT_POLICY): vol.In(
+            [p["value"] for p in const.BLACKOUT_POLICY_OPTIONS]
+        ),
+        vol.Optional(CONF_ENTITIES): cv.entity_ids,
+        vol.Optional(const.CONF_CHORE_DAY): vol.In(WEEKDAYS),
+        vol.Optional(const.CONF_FIRST_MONTH): vol.In(months),
+        vol.Optional(const.CONF_LAST_MONTH): vol.In(months),
+        vol.Optional(const.CONF_DAY_OF_MONTH): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=31)
+        ),
+        vol.Optional(const.CONF_WEEKDAY_ORDER_NUMBER): vol.All(
+            vol.Coerce(int), vol.Range(min=-4, max=5)
+        ),
+        vol.Optional(const.CONF_FORCE_WEEK_NUMBERS): cv.boolean,
+        vol.Optional(const.CONF_DUE_DATE_OFFSET): vol.All(
+            vol.Coerce(int), vol.Range(min=-7, max=7)
+        ),
+        vol.Optional(const.CONF_PERIOD, default=const.DEFAULT_PERIOD): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Optional(const.CONF_FIRST_WEEK): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=52)
+        ),
+        vol.Optional(const.CONF_START_DATE): cv.date,
+        vol.Optional(const.CONF_DATE_FORMAT): cv.string,
+        # Applied to the chore after it is set up, not options
+        vol.Optional(const.ATTR_ADD_DATES): vol.All(cv.ensure_list, [cv.date]),
+        vol.Optional(const.ATTR_REMOVE_DATES): vol.All(cv.ensure_list, [cv.date]),
+    }
+)
+
+# iCalendar weekdays, in the order of WEEKDAYS
+ICS_WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+ICS_FREQUENCIES = {
+    "DAILY": "every-n-days",
+    "WEEKLY": "every-n-weeks",
+    "MONTHLY": "every-n-months",
+    "YEARLY": "every-n-years",
+}
+
+
+def entry_chore_ids(entry: ConfigEntry) -> list[str]:
+    """Return the unique IDs of the chores of a config entry, as Chore.unique_id."""
+    if const.CONF_CHORES in entry.options:
+        return [chore[CONF_UNIQUE_ID] for chore in entry.options[const.CONF_CHORES]]
+    return [entry.data.get(CONF_UNIQUE_ID, entry.entry_id)]
+
+
+def _chore_options(
+    chore: dict[str, Any], previous: Mapping[str, Any] | None
+) -> dict[str, Any]:
+    """Convert a validated chore definition to config entry options.
+
+    The previous options are those of the chore being updated, if any.
+    """
+    options: dict[str, Any] = {}
+    for key, value in chore.items():
+        if key in (
+            CONF_UNIQUE_ID,
+            CONF_NAME,
+            const.ATTR_ADD_DATES,
+            const.ATTR_REMOVE_DATES,
+        ):
+            continue
+        if isinstance(value, (date, time)):
+            value = value.isoformat()
+        elif key == const.CONF_WEEKDAY_ORDER_NUMBER:
+            value = str(value)  # As stored by the config flow
+        options[key] = value
+    if const.CONF_START_DATE not in options:
+        # Keep the start date of an imported chore, or start it today
+        options[const.CONF_START_DATE] = (
+            previous[const.CONF_START_DATE]
+            if previous is not None and const.CONF_START_DATE in previous
+            else helpers.now().date().isoformat()
+        )
+    return options
+
+
+def _ics_lines(path: str) -> Generator[str, None, None]:
+    """Read the unfolded content lines of an iCalendar file, line by line."""
+    with open(path, encoding="utf-8") as file:
+        current = ""
+        for line in file:
+            line = line.rstrip("\r\n")
+            if line[:1] in (" ", "\t"):
+                current += line[1:]
+                continue
+            if current:
+                yield current
+            current = line
+        if current:
+            yield current
+
+
+def _ics_events(lines: Iterable[str]) -> Generator[dict[str, list], None, None]:
+    """Generate the properties of each VEVENT, as name -> [(params, value)]."""
+    event: dict[str, list] | None = None
+    for line in lines:
+        if line == "BEGIN:VEVENT":
+            event = {}
+        elif line == "END:VEVENT":
+            if event is not None:
+                yield event
+            event = None
+        elif event is not None and ":" in line:
+            name_params, value = line.split(":", 1)
+            name, *params = name_params.split(";")
+            event.setdefault(name.upper(), []).append(
+                (dict(p.split("=", 1) for p in params if "=" in p), value)
+            )
+
+
+def _ics_text(value: str) -> str:
+    """Unescape a text value."""
+    return (
+        value.replace("\\n", " ")
+        .replace("\\N", " ")
+        .replace("\\,", ",")
+        .replace("\\;", ";")
+        .replace("\\\\", "\\")
+    )
+
+
+def _ics_datetime(params: dict[str, str], value: str) -> date | datetime:
+    """Return the date, or the local time, of a DTSTART/RDATE/EXDATE value."""
+    if params.get("VALUE") == "DATE" or "T" not in value:
+        return datetime.strptime(value[:8], "%Y%m%d").date()
+    moment = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        moment = moment.replace(tzinfo=dt_util.UTC)
+    elif (zone := dt_util.get_time_zone(params.get("TZID", ""))) is not None:
+        moment = moment.replace(tzinfo=zone)
+    else:
+        return moment  # Floating time, local already
+    return dt_util.as_local(moment).replace(tzinfo=None)
+
+
+def _ics_dates(event: dict[str, list], name: str) -> list[date]:
+    """Return the dates of a list property (RDATE, EXDATE)."""
+    dates: list[date] = []
+    for params, values in event.get(name, []):
+        for value in values.split(","):
+            moment = _ics_datetime(params, value)
+            dates.append(moment.date() if isinstance(moment, datetime) else moment)
+    return dates
+
+
+def _rrule_options(rule: str, start: date) -> dict[str, Any]:
+    """Map a recurrence rule to the closest frequency, or keep it as a rule."""
+    parts = dict(p.split("=", 1) for p in rule.upper().split(";") if "=" in p)
+    parts.pop("WKST", None)
+    frequency = ICS_FREQUENCIES.get(parts.pop("FREQ", ""))
+    options: dict[str, Any] = {const.CONF_PERIOD: int(parts.pop("INTERVAL", 1))}
+    by_day = parts.pop("BYDAY", None)
+    simple = frequency is not None and not {"COUNT", "UNTIL"} & set(parts)
+    if simple and frequency == "every-n-days":
+        simple = not parts and by_day is None
+    elif simple and frequency == "every-n-weeks":
+        day = by_day or ICS_WEEKDAYS[start.weekday()]
+        simple = not parts and day in ICS_WEEKDAYS
+        if simple:
+            options[const.CONF_CHORE_DAY] = WEEKDAYS[ICS_WEEKDAYS.index(day)]
+    elif simple and frequency == "every-n-months":
+        position = parts.pop("BYSETPOS", "")
+        if by_day is None:
+            day_of_month = parts.pop("BYMONTHDAY", str(start.day))
+            simple = not parts and not position and day_of_month.isdigit()
+            if simple:
+                options[const.CONF_DAY_OF_MONTH] = int(day_of_month)
+        else:
+            # e.g. -1FR, or FR with BYSETPOS=-1
+            order, day = by_day[:-2] or position, by_day[-2:]
+            simple = (
+                not parts
+                and day in ICS_WEEKDAYS
+                and order.lstrip("-").isdigit()
+                and -4 <= int(order) <= 5
+                and int(order) != 0
+            )
+            if simple:
+                options[const.CONF_CHORE_DAY] = WEEKDAYS[ICS_WEEKDAYS.index(day)]
+                options[const.CONF_WEEKDAY_ORDER_NUMBER] = int(order)
+    elif simple and frequency == "every-n-years":
+        month = parts.pop("BYMONTH", str(start.month))
+        day = parts.pop("BYMONTHDAY", str(start.day))
+        simple = not parts and by_day is None and month.isdigit() and day.isdigit()
+        if simple:
+            try:
+                # Dates missing from the common years (02/29) stay rules
+                date(2023, int(month), int(day))
+            except ValueError:
+                simple = False
+        if simple:
+            options[const.CONF_DATE] = f"{int(month):02d}/{int(day):02d}"
+    if not simple:
+        # Only the date of UNTIL counts, and the rule starts on a local date
+        rule = ";".join(
+            p[:14] if p.upper().startswith("UNTIL=") else p for p in rule.split(";")
+        )
+        return {const.CONF_FREQUENCY: "rrule", const.CONF_RRULE: rule}
+    return {const.CONF_FREQUENCY: frequency, **options}
+
+
+def load_ics_file(path: str) -> list:
+    """Convert the events of an iCalendar file to chore definitions.
+
+    Recurring events become chores of the closest frequency, or recurrence
+    rule chores. One-off events become manual chores with added dates, one
+    chore for the events with the same summary.
+    """
+    chores: list[dict[str, Any]] = []
+    one_offs: dict[str, dict[str, Any]] = {}
+    for event in _ics_events(_ics_lines(path)):
+        if "RECURRENCE-ID" in event or "DTSTART" not in event:
+            continue  # Changed occurrences are not imported
+        name = _ics_text(event.get("SUMMARY", [({}, "")])[0][1]) or "Chore"
+        start = _ics_datetime(*event["DTSTART"][0])
+        chore: dict[str, Any] = {}
+        if isinstance(start, datetime):
+            chore[const.CONF_TIME] = start.time().isoformat()
+            start = start.date()
+        if "RRULE" not in event:
+            one_off = one_offs.setdefault(
+                name,
+                {
+                    CONF_UNIQUE_ID: f"ics_{slugify(name)}",
+                    CONF_NAME: name,
+                    const.CONF_FREQUENCY: "blank",
+                    const.ATTR_ADD_DATES: [],
+                    **chore,
+                },
+            )
+            one_off[const.ATTR_ADD_DATES] += [start, *_ics_dates(event, "RDATE")]
+            continue
+        uid = event.get("UID", [({}, f"{name}-{start}")])[0][1]
+        chore.update(
+            {
+                CONF_UNIQUE_ID: uid,
+                CONF_NAME: name,
+                const.CONF_START_DATE: start,
+                **_rrule_options(event["RRULE"][0][1], start),
+            }
+        )
+        if added := _ics_dates(event, "RDATE"):
+            chore[const.ATTR_ADD_DATES] = added
+        if removed := _ics_dates(event, "EXDATE"):
+            chore[const.ATTR_REMOVE_DATES] = removed
+        chores.append(chore)
+    for one_off in one_offs.values():
+        one_off[const.ATTR_ADD_DATES] = sorted(set(one_off[const.ATTR_ADD_DATES]))
+    return chores + list(one_offs.values())
+
+
+def load_chore_file(path: str) -> list:
+    """Load the chore definitions from a JSON, YAML or iCalendar file."""
+    if Path(path).suffix.lower() == ".ics":
+        return load_ics_file(path)
+    if Path(path).suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as file:
+            content = json.load(file)
+    else:
+        content = load_yaml(path)
+    if isinstance(content, dict):
+        content = content.get(const.CONF_SENSORS, [])
+    if not isinstance(content, list):
+        raise HomeAssistantError(f"{path} does not contain a list of chores")
+    return content
+
+
+async def _async_apply_overrides(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    overrides: dict[str, tuple[list[date], list[date]]],
+) -> None:
+    """Add and remove the imported dates of the chores, if not done yet.
+
+    The (added, removed) dates are by chore unique_id, as in entry_chore_ids.
+    """
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    for registry_entry in er.async_entries_for_config_entry(
+        er.async_get(hass), entry.entry_id
+    ):
+        if (
+            chore := chores.get(registry_entry.entity_id)
+        ) is None or registry_entry.unique_id not in overrides:
+            continue
+        added, removed = overrides[registry_entry.unique_id]
+        for day in added:
+            if day.isoformat() not in (chore.add_dates or "").split(" "):
+                await chore.add_date(day)
+        for day in removed:
+            if day.isoformat() not in (chore.remove_dates or "").split(" "):
+                await chore.remove_date(day)
+        chore.async_write_ha_state()
+
+
+def _validated_chores(
+    definitions: list[Any], result: dict[str, Any]
+) -> Generator[tuple[int, dict[str, Any]], None, None]:
+    """Validate the chore definitions one by one, adding the errors to the result.
+
+    Yields the index and validated definition of the valid chores.
+    """
+    seen: set[str] = set()
+    for index, definition in enumerate(definitions):
+        try:
+            chore = SENSOR_SCHEMA(definition)
+        except vol.Invalid as err:
+            unique_id = (
+                definition.get(CONF_UNIQUE_ID) if isinstance(definition, dict) else None
+            )
+            result["errors"].append(
+                {"index": index, "unique_id": unique_id, "error": str(err)}
+            )
+            continue
+        unique_id = chore[CONF_UNIQUE_ID]
+        if unique_id in seen:
+            result["errors"].append(
+                {"index": index, "unique_id": unique_id, "error": "duplicate unique_id"}
+            )
+            continue
+        seen.add(unique_id)
+        yield index, chore
+
+
+def _imported_dates(chore: dict[str, Any]) -> tuple[list[date], list[date]] | None:
+    """Return the (added, removed) dates of a chore definition, if any."""
+    if const.ATTR_ADD_DATES in chore or const.ATTR_REMOVE_DATES in chore:
+        return (
+            chore.get(const.ATTR_ADD_DATES, []),
+            chore.get(const.ATTR_REMOVE_DATES, []),
+        )
+    return None
+
+
+async def async_import_chores(
+    hass: HomeAssistant, definitions: list[Any], chore_list: str | None = None
+) -> dict[str, Any]:
+    """Create or update a config entry for each chore definition.
+
+    The definitions are validated one by one, so an invalid chore is reported
+    without failing the others. Chores are matched to their config entries by
+    unique_id, so importing the same definitions again changes nothing. With a
+    chore list name, the chores are all kept in the config entry of the list.
+    """
+    result: dict[str, Any] = {
+        "created": [],
+        "updated": [],
+        "unchanged": [],
+        "removed": [],
+        "errors": [],
+    }
+    if chore_list is not None:
+        await _async_import_chore_list(hass, definitions, chore_list, result)
+    else:
+        await _async_import_chore_entries(hass, definitions, result)
+    for error in result["errors"]:
+        LOGGER.error(
+            "Failed importing chore %s (%s): %s",
+            error["index"],
+            error["unique_id"],
+            error["error"],
+        )
+    LOGGER.info(
+        "Imported chores: %d created, %d updated, %d unchanged, %d failed",
+        len(result["created"]),
+        len(result["updated"]),
+        len(result["unchanged"]),
+        len(result["errors"]),
+    )
+    return result
+
+
+async def _async_import_chore_entries(
+    hass: HomeAssistant, definitions: list[Any], result: dict[str, Any]
+) -> None:
+    """Create or update a config entry for each chore definition."""
+    entries = {
+        entry.unique_id: entry
+        for entry in hass.config_entries.async_entries(const.DOMAIN)
+        if entry.unique_id is not None
+    }
+    new_entries: list[ConfigEntry] = []
+    # unique_id -> (added dates, removed dates)
+    overrides: dict[str, tuple[list[date], list[date]]] = {}
+    for _, chore in _validated_chores(definitions, result):
+        unique_id = chore[CONF_UNIQUE_ID]
+        if (dates := _imported_dates(chore)) is not None:
+            overrides[unique_id] = dates
+        entry = entries.get(unique_id)
+        options = _chore_options(chore, None if entry is None else entry.options)
+        if entry is None:
+            new_entries.append(
+                ConfigEntry(
+                    version=const.CONFIG_VERSION,
+                    minor_version=1,
+                    domain=const.DOMAIN,
+                    title=chore[CONF_NAME],
+                    data={},
+                    options=options,
+                    source=SOURCE_IMPORT,
+                    unique_id=unique_id,
+                )
+            )
+            result["created"].append(unique_id)
+        elif hass.config_entries.async_update_entry(
+            entry, title=chore[CONF_NAME], options=options
+        ):
+            result["updated"].append(unique_id)
+        else:
+            result["unchanged"].append(unique_id)
+
+    # Set up the new chores together, instead of a config flow for each one
+    await asyncio.gather(
+        *(hass.config_entries.async_add(entry) for entry in new_entries)
+    )
+    for entry in hass.config_entries.async_entries(const.DOMAIN):
+        if entry.unique_id in overrides:
+            (chore_id,) = entry_chore_ids(entry)
+            await _async_apply_overrides(
+                hass, entry, {chore_id: overrides[entry.unique_id]}
+            )
+
+
+async def _async_import_chore_list(
+    hass: HomeAssistant, definitions: list[Any], name: str, result: dict[str, Any]
+) -> None:
+    """Replace the chores of a chore list entry with the chore definitions.
+
+    The chores dropped from the list are removed when the entry is set up again.
+    """
+    list_id = f"{const.CONF_CHORE_LIST}_{slugify(name)}"
+    entry: ConfigEntry | None = None
+    # The chores of the other entries, the unique IDs of the entities must differ
+    other_ids: set[str] = set()
+    for other in hass.config_entries.async_entries(const.DOMAIN):
+        if other.unique_id == list_id:
+            entry = other
+        else:
+            other_ids.update(entry_chore_ids(other))
+            if other.unique_id is not None:
+                other_ids.add(other.unique_id)
+    previous = {
+        chore[CONF_UNIQUE_ID]: chore
+        for chore in (entry.options[const.CONF_CHORES] if entry is not None else [])
+    }
+    chores: list[dict[str, Any]] = []
+    overrides: dict[str, tuple[list[date], list[date]]] = {}
+    for index, chore in _validated_chores(definitions, result):
+        unique_id = chore[CONF_UNIQUE_ID]
+        if unique_id in other_ids:
+            result["errors"].append(
+                {
+                    "index": index,
+                    "unique_id": unique_id,
+                    "error": "unique_id used by another chore entry",
+                }
+            )
+            continue
+        if (dates := _imported_dates(chore)) is not None:
+            overrides[unique_id] = dates
+        options = {
+            CONF_UNIQUE_ID: unique_id,
+            CONF_NAME: chore[CONF_NAME],
+            **_chore_options(chore, previous.get(unique_id)),
+        }
+        chores.append(options)
+        if unique_id not in previous:
+            result["created"].append(unique_id)
+        elif previous[unique_id] != options:
+            result["updated"].append(unique_id)
+        else:
+            result["unchanged"].append(unique_id)
+
+    imported = {chore[CONF_UNIQUE_ID] for chore in chores}
+    result["removed"].extend(
+        unique_id for unique_id in previous if unique_id not in imported
+    )
+    options = {const.CONF_CHORES: chores}
+    if entry is None:
+        entry = ConfigEntry(
+            version=const.CONFIG_VERSION,
+            minor_version=1,
+            domain=const.DOMAIN,
+            title=name,
+            data={},
+            options=options,
+            source=SOURCE_IMPORT,
+            unique_id=list_id,
+        )
+        await hass.config_entries.async_add(entry)
+    else:
+        hass.config_entries.async_update_entry(entry, title=name, options=options)
+    if overrides:
+        await _async_apply_overrides(hass, entry, overrides)
@@ -0,0 +1,67 @@
+"""Index of the chores by scope (area, label or group)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+# (scope kind, scope value), e.g. ("area", "kitchen")
+Scope = tuple[str, str]
+
+
+class ChoreIndex:
+    """Map scopes to the chores in them, and chores to their scopes."""
+
+    __slots__ = "_scopes", "_entity_scopes"
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._scopes: dict[Scope, set[str]] = {}
+        self._entity_scopes: dict[str, set[Scope]] = {}
+
+    def update(
+        self, entity_id: str, scopes: set[Scope]
+    ) -> tuple[set[Scope], set[Scope]]:
+        """Set the scopes of a chore, return the (added, removed) scopes."""
+        old_scopes = self._entity_scopes.get(entity_id, set())
+        added = scopes - old_scopes
+        removed = old_scopes - scopes
+        for scope in added:
+            self._scopes.setdefault(scope, set()).add(entity_id)
+        for scope in removed:
+            self._discard(scope, entity_id)
+        if scopes:
+            self._entity_scopes[entity_id] = set(scopes)
+        else:
+            self._entity_scopes.pop(entity_id, None)
+        return added, removed
+
+    def remove(self, entity_id: str) -> set[Scope]:
+        """Remove a chore from the index, return the scopes it was in."""
+        scopes = self._entity_scopes.pop(entity_id, set())
+        for scope in scopes:
+            self._discard(scope, entity_id)
+        return scopes
+
+    def entities(self, kind: str, value: str) -> set[str]:
+        """Return the entity IDs of the chores in the scope."""
+        return set(self._scopes.get((kind, value), ()))
+
+    def entities_in(self, scopes: Iterable[Scope]) -> set[str]:
+        """Return the entity IDs of the chores in any of the scopes."""
+        entity_ids: set[str] = set()
+        for scope in scopes:
+            entity_ids.update(self._scopes.get(scope, ()))
+        return entity_ids
+
+    def scopes(self, entity_id: str | None = None) -> set[Scope]:
+        """Return the scopes of the chore, or all scopes with chores."""
+        if entity_id is None:
+            return set(self._scopes)
+        return set(self._entity_scopes.get(entity_id, ()))
+
+    def _discard(self, scope: Scope, entity_id: str) -> None:
+        """Remove the chore from the scope, dropping the scope when empty."""
+        if (entity_ids := self._scopes.get(scope)) is not None:
+            entity_ids.discard(entity_id)
+            if not entity_ids:
+                del self._scopes[scope]
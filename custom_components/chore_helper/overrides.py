@@ -0,0 +1,139 @@
+"""Added, removed and offset dates of the chores, saved to the Home Assistant storage."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from . import const
+from .const import LOGGER
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{const.DOMAIN}.overrides"
+SAVE_DELAY = 10  # seconds
+
+ADDED = "add"
+REMOVED = "remove"
+OFFSET = "offset"
+
+
+def _ordinal(text: str) -> int | None:
+    """Return the day ordinal of a date of the overrides, None if invalid."""
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").date().toordinal()
+    except ValueError:
+        LOGGER.warning("Ignoring the invalid date %s of the overrides", text)
+        return None
+
+
+def _dates_to_ordinals(texts: str | None) -> list[int]:
+    """Convert the added or removed dates to day ordinals."""
+    return [
+        ordinal
+        for text in (texts or "").split()
+        if (ordinal := _ordinal(text)) is not None
+    ]
+
+
+def _offsets_to_pairs(texts: str | None) -> list[list[int]]:
+    """Convert the offset dates to [day ordinal, days] pairs."""
+    pairs = []
+    for text in (texts or "").split():
+        day, _, offset = text.partition(":")
+        if (ordinal := _ordinal(day)) is None:
+            continue
+        try:
+            pairs.append([ordinal, int(offset)])
+        except ValueError:
+            LOGGER.warning("Ignoring the invalid offset %s of the overrides", text)
+    return pairs
+
+
+def _ordinals_to_dates(ordinals: list[int]) -> str | None:
+    """Convert day ordinals to the added or removed dates."""
+    return " ".join(date.fromordinal(o).isoformat() for o in ordinals) or None
+
+
+def _pairs_to_offsets(pairs: list[list[int]]) -> str | None:
+    """Convert [day ordinal, days] pairs to the offset dates."""
+    return (
+        " ".join(f"{date.fromordinal(o).isoformat()}:{days}" for o, days in pairs)
+        or None
+    )
+
+
+class OverrideStore:
+    """Overrides of all chores, saved to the Home Assistant storage.
+
+    Stored as day ordinals by chore, e.g. {"add": [739000], "offset":
+    [[739007, 2]]}, and given to the schedules as the date texts they use.
+    """
+
+    __slots__ = "_store", "_overrides"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the store, call async_load before use."""
+        self._store: Store[dict[str, dict[str, list]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._overrides: dict[str, dict[str, list]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored overrides."""
+        if (data := await self._store.async_load()) is not None:
+            self._overrides = data
+
+    def get(self, chore_id: str) -> tuple[str | None, str | None, str | None] | None:
+        """Return the added, removed and offset dates, None if none are stored."""
+        if (overrides := self._overrides.get(chore_id)) is None:
+            return None
+        return (
+            _ordinals_to_dates(overrides.get(ADDED, [])),
+            _ordinals_to_dates(overrides.get(REMOVED, [])),
+            _pairs_to_offsets(overrides.get(OFFSET, [])),
+        )
+
+    @callback
+    def set(
+        self,
+        chore_id: str,
+        add_dates: str | None,
+        remove_dates: str | None,
+        offset_dates: str | None,
+    ) -> None:
+        """Store the added, removed and offset dates of the chore."""
+        overrides = {
+            key: value
+            for key, value in (
+                (ADDED, _dates_to_ordinals(add_dates)),
+                (REMOVED, _dates_to_ordinals(remove_dates)),
+                (OFFSET, _offsets_to_pairs(offset_dates)),
+            )
+            if value
+        }
+        if overrides == self._overrides.get(chore_id, {}):
+            return
+        if overrides:
+            self._overrides[chore_id] = overrides
+        else:
+            del self._overrides[chore_id]
+        self.async_schedule_save()
+
+    @callback
+    def remove(self, chore_id: str) -> None:
+        """Forget the overrides of a removed chore."""
+        if self._overrides.pop(chore_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the overrides after a delay, collecting the changes."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return self._overrides
@@ -0,0 +1,112 @@
+"""Preview of the next due dates while configuring a chore."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+import time
+from typing import Any
+
+from homeassistant.components import websocket_api
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.schema_config_entry_flow import SchemaFlowError
+import voluptuous as vol
+
+from . import const, helpers
+from .blackout import chore_blackouts
+from .config_flow import _validate_config
+from .schedule import ChoreSchedule
+from .sensor import CHORE_CLASSES
+
+PREVIEW_DATES = 10
+PREVIEW_TIME_BUDGET = 0.05  # seconds
+# A recurrence rule without dates is searched until the year 9999 by dateutil,
+# without returning to the budget checks
+PREVIEW_TIMEOUT = 0.5  # seconds
+PREVIEW_YEARS = 100
+
+
+def next_due_dates(
+    schedule: ChoreSchedule, today: date, count: int = PREVIEW_DATES
+) -> tuple[list[date], bool]:
+    """Return the next due dates from today, and if the time budget ran out."""
+    deadline = time.monotonic() + PREVIEW_TIME_BUDGET
+    due_dates: list[date] = []
+    for due_date in schedule.dates_between(
+        today, date(today.year + PREVIEW_YEARS, 12, 31), today, deadline
+    ):
+        due_dates.append(due_date)
+        if len(due_dates) >= count:
+            return due_dates, False
+    return due_dates, time.monotonic() > deadline
+
+
+@callback
+def async_setup_preview(hass: HomeAssistant) -> None:
+    """Register the preview websocket command."""
+    websocket_api.async_register_command(hass, ws_start_preview)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "chore_helper/start_preview",
+        vol.Required("flow_id"): str,
+        vol.Required("flow_type"): vol.Any("config_flow", "options_flow"),
+        vol.Required("user_input"): dict,
+    }
+)
+@websocket_api.async_response
+async def ws_start_preview(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Calculate the next due dates from the options entered so far."""
+    flows = hass.data.get(const.DOMAIN, {}).get(const.PREVIEW_FLOWS, {})
+    if (handler := flows.get(msg["flow_id"])) is None:
+        connection.send_error(msg["id"], "flow_not_found", "Flow not found")
+        return
+    try:
+        options = await _validate_config(
+            handler, {**handler.options, **msg["user_input"]}
+        )
+    except SchemaFlowError as err:
+        connection.send_error(msg["id"], "invalid_user_input", str(err))
+        return
+    if (chore_class := CHORE_CLASSES.get(options.get(const.CONF_FREQUENCY))) is None:
+        connection.send_error(msg["id"], "invalid_user_input", "Unknown frequency")
+        return
+
+    schedule = chore_class.schedule_class(options, options.get(CONF_NAME))
+    schedule.blackouts = chore_blackouts(hass, options)
+    if msg["flow_type"] == "options_flow":
+        # Start from the current state of the chore being reconfigured
+        entry_id = hass.config_entries.options.async_get(msg["flow_id"])["handler"]
+        for entry in er.async_entries_for_config_entry(er.async_get(hass), entry_id):
+            chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM].get(entry.entity_id)
+            if chore is not None:
+                schedule.last_completed = chore.last_completed
+                schedule.offset_dates = chore.offset_dates
+                schedule.add_dates = chore.add_dates
+                schedule.remove_dates = chore.remove_dates
+
+    try:
+        due_dates, truncated = await asyncio.wait_for(
+            hass.async_add_executor_job(next_due_dates, schedule, helpers.now().date()),
+            PREVIEW_TIMEOUT,
+        )
+    except TimeoutError:
+        due_dates, truncated = [], True
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {
+                "due_dates": helpers.dates_to_texts(due_dates),
+                "truncated": truncated,
+            },
+        )
+    )
+    connection.subscriptions[msg["id"]] = lambda: None
@@ -0,0 +1,417 @@
+"""Chore schedule calculation, independent of the Home Assistant entity.
+
+A schedule only holds plain values read from the chore options and the chore
+state that influences its dates, so it can be copied, pickled and evaluated
+outside of the event loop (e.g. in a process pool).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Generator, Mapping
+from datetime import date, datetime, timedelta
+import heapq
+from time import monotonic
+from typing import Any
+
+from dateutil.relativedelta import relativedelta
+
+from . import const, helpers, vectorized
+from .blackout import BlackoutCalendar, apply_blackouts, blacked_out
+from .const import LOGGER
+from .vectorized import ForecastPlan
+
+
+class ChoreSchedule:
+    """Calculate chore due dates from plain, picklable inputs."""
+
+    __slots__ = (
+        "name",
+        "frequency",
+        "first_month",
+        "last_month",
+        "forecast_dates",
+        "start_date",
+        "last_completed",
+        "offset_dates",
+        "add_dates",
+        "remove_dates",
+        "blackouts",
+        "blackout_policy",
+        "assignees",
+        "rotation_offset",
+    )
+
+    def __init__(self, options: Mapping[str, Any], name: str | None = None) -> None:
+        """Read the schedule parameters from the chore options."""
+        self.name = name
+        first_month = options.get(const.CONF_FIRST_MONTH, const.DEFAULT_FIRST_MONTH)
+        months = [m["value"] for m in const.MONTH_OPTIONS]
+        self.first_month: int = (
+            months.index(first_month) + 1 if first_month in months else 1
+        )
+        last_month = options.get(const.CONF_LAST_MONTH, const.DEFAULT_LAST_MONTH)
+        self.last_month: int = (
+            months.index(last_month) + 1 if last_month in months else 12
+        )
+        self.forecast_dates: int = options.get(const.CONF_FORECAST_DATES) or 0
+        self.frequency: str = options.get(const.CONF_FREQUENCY)
+        self.start_date: date | None
+        try:
+            self.start_date = helpers.to_date(options.get(const.CONF_START_DATE))
+        except ValueError:
+            self.start_date = None
+        self.last_completed: datetime | None = None
+        self.offset_dates: str | None = None
+        self.add_dates: str | None = None
+        self.remove_dates: str | None = None
+        # Set by the owner, calendars are shared by the chores
+        self.blackouts: tuple[BlackoutCalendar, ...] = ()
+        self.blackout_policy: str = (
+            options.get(const.CONF_BLACKOUT_POLICY) or const.DEFAULT_BLACKOUT_POLICY
+        )
+        self.assignees: tuple[str, ...] = tuple(options.get(const.CONF_ASSIGNEES) or ())
+        self.rotation_offset: int = int(options.get(const.CONF_ROTATION_OFFSET) or 0)
+
+    @property
+    def runtime_state(self) -> tuple:
+        """Return the inputs that change after the chore is set up."""
+        return (
+            self.last_completed,
+            self.offset_dates,
+            self.add_dates,
+            self.remove_dates,
+        )
+
+    def _find_candidate_date(self, day1: date, today: date) -> date | None:
+        """Find the next possible date starting from day1.
+
+        Only based on calendar, not looking at include/exclude days.
+        Must be implemented for each child class.
+        """
+        raise NotImplementedError
+
+    def _forecast_rule(self, schedule_start_date: date) -> tuple | None:
+        """Return the rule of the candidate dates for the vectorized forecast.
+
+        Implemented by the child classes whose dates follow one, None if the
+        dates can only be calculated one by one.
+        """
+        return None
+
+    def forecast_plan(self, today: date) -> ForecastPlan | None:
+        """Return the inputs of the vectorized forecast, None if not supported.
+
+        The blackouts, and overrides that don't parse, are left to the forecast
+        one date at a time.
+        """
+        if self.blackouts or self.start_date is None:
+            return None
+        try:
+            schedule_start_date = self._calculate_schedule_start_date()
+            if (rule := self._forecast_rule(schedule_start_date)) is None:
+                return None
+            first_day = self.calculate_day1(
+                self.calculate_start_date(today), schedule_start_date, today
+            )
+            removed = [
+                day
+                for text in (self.remove_dates or "").split()
+                if (day := _exact_date(text)) is not None
+            ]
+            offsets: dict[date, int] = {}
+            for text in (self.offset_dates or "").split():
+                # The first offset of a date applies, as in _move
+                if (day := _exact_date(text[:10])) is not None and day not in offsets:
+                    offsets[day] = int(text.split(":")[1])
+            added = self._added_dates()
+        except (TypeError, ValueError, IndexError):
+            return None
+        return ForecastPlan(
+            rule,
+            first_day,
+            int(self.forecast_dates) + 1,
+            (self.first_month, self.last_month),
+            removed,
+            offsets,
+            added,
+        )
+
+    def _occurrence(self, due_date: date) -> int | None:
+        """Return the number of periods from the start date to the due date.
+
+        Implemented by the child classes with a period. The due date is the
+        calculated one, before the offsets and blackouts moved it.
+        """
+        return None
+
+    def assignee(self, due_date: date, today: date) -> str | None:
+        """Return who is assigned the chore on the due date, in turns."""
+        if not self.assignees or self.start_date is None:
+            return None
+        if (occurrence := self._occurrence(self._unmoved(due_date, today))) is None:
+            return None
+        return self.assignees[(self.rotation_offset + occurrence) % len(self.assignees)]
+
+    def _moved_here(self, due_date: date) -> bool:
+        """Return if an offset or a blackout shift can move a date to the due date."""
+        for text in (self.offset_dates or "").split():
+            if (day := _exact_date(text[:10])) is not None and day + timedelta(
+                days=int(text.split(":")[1])
+            ) == due_date:
+                return True
+        if not self.blackouts or self.blackout_policy == const.BLACKOUT_SKIP:
+            return False
+        step = timedelta(
+            days=1 if self.blackout_policy == const.BLACKOUT_SHIFT_FORWARD else -1
+        )
+        return blacked_out(self.blackouts, due_date - step)
+
+    def _unmoved(self, due_date: date, today: date) -> date:
+        """Return the calculated date that was moved to the due date.
+
+        Offsets and blackouts don't change whose turn a date is, so the turn is
+        taken from the date before it was moved.
+        """
+        if not self._moved_here(due_date):
+            return due_date
+        margin = timedelta(days=const.MAX_DATE_MOVE)
+        day = due_date - margin
+        previous: date | None = None
+        while True:
+            try:
+                candidate = self._find_candidate_date(day, today)
+            except (TypeError, ValueError):
+                break
+            if candidate is None or candidate > due_date + margin:
+                break
+            if (new_date := self.move_to_range(candidate)) != candidate:
+                day = new_date
+                continue
+            if previous is not None and candidate <= previous:
+                day += timedelta(days=1)  # no progress, look from the next day
+                continue
+            previous = candidate
+            if self._apply_overrides(candidate) == due_date:
+                return candidate
+            day = candidate + timedelta(days=1)
+        return due_date
+
+    def date_inside(self, dat: date) -> bool:
+        """Check if the date is inside first and last date."""
+        month = dat.month
+        if self.first_month <= self.last_month:
+            return bool(self.first_month <= month <= self.last_month)
+        return bool(self.first_month <= month or month <= self.last_month)
+
+    def move_to_range(self, day: date) -> date:
+        """If the date is not in range, move to the range."""
+        if not self.date_inside(day):
+            year = day.year
+            month = day.month
+            months = [m["label"] for m in const.MONTH_OPTIONS]
+            if self.first_month <= self.last_month < month:
+                LOGGER.debug(
+                    "(%s) %s outside the range, looking from %s next year",
+                    self.name,
+                    day,
+                    months[self.first_month - 1],
+                )
+                return date(year + 1, self.first_month, 1)
+            LOGGER.debug(
+                "(%s) %s outside the range, searching from %s",
+                self.name,
+                day,
+                months[self.first_month - 1],
+            )
+            return date(year, self.first_month, 1)
+        return day
+
+    def _apply_overrides(self, candidate: date) -> date | None:
+        """Apply the removed and offset dates and the blackouts to a calculated date."""
+        if self.remove_dates is not None:
+            for remove_date in self.remove_dates.split(" "):
+                if remove_date == (candidate.strftime("%Y-%m-%d")):
+                    return None
+        return self._move(candidate)
+
+    def _move(self, candidate: date) -> date | None:
+        """Apply the offset dates and the blackouts to a calculated date."""
+        offset = None
+        if self.offset_dates is not None:
+            offset_compare = candidate.strftime("%Y-%m-%d")
+            for offset_date in self.offset_dates.split(" "):
+                if offset_date.startswith(offset_compare):
+                    offset = int(offset_date.split(":")[1])
+                    break
+        if offset is not None:
+            candidate += relativedelta(days=offset)
+        return apply_blackouts(self.blackouts, self.blackout_policy, candidate)
+
+    def _added_dates(self) -> list[date]:
+        """Return the manually added dates."""
+        if self.add_dates is None:
+            return []
+        return [
+            datetime.strptime(add_date_str, "%Y-%m-%d").date()
+            for add_date_str in self.add_dates.split(" ")
+        ]
+
+    def due_dates(self, today: date) -> Generator[date, None, None]:
+        """Get dates within configured date range."""
+        start_date: date = self.calculate_start_date(today)
+        for _ in range(int(self.forecast_dates) + 1):
+            try:
+                next_due_date = self._find_candidate_date(start_date, today)
+            except (TypeError, ValueError):
+                break
+            if next_due_date is None:
+                break
+            if (new_date := self.move_to_range(next_due_date)) != next_due_date:
+                start_date = new_date
+            else:
+                if (due_date := self._apply_overrides(next_due_date)) is not None:
+                    yield due_date
+                start_date = next_due_date + relativedelta(
+                    days=1
+                )  # look from the next day
+        yield from self._added_dates()
+        return
+
+    def dates_between(
+        self, start: date, end: date, today: date, deadline: float | None = None
+    ) -> Generator[date, None, None]:
+        """Lazily generate the sorted due dates within start and end (inclusive).
+
+        Unlike due_dates, this is not limited by the number of forecast dates,
+        and only calculates the dates needed for the window. With a deadline (of
+        time.monotonic), the dates calculated until then are generated.
+        """
+        # Offsets and blackouts can move a date into the window from outside of it,
+        # so the dates are buffered until no later calculated date can precede them.
+        margin = timedelta(days=const.MAX_DATE_MOVE)
+        queued = {d for d in self._added_dates() if start <= d <= end}
+        pending = list(queued)
+        heapq.heapify(pending)
+        day = max(self.calculate_start_date(today), start - margin)
+        previous: date | None = None
+        while deadline is None or monotonic() <= deadline:
+            try:
+                candidate = self._find_candidate_date(day, today)
+            except (TypeError, ValueError):
+                break
+            if candidate is None or candidate > end + margin:
+                break
+            if (new_date := self.move_to_range(candidate)) != candidate:
+                day = new_date
+                continue
+            if previous is not None and candidate <= previous:
+                day += timedelta(days=1)  # no progress, look from the next day
+                continue
+            previous = candidate
+            while pending and pending[0] < candidate - margin:
+                yield heapq.heappop(pending)
+            due_date = self._apply_overrides(candidate)
+            if (
+                due_date is not None
+                and start <= due_date <= end
+                and due_date not in queued
+            ):
+                queued.add(due_date)
+                heapq.heappush(pending, due_date)
+            day = candidate + timedelta(days=1)
+        while pending:
+            yield heapq.heappop(pending)
+
+    def forecast(self, today: date) -> array:
+        """Return the sorted forecasted due dates, as an array of day ordinals.
+
+        An ordinal takes 4 bytes in the array, where a date is a separate object.
+        Blackout shifts can move two dates to the same day, which is kept once.
+        """
+        return array("i", sorted({d.toordinal() for d in self.due_dates(today)}))
+
+    def calculate_day1(
+        self, day1: date, schedule_start_date: date, today: date
+    ) -> date:
+        """Calculate day1."""
+        start_date = self.calculate_start_date(today)
+        if start_date > day1:
+            day1 = start_date
+        if schedule_start_date > day1:
+            day1 = schedule_start_date
+        if (
+            day1 == today
+            and self.last_completed is not None
+            and self.last_completed.date() == today
+        ):
+            day1 = day1 + relativedelta(days=1)
+        return day1
+
+    def calculate_start_date(self, today: date) -> date:
+        """Calculate start date based on the last completed date."""
+
+        start_date = (
+            self.start_date
+            if self.start_date is not None
+            else date(today.year - 1, 1, 1)
+        )
+
+        if self.last_completed is not None:
+            last_completed = self.last_completed.date()
+
+            if last_completed > start_date:
+                start_date = last_completed
+            elif last_completed == start_date:
+                start_date += timedelta(days=1)
+
+        return self.move_to_range(start_date)
+
+    def _calculate_schedule_start_date(self) -> date:
+        """Calculate start date for scheduling offsets."""
+
+        after = self.frequency[:6] == "after-"
+        start_date = self.start_date
+
+        if after and self.last_completed is not None:
+            earliest_date = self._add_period_offset(self.last_completed.date())
+
+            if earliest_date > start_date:
+                start_date = earliest_date
+
+        return start_date
+
+    def _add_period_offset(self, start_date: date) -> date:
+        return start_date + timedelta(days=1)
+
+
+def _exact_date(text: str) -> date | None:
+    """Parse a date written as the overrides are matched, YYYY-MM-DD."""
+    try:
+        day = datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+    return day if day.strftime("%Y-%m-%d") == text else None
+
+
+def forecast_schedules(schedules: list[ChoreSchedule], today: date) -> list[array]:
+    """Forecast due dates for a batch of schedules.
+
+    Module level, so that it can be submitted to a process pool. With NumPy,
+    the schedules with a forecast plan are forecast together.
+    """
+    results: list[array | None] = [None] * len(schedules)
+    if vectorized.AVAILABLE:
+        planned = [
+            (index, plan)
+            for index, schedule in enumerate(schedules)
+            if (plan := schedule.forecast_plan(today)) is not None
+        ]
+        for (index, _), due_dates in zip(
+            planned, vectorized.forecast_plans([plan for _, plan in planned])
+        ):
+            results[index] = due_dates
+    return [
+        schedule.forecast(today) if due_dates is None else due_dates
+        for schedule, due_dates in zip(schedules, results)
+    ]
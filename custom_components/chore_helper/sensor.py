@@ -5,46 +5,156 @@ from __future__ import annotations
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_HIDDEN, CONF_NAME, CONF_UNIQUE_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import const
+from .blackout import chore_blackouts
+from .chore import Chore
 from .chore_blank import BlankChore
 from .chore_daily import DailyChore
 from .chore_monthly import MonthlyChore
+from .chore_rrule import RRuleChore
 from .chore_weekly import WeeklyChore
 from .chore_yearly import YearlyChore
 from .const import LOGGER
+from .importer import entry_chore_ids
+from .summary import SUMMARY_NAMES, ChoreSummarySensor
 
 
 SCAN_INTERVAL = timedelta(seconds=10)
 THROTTLE_INTERVAL = timedelta(seconds=60)
 
+CHORE_CLASSES: dict[str, type[Chore]] = {
+    "every-n-days": DailyChore,
+    "every-n-weeks": WeeklyChore,
+    "every-n-months": MonthlyChore,
+    "every-n-years": YearlyChore,
+    "after-n-days": DailyChore,
+    "after-n-weeks": WeeklyChore,
+    "after-n-months": MonthlyChore,
+    "after-n-years": YearlyChore,
+    "rrule": RRuleChore,
+    "blank": BlankChore,
+}
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    _: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Create the summary sensors, loaded by the integration."""
+    if discovery_info is None:
+        return
+    summary = hass.data[const.DOMAIN][const.SUMMARY]
+    async_add_entities(ChoreSummarySensor(summary, kind) for kind in SUMMARY_NAMES)
+
 
 async def async_setup_entry(
-    _: HomeAssistant, config_entry: ConfigEntry, async_add_devices: AddEntitiesCallback
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_devices: AddEntitiesCallback,
 ) -> None:
     """Create chore entities defined in config_flow and add them to HA."""
+    if const.CONF_CHORES in config_entry.options:
+        _async_remove_dropped_chores(hass, config_entry)
+        async_add_devices(_list_chores(hass, config_entry), True)
+        return
     frequency = config_entry.options.get(const.CONF_FREQUENCY)
     name = (
         config_entry.title
         if config_entry.title is not None
         else config_entry.data.get(CONF_NAME)
     )
-    _frequency_function = {
-        "every-n-days": DailyChore,
-        "every-n-weeks": WeeklyChore,
-        "every-n-months": MonthlyChore,
-        "every-n-years": YearlyChore,
-        "after-n-days": DailyChore,
-        "after-n-weeks": WeeklyChore,
-        "after-n-months": MonthlyChore,
-        "after-n-years": YearlyChore,
-        "blank": BlankChore,
-    }
-    if frequency in _frequency_function:
-        async_add_devices([_frequency_function[frequency](config_entry)], True)
+    if frequency in CHORE_CLASSES:
+        chore = CHORE_CLASSES[frequency](config_entry)
+        chore.schedule.blackouts = chore_blackouts(hass, config_entry.options)
+        async_add_devices([chore], True)
     else:
         LOGGER.error("(%s) Unknown frequency %s", name, frequency)
         raise ValueError
+
+
+async def async_reconfigure_entry(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> bool:
+    """Apply the changed options of an entry to its chores, in place.
+
+    Returns False if the chores have to be set up again instead: when a chore
+    changes class (frequency) or is hidden or shown, or chores were added to
+    or dropped from a chore list.
+    """
+    chores = {
+        chore.unique_id: chore
+        for chore in hass.data[const.DOMAIN][const.SENSOR_PLATFORM].values()
+        if chore.config_entry.entry_id == config_entry.entry_id
+    }
+    if const.CONF_CHORES in config_entry.options:
+        configs = [
+            (options[CONF_UNIQUE_ID], options, options[CONF_NAME])
+            for options in config_entry.options[const.CONF_CHORES]
+        ]
+    else:
+        (chore_id,) = entry_chore_ids(config_entry)
+        name = (
+            config_entry.title
+            if config_entry.title is not None
+            else config_entry.data.get(CONF_NAME)
+        )
+        configs = [(chore_id, config_entry.options, name)]
+    if set(chores) != {chore_id for chore_id, _, _ in configs}:
+        return False
+    for chore_id, options, _ in configs:
+        chore = chores[chore_id]
+        if CHORE_CLASSES.get(options.get(const.CONF_FREQUENCY)) is not type(
+            chore
+        ) or chore.hidden != options.get(ATTR_HIDDEN, False):
+            return False
+    for chore_id, options, name in configs:
+        await chores[chore_id].async_reconfigure(
+            options, name, chore_blackouts(hass, options)
+        )
+    return True
+
+
+def _list_chores(hass: HomeAssistant, config_entry: ConfigEntry) -> list[Chore]:
+    """Create the chores of a chore list entry, skipping the invalid ones."""
+    chores = []
+    for options in config_entry.options[const.CONF_CHORES]:
+        frequency = options.get(const.CONF_FREQUENCY)
+        if frequency not in CHORE_CLASSES:
+            LOGGER.error("(%s) Unknown frequency %s", options.get(CONF_NAME), frequency)
+            continue
+        chore = CHORE_CLASSES[frequency](config_entry, options)
+        chore.schedule.blackouts = chore_blackouts(hass, options)
+        chores.append(chore)
+    return chores
+
+
+@callback
+def _async_remove_dropped_chores(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Remove the entities of the chores no longer in a chore list."""
+    chore_ids = set(entry_chore_ids(config_entry))
+    registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(
+        registry, config_entry.entry_id
+    ):
+        # The calendars can be set up with the entry too
+        if (
+            registry_entry.domain != const.SENSOR_PLATFORM
+            or registry_entry.unique_id in chore_ids
+        ):
+            continue
+        LOGGER.debug(
+            "Removing %s, no longer in the chore list", registry_entry.entity_id
+        )
+        registry.async_remove(registry_entry.entity_id)
+        hass.data[const.DOMAIN][const.STATISTICS].remove(registry_entry.unique_id)
+        hass.data[const.DOMAIN][const.OVERRIDES].remove(registry_entry.unique_id)
@@ -0,0 +1,148 @@
+"""Completion statistics of the chores, updated with every completion."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from . import const
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{const.DOMAIN}.statistics"
+SAVE_DELAY = 30  # seconds
+RECENT_DAYS = 30
+
+
+class ChoreStatistics:
+    """Running totals of the completions of one chore."""
+
+    __slots__ = (
+        "completions",
+        "rated",
+        "on_time",
+        "lateness_total",
+        "current_streak",
+        "best_streak",
+        "last_missed",
+        "_recent",
+    )
+
+    def __init__(self, data: list | None = None) -> None:
+        """Create the statistics, from their stored form if available."""
+        (
+            self.completions,
+            self.rated,
+            self.on_time,
+            self.lateness_total,
+            self.current_streak,
+            self.best_streak,
+            self.last_missed,
+            recent,
+        ) = data if data is not None else (0, 0, 0, 0, 0, 0, 0, [])
+        # Sorted day ordinals of the completions in the last days
+        self._recent: list[int] = list(recent)
+
+    def as_list(self) -> list:
+        """Return the compact form to store."""
+        return [
+            self.completions,
+            self.rated,
+            self.on_time,
+            self.lateness_total,
+            self.current_streak,
+            self.best_streak,
+            self.last_missed,
+            self._recent,
+        ]
+
+    def completed(self, day: date, today: date, lateness: int | None) -> None:
+        """Count a completion, lateness in days after the due date if known."""
+        self.completions += 1
+        if day.toordinal() > today.toordinal() - RECENT_DAYS:
+            insort(self._recent, day.toordinal())
+        if lateness is None:
+            return
+        self.rated += 1
+        if lateness <= 0:
+            self.on_time += 1
+            self.current_streak += 1
+            self.best_streak = max(self.best_streak, self.current_streak)
+        else:
+            self.lateness_total += lateness
+            self.current_streak = 0
+
+    def missed(self, due_date: date) -> bool:
+        """Break the streak once for a due date that passed, return if changed."""
+        if self.last_missed == due_date.toordinal():
+            return False
+        self.last_missed = due_date.toordinal()
+        self.current_streak = 0
+        return True
+
+    def roll(self, today: date) -> bool:
+        """Forget the completions before the recent days, return if changed."""
+        if expired := bisect_left(self._recent, today.toordinal() - RECENT_DAYS + 1):
+            del self._recent[:expired]
+        return bool(expired)
+
+    @property
+    def on_time_rate(self) -> float | None:
+        """Return the percentage of the completions on or before the due date."""
+        return round(100 * self.on_time / self.rated, 1) if self.rated else None
+
+    @property
+    def average_lateness(self) -> float | None:
+        """Return the average number of days the chore was completed late."""
+        return round(self.lateness_total / self.rated, 1) if self.rated else None
+
+    @property
+    def recent_completions(self) -> int:
+        """Return the number of completions in the recent days."""
+        return len(self._recent)
+
+
+class StatisticsStore:
+    """Statistics of all chores, saved to the Home Assistant storage."""
+
+    __slots__ = "_store", "_statistics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the store, call async_load before use."""
+        self._store: Store[dict[str, list]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._statistics: dict[str, ChoreStatistics] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored statistics."""
+        if (data := await self._store.async_load()) is not None:
+            self._statistics = {
+                chore_id: ChoreStatistics(values) for chore_id, values in data.items()
+            }
+
+    def get(self, chore_id: str) -> ChoreStatistics:
+        """Return the statistics of the chore, new ones for a new chore."""
+        if (statistics := self._statistics.get(chore_id)) is None:
+            statistics = self._statistics[chore_id] = ChoreStatistics()
+        return statistics
+
+    @callback
+    def remove(self, chore_id: str) -> None:
+        """Forget the statistics of a removed chore."""
+        if self._statistics.pop(chore_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the statistics after a delay, collecting the changes."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            chore_id: statistics.as_list()
+            for chore_id, statistics in self._statistics.items()
+        }
@@ -0,0 +1,171 @@
+"""Summary of all chores, updated with each change of a chore."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+
+from . import const
+
+MOST_OVERDUE = 5
+WEEK_DAYS = 7
+
+SUMMARY_OVERDUE = "overdue"
+SUMMARY_DUE_TODAY = "due_today"
+SUMMARY_DUE_THIS_WEEK = "due_this_week"
+SUMMARY_NAMES = {
+    SUMMARY_OVERDUE: "Chores overdue",
+    SUMMARY_DUE_TODAY: "Chores due today",
+    SUMMARY_DUE_THIS_WEEK: "Chores due this week",
+}
+SUMMARY_ICONS = {
+    SUMMARY_OVERDUE: const.DEFAULT_ICON_OVERDUE,
+    SUMMARY_DUE_TODAY: const.DEFAULT_ICON_TODAY,
+    SUMMARY_DUE_THIS_WEEK: const.DEFAULT_ICON_NORMAL,
+}
+
+
+class ChoreSummary:
+    """Counters of the chores, and the overdue chores ordered by their days.
+
+    Follows the chore changes, so each change only updates the counters of
+    that chore instead of counting all chores again.
+    """
+
+    __slots__ = "_hass", "_chores", "_counts", "_overdue", "_pending", "_unsub"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the summary, following the chore changes."""
+        self._hass = hass
+        # entity_id -> (days, overdue)
+        self._chores: dict[str, tuple[int | None, bool]] = {}
+        self._counts = dict.fromkeys(SUMMARY_NAMES, 0)
+        # (days, entity_id) of the overdue chores, most overdue first
+        self._overdue: list[tuple[int, str]] = []
+        self._pending = False
+        self._unsub = async_dispatcher_connect(
+            hass, const.SIGNAL_CHORE_CHANGED, self._async_chore_changed
+        )
+
+    def count(self, kind: str) -> int:
+        """Return the number of chores overdue, due today or due this week."""
+        return self._counts[kind]
+
+    def most_overdue(self, count: int = MOST_OVERDUE) -> list[tuple[str, int]]:
+        """Return the entity IDs and overdue days of the most overdue chores."""
+        return [(entity_id, -days) for days, entity_id in self._overdue[:count]]
+
+    def _kinds(self, days: int | None, overdue: bool) -> list[str]:
+        """Return the counters the chore is counted in."""
+        kinds = [SUMMARY_OVERDUE] if overdue else []
+        if days == 0:
+            kinds.append(SUMMARY_DUE_TODAY)
+        if days is not None and 0 <= days < WEEK_DAYS:
+            kinds.append(SUMMARY_DUE_THIS_WEEK)
+        return kinds
+
+    @callback
+    def update(self, entity_id: str, days: int | None, overdue: bool) -> None:
+        """Count the chore with its new state instead of the old one."""
+        if (old := self._chores.get(entity_id)) == (days, overdue):
+            return
+        if old is not None:
+            self._remove(entity_id, *old)
+        self._chores[entity_id] = (days, overdue)
+        for kind in self._kinds(days, overdue):
+            self._counts[kind] += 1
+        if overdue:
+            insort(self._overdue, (days or 0, entity_id))
+        self._async_schedule_notify()
+
+    @callback
+    def remove(self, entity_id: str) -> None:
+        """Stop counting a removed chore."""
+        if (old := self._chores.pop(entity_id, None)) is not None:
+            self._remove(entity_id, *old)
+            self._async_schedule_notify()
+
+    def _remove(self, entity_id: str, days: int | None, overdue: bool) -> None:
+        """Take the old state of the chore out of the counters."""
+        for kind in self._kinds(days, overdue):
+            self._counts[kind] -= 1
+        if overdue:
+            index = bisect_left(self._overdue, (days or 0, entity_id))
+            del self._overdue[index]
+
+    @callback
+    def _async_chore_changed(self, change: dict[str, Any]) -> None:
+        """Update the summary with a change of a chore."""
+        if change["change"] == "removed":
+            self.remove(change["entity_id"])
+        elif change["change"] in ("added", "schedule"):
+            self.update(
+                change["entity_id"],
+                change[const.ATTR_DAYS],
+                change[const.ATTR_OVERDUE],
+            )
+
+    @callback
+    def _async_schedule_notify(self) -> None:
+        """Update the summary sensors once for the changes made together."""
+        if not self._pending:
+            self._pending = True
+            self._hass.loop.call_soon(self._async_notify)
+
+    @callback
+    def _async_notify(self) -> None:
+        """Update the summary sensors."""
+        self._pending = False
+        async_dispatcher_send(self._hass, const.SIGNAL_SUMMARY_CHANGED)
+
+
+class ChoreSummarySensor(SensorEntity):
+    """Number of chores overdue, due today or due this week."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, summary: ChoreSummary, kind: str) -> None:
+        """Create the sensor for one of the counters."""
+        self._summary = summary
+        self._kind = kind
+        self._attr_name = SUMMARY_NAMES[kind]
+        self._attr_icon = SUMMARY_ICONS[kind]
+        self._attr_unique_id = f"{const.DOMAIN}_{kind}"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the changes of the summary."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, const.SIGNAL_SUMMARY_CHANGED, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of chores."""
+        return self._summary.count(self._kind)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the most overdue chores."""
+        if self._kind != SUMMARY_OVERDUE:
+            return None
+        chores = self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+        return {
+            "most_overdue": [
+                {
+                    "entity_id": entity_id,
+                    "name": chores[entity_id].name if entity_id in chores else None,
+                    const.ATTR_OVERDUE_DAYS: days,
+                }
+                for entity_id, days in self._summary.most_overdue()
+            ]
+        }
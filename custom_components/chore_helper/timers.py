@@ -0,0 +1,87 @@
+"""One shared timer for the due times of all chores."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import heapq
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+import homeassistant.util.dt as dt_util
+
+
+class DueTimers:
+    """Deadlines in a heap, with a Home Assistant timer for the earliest only."""
+
+    __slots__ = "_hass", "_heap", "_deadlines", "_unsub", "_armed_at"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the timers."""
+        self._hass = hass
+        # (deadline, key) entries, outdated when the key got another deadline
+        self._heap: list[tuple[datetime, str]] = []
+        self._deadlines: dict[str, tuple[datetime, Callable[[], None]]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._armed_at: datetime | None = None
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    def __len__(self) -> int:
+        """Return the number of pending deadlines."""
+        return len(self._deadlines)
+
+    @callback
+    def schedule(self, key: str, when: datetime, action: Callable[[], None]) -> None:
+        """Call the action at the deadline, replacing the key's previous one."""
+        when = dt_util.as_utc(when)
+        if (current := self._deadlines.get(key)) is not None and current[0] == when:
+            self._deadlines[key] = (when, action)
+            return
+        self._deadlines[key] = (when, action)
+        heapq.heappush(self._heap, (when, key))
+        if len(self._heap) > 2 * len(self._deadlines) + 16:
+            self._heap = [(when, key) for key, (when, _) in self._deadlines.items()]
+            heapq.heapify(self._heap)
+        if self._armed_at is None or when < self._armed_at:
+            self._arm(when)
+
+    @callback
+    def cancel(self, key: str) -> None:
+        """Forget the key's deadline, its heap entry is dropped when reached."""
+        self._deadlines.pop(key, None)
+
+    @callback
+    def _arm(self, when: datetime) -> None:
+        """Set the Home Assistant timer to the deadline."""
+        if self._unsub is not None:
+            self._unsub()
+        self._unsub = async_track_point_in_utc_time(self._hass, self._async_fire, when)
+        self._armed_at = when
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Call the actions of the passed deadlines, and wait for the next one."""
+        self._unsub = None
+        self._armed_at = None
+        while self._heap and self._heap[0][0] <= now:
+            when, key = heapq.heappop(self._heap)
+            if (current := self._deadlines.get(key)) is None or current[0] != when:
+                continue  # Cancelled or rescheduled
+            del self._deadlines[key]
+            current[1]()
+        while self._heap and (
+            (current := self._deadlines.get(self._heap[0][1])) is None
+            or current[0] != self._heap[0][0]
+        ):
+            heapq.heappop(self._heap)
+        if self._heap:
+            self._arm(self._heap[0][0])
+
+    @callback
+    def _async_stop(self, _: Event) -> None:
+        """Stop the timer."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+            self._armed_at = None
@@ -0,0 +1,319 @@
+"""Forecasts of many schedules at once with NumPy arrays, when it is installed.
+
+The schedules that support it describe their candidate dates with a rule (every
+n days, weeks, months or years) and the first day to look from. The candidates
+of all schedules with the same kind of rule are calculated together, as an
+array of days with a row per schedule, and go through the same steps as in
+ChoreSchedule.due_dates: a candidate outside of the month range moves the
+search to the next range, and the removed and offset dates are applied. The
+results are the same as the forecasts calculated one date at a time.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:  # The schedules are forecast one by one without it
+    np = None
+
+AVAILABLE = np is not None
+
+RULE_DAILY = "daily"
+RULE_WEEKLY = "weekly"
+RULE_MONTHLY = "monthly"
+RULE_YEARLY = "yearly"
+
+# Day ordinals of dates fit in 22 bits, the rows are stored above them
+ORDINAL_BITS = 22
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Columns of candidates to calculate per row, at most
+MAX_WIDTH = 1 << 16
+
+
+class ForecastPlan:
+    """Inputs of the vectorized forecast of a schedule."""
+
+    __slots__ = (
+        "rule",
+        "first_day",
+        "count",
+        "first_month",
+        "last_month",
+        "removed",
+        "offsets",
+        "added",
+    )
+
+    def __init__(
+        self,
+        rule: tuple,
+        first_day: date,
+        count: int,
+        months: tuple[int, int],
+        removed: list[date],
+        offsets: dict[date, int],
+        added: list[date],
+    ) -> None:
+        """Store the inputs, the overrides already parsed."""
+        self.rule = rule
+        self.first_day = first_day
+        self.count = count
+        self.first_month, self.last_month = months
+        self.removed = removed
+        self.offsets = offsets
+        self.added = added
+
+
+def forecast_plans(plans: list[ForecastPlan]) -> list[array | None]:
+    """Forecast the plans, as arrays of day ordinals.
+
+    None for the plans that would need too many candidates, to be forecast
+    one by one.
+    """
+    results: list[array | None] = [None] * len(plans)
+    groups: dict[str, list[int]] = {}
+    for index, plan in enumerate(plans):
+        groups.setdefault(plan.rule[0], []).append(index)
+    for kind, indexes in groups.items():
+        for index, due_dates in zip(
+            indexes, _forecast_group(CANDIDATES[kind], [plans[i] for i in indexes])
+        ):
+            results[index] = due_dates
+    return results
+
+
+def _forecast_group(
+    candidates: Callable[[list[ForecastPlan], int], tuple],
+    plans: list[ForecastPlan],
+) -> list[array | None]:
+    """Forecast plans with the same kind of rule.
+
+    The rows that don't get through all of their iterations within the
+    calculated candidates are calculated again with more of them.
+    """
+    counts = np.array([plan.count for plan in plans], dtype=np.int64)
+    selected: list[np.ndarray | None] = [None] * len(plans)
+    pending = np.arange(len(plans))
+    width = int(counts.max()) * 2 + 8
+    while pending.size and width <= MAX_WIDTH:
+        rows = [plans[i] for i in pending]
+        days, valid = candidates(rows, width)
+        keep, done = _iterate(rows, days, valid, counts[pending])
+        for row in np.flatnonzero(done):
+            selected[pending[row]] = days[row][keep[row]]
+        pending = pending[~done]
+        width *= 4
+    return _apply_overrides(plans, selected)
+
+
+def _iterate(
+    plans: list[ForecastPlan], days: np.ndarray, valid: np.ndarray, counts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Select the candidates the iterations of ChoreSchedule.due_dates yield.
+
+    Every candidate inside of the month range takes an iteration. A candidate
+    outside of it takes one too, and moves the search to the start of the next
+    range, skipping the other candidates before it. Returns the selected
+    candidates, and the rows that got through all of their iterations.
+    """
+    first = np.array([plan.first_month for plan in plans], dtype=np.int64)[:, None]
+    last = np.array([plan.last_month for plan in plans], dtype=np.int64)[:, None]
+    months = days.astype("M8[D]").astype("M8[M]").astype(np.int64)
+    month = months % 12 + 1
+    wraps = first > last
+    in_range = np.where(
+        wraps,
+        (first <= month) | (month <= last),
+        (first <= month) & (month <= last),
+    )
+    # The first day of the next range, as in ChoreSchedule.move_to_range
+    target = (
+        (months - month + first + 12 * (~wraps & (month > last)))
+        .astype("M8[M]")
+        .astype("M8[D]")
+        .astype(np.int64)
+    )
+    in_range_gap = np.iinfo(np.int64).min
+    gap = np.where(in_range, in_range_gap, target)
+    # The gap of the previous valid candidate, for the first one none
+    columns = np.arange(days.shape[1])
+    previous = np.maximum.accumulate(np.where(valid, columns, -1), axis=1)
+    previous = np.concatenate(
+        [np.full((days.shape[0], 1), -1), previous[:, :-1]], axis=1
+    )
+    previous_gap = np.where(
+        previous >= 0,
+        np.take_along_axis(gap, np.maximum(previous, 0), axis=1),
+        in_range_gap + 1,
+    )
+    cost = valid & (in_range | (gap != previous_gap))
+    used = np.cumsum(cost, axis=1)
+    counts = counts[:, None]
+    return valid & in_range & (used <= counts), used[:, -1] >= counts[:, 0]
+
+
+def _apply_overrides(
+    plans: list[ForecastPlan], selected: list[np.ndarray | None]
+) -> list[array | None]:
+    """Remove and offset the selected dates, add the added ones."""
+    rows = [row for row, days in enumerate(selected) if days is not None]
+    results: list[array | None] = [None] * len(plans)
+    if not rows:
+        return results
+    sizes = [len(selected[row]) for row in rows]
+    ordinals = np.concatenate([selected[row] for row in rows]) + EPOCH_ORDINAL
+    keys = np.repeat(np.array(rows, dtype=np.int64), sizes) << ORDINAL_BITS | ordinals
+
+    removed = np.array(
+        [
+            row << ORDINAL_BITS | d.toordinal()
+            for row in rows
+            for d in plans[row].removed
+        ],
+        dtype=np.int64,
+    )
+    kept = ~np.isin(keys, removed)
+    offset_items = sorted(
+        (row << ORDINAL_BITS | d.toordinal(), offset)
+        for row in rows
+        for d, offset in plans[row].offsets.items()
+    )
+    if offset_items:
+        offset_keys = np.array([key for key, _ in offset_items], dtype=np.int64)
+        offsets = np.array([offset for _, offset in offset_items], dtype=np.int64)
+        position = np.minimum(np.searchsorted(offset_keys, keys), len(offset_keys) - 1)
+        ordinals = ordinals + np.where(
+            offset_keys[position] == keys, offsets[position], 0
+        )
+
+    for row, row_ordinals in zip(
+        rows, np.split(np.where(kept, ordinals, 0), np.cumsum(sizes)[:-1])
+    ):
+        added = np.array([d.toordinal() for d in plans[row].added], dtype=np.int64)
+        due_dates = np.unique(np.concatenate([row_ordinals[row_ordinals > 0], added]))
+        results[row] = array("i", due_dates.tolist())
+    return results
+
+
+def _epoch_days(days: list[date]) -> np.ndarray:
+    """Return the days since 1970-01-01 of the dates, as a column."""
+    return np.array([d.toordinal() - EPOCH_ORDINAL for d in days], dtype=np.int64)[
+        :, None
+    ]
+
+
+def _weekday(days: np.ndarray) -> np.ndarray:
+    """Return the weekdays of the days since 1970-01-01, a thursday."""
+    return (days + 3) % 7
+
+
+def _month_days(months: np.ndarray) -> np.ndarray:
+    """Return the days since 1970-01-01 of the first days of the months."""
+    return months.astype("M8[M]").astype("M8[D]").astype(np.int64)
+
+
+def _daily_candidates(
+    plans: list[ForecastPlan], width: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return every period days from the schedule start.
+
+    ("daily", period, schedule start date)
+    """
+    first = _epoch_days([plan.first_day for plan in plans])
+    period = np.array([plan.rule[1] for plan in plans], dtype=np.int64)[:, None]
+    start = _epoch_days([plan.rule[2] for plan in plans])
+    days = first + (start - first) % period + np.arange(width) * period
+    return days, np.ones(days.shape, dtype=bool)
+
+
+def _weekly_candidates(
+    plans: list[ForecastPlan], width: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return a weekday of the weeks a number of periods after the start week.
+
+    ("weekly", period, weekday, ISO week of the schedule start)
+    """
+    first = _epoch_days([plan.first_day for plan in plans])
+    period, weekday, start_week = (
+        np.array([plan.rule[i] for plan in plans], dtype=np.int64)[:, None]
+        for i in (1, 2, 3)
+    )
+    days = first + (weekday - _weekday(first)) % 7 + np.arange(width) * 7
+    thursday = days - _weekday(days) + 3
+    year_start = thursday.astype("M8[D]").astype("M8[Y]").astype("M8[D]")
+    week = (thursday - year_start.astype(np.int64)) // 7 + 1
+    return days, (week - start_week) % period == 0
+
+
+def _monthly_candidates(
+    plans: list[ForecastPlan], width: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return a day of the month, or nth weekday, every period months.
+
+    ("monthly", period, start month, day of month, weekday, order, skipped
+    month), the months counted from 1970-01, and either the day of month or
+    the weekday and order None.
+    """
+    first = _epoch_days([plan.first_day for plan in plans])
+    period, start_month, skipped = (
+        np.array(
+            [-1 if plan.rule[i] is None else plan.rule[i] for plan in plans],
+            dtype=np.int64,
+        )[:, None]
+        for i in (1, 2, 6)
+    )
+    first_month = first.astype("M8[D]").astype("M8[M]").astype(np.int64)
+    months = (
+        first_month + (start_month - first_month) % period + np.arange(width) * period
+    )
+    month_start = _month_days(months)
+    day_of_month = np.array([plan.rule[3] or 0 for plan in plans], dtype=np.int64)[
+        :, None
+    ]
+    weekday, order = (
+        np.array([plan.rule[i] or 0 for plan in plans], dtype=np.int64)[:, None]
+        for i in (4, 5)
+    )
+    days = np.where(
+        day_of_month > 0,
+        month_start + day_of_month - 1,
+        month_start + (weekday - _weekday(month_start)) % 7 + (order - 1) * 7,
+    )
+    return days, (days >= first) & (months != skipped)
+
+
+def _yearly_candidates(
+    plans: list[ForecastPlan], width: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return a day of the year every period years.
+
+    ("yearly", period, month, day, start year)
+    """
+    period, month, day, start_year = (
+        np.array([plan.rule[i] for plan in plans], dtype=np.int64)[:, None]
+        for i in (1, 2, 3, 4)
+    )
+    first_year = []
+    for plan in plans:
+        _, plan_period, plan_month, plan_day, plan_start_year = plan.rule
+        year = plan.first_day.year
+        if date(year, plan_month, plan_day) < plan.first_day:
+            year += 1
+        if (difference := year - plan_start_year) > 0 and difference % plan_period:
+            year += plan_period - difference % plan_period
+        first_year.append(year)
+    years = np.array(first_year, dtype=np.int64)[:, None] + np.arange(width) * period
+    days = _month_days((years - 1970) * 12 + month - 1) + day - 1
+    return days, np.ones(days.shape, dtype=bool)
+
+
+CANDIDATES: dict[str, Callable[[list[ForecastPlan], int], tuple]] = {
+    RULE_DAILY: _daily_candidates,
+    RULE_WEEKLY: _weekly_candidates,
+    RULE_MONTHLY: _monthly_candidates,
+    RULE_YEARLY: _yearly_candidates,
+}
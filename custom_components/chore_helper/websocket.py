@@ -0,0 +1,55 @@
+"""WebSocket API pushing the chore changes to the frontend."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+import voluptuous as vol
+
+from . import const
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{const.DOMAIN}/subscribe"})
+@callback
+def ws_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the state of all chores, then their changes as they happen.
+
+    Changes are "added" and "removed" chores, "schedule" (next due date, overdue,
+    days), "dates" (added, removed and offset dates) and "completed".
+    """
+
+    @callback
+    def forward_change(change: dict[str, Any]) -> None:
+        """Send a change of a chore."""
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"change": change})
+        )
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, const.SIGNAL_CHORE_CHANGED, forward_change
+    )
+    connection.send_result(msg["id"])
+    chores = hass.data.get(const.DOMAIN, {}).get(const.SENSOR_PLATFORM, {})
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {
+                "snapshot": {
+                    entity_id: chore.snapshot() for entity_id, chore in chores.items()
+                }
+            },
+        )
+    )
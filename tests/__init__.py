@@ -1 +1,30 @@
 """Tests for Chore Helper integration."""
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper import const
+
+# A chore every 3 days from March 1st, 2024
+OPTIONS = {
+    "frequency": "every-n-days",
+    "period": 3,
+    "forecast_dates": 5,
+    "start_date": "2024-03-01",
+}
+
+
+async def setup_chore(
+    hass: HomeAssistant, title: str = "Sweep", **options
+) -> MockConfigEntry:
+    """Set up a chore from a config entry, with the options replacing OPTIONS."""
+    entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title=title,
+        options={**OPTIONS, **options},
+        version=const.CONFIG_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
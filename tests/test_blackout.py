@@ -0,0 +1,88 @@
+"""Test the blackout calendars."""
+
+from datetime import date
+
+from homeassistant.setup import async_setup_component
+import pytest
+import voluptuous as vol
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.blackout import BlackoutCalendar, parse_blackout
+
+from . import setup_chore
+
+
+def test_blackout_calendar():
+    """Calendars have dates, ranges of dates and days of every year."""
+    calendar = BlackoutCalendar(
+        "Holidays", ["12-25", "2024-07-04", "2024-12-30/2025-01-02", "02-29"]
+    )
+    assert date(2030, 12, 25) in calendar
+    assert date(2024, 7, 4) in calendar
+    assert date(2025, 7, 4) not in calendar
+    assert date(2024, 12, 31) in calendar
+    assert date(2025, 1, 2) in calendar
+    assert date(2025, 1, 3) not in calendar
+    assert date(2024, 2, 29) in calendar
+    assert date(2025, 3, 1) not in calendar
+
+    for value in ("13-01", "2024-02-30", "2024-03-05/2024-03-01", "soon"):
+        with pytest.raises(vol.Invalid):
+            parse_blackout(value)
+
+
+async def test_blackout_policies(hass, tmp_path, freezer):
+    """Blacked out dates are skipped, or shifted to the nearest free date."""
+    freezer.move_to("2024-03-01 10:00:00")
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / "vacation.yaml").write_text("- 2024-03-05/2024-03-07\n")
+    assert await async_setup_component(
+        hass,
+        const.DOMAIN,
+        {
+            const.DOMAIN: {
+                "blackouts": [
+                    {"name": "Vacation", "path": "vacation.yaml"},
+                    {"name": "Holidays", "dates": ["03-04"]},
+                ]
+            }
+        },
+    )
+    await setup_chore(
+        hass,
+        "Skip",
+        start_date="2024-03-01",
+        period=1,
+        forecast_dates=10,
+        blackouts=["Vacation", "Holidays"],
+    )
+    await setup_chore(
+        hass,
+        "Forward",
+        start_date="2024-03-01",
+        period=2,
+        forecast_dates=5,
+        blackouts=["Vacation"],
+        blackout_policy="shift_forward",
+    )
+    await setup_chore(
+        hass,
+        "Back",
+        start_date="2024-03-01",
+        period=2,
+        forecast_dates=5,
+        blackouts=["Vacation", "Unknown"],
+        blackout_policy="shift_back",
+    )
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    today = date(2024, 3, 1)
+
+    def days(entity_id: str) -> list[int]:
+        schedule = chores[entity_id].schedule
+        return [d.day for d in schedule.dates_between(today, date(2024, 3, 12), today)]
+
+    assert days("sensor.skip") == [1, 2, 3, 8, 9, 10, 11, 12]
+    assert days("sensor.forward") == [1, 3, 8, 9, 11]
+    assert days("sensor.back") == [1, 3, 4, 9, 11]
+    forecast = chores["sensor.skip"].schedule.forecast(today)
+    assert [date.fromordinal(day).day for day in forecast][:5] == [1, 2, 3, 8, 9]
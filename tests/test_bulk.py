@@ -0,0 +1,89 @@
+"""Test the bulk recompute of chore schedules in worker processes."""
+
+from array import array
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.bulk import BulkRecompute
+from custom_components.chore_helper.schedule import forecast_schedules
+
+from . import setup_chore
+
+
+async def test_bulk_recompute(hass, freezer):
+    """The chores forecast in the workers get the dates of a local forecast."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(
+        hass, const.DOMAIN, {const.DOMAIN: {"bulk_recompute_workers": 2}}
+    )
+    for period in range(1, 5):
+        await setup_chore(hass, f"Chore {period}", period=period)
+    await setup_chore(
+        hass, "Monthly", frequency="every-n-months", period=1, day_of_month=15
+    )
+    await hass.async_start()
+    await hass.async_block_till_done()
+    bulk = hass.data[const.DOMAIN][const.BULK_RECOMPUTE]
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    today = date(2024, 3, 2)
+    for chore in chores.values():
+        chore.set_due_dates(array("i"), today)
+        chore._last_updated = None  # Ready for the update
+
+    await chores["sensor.chore_2"].async_update()
+    assert bulk._executor is not None
+    for chore in chores.values():
+        assert chore.due_dates == sorted(set(chore.schedule.due_dates(today)))
+    assert chores["sensor.chore_2"].next_due_date == date(2024, 3, 1)
+    assert chores["sensor.monthly"].next_due_date == date(2024, 3, 15)
+    assert hass.states.get("sensor.monthly").attributes["next_due_date"] == date(
+        2024, 3, 15
+    )
+
+    bulk._executor.shutdown(wait=True)
+    await hass.async_stop()
+
+
+async def test_bulk_result_waits_for_chore(hass, freezer):
+    """The dates of a chore are set once its running change is done."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(
+        hass, const.DOMAIN, {const.DOMAIN: {"bulk_recompute_workers": 2}}
+    )
+    await setup_chore(hass, "Sweep", period=1)
+    await setup_chore(hass, "Mop", period=2)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    today = date(2024, 3, 2)
+    for chore in chores.values():
+        chore.set_due_dates(array("i"), today)
+        chore._last_updated = None  # Ready for the update
+
+    async def forecast(self, schedules, today):
+        return forecast_schedules(schedules, today)
+
+    mop = chores["sensor.mop"]
+    with patch.object(BulkRecompute, "_async_forecast", forecast):
+        async with mop._lock:
+            update = hass.async_create_task(chores["sensor.sweep"].async_update())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert chores["sensor.sweep"].due_dates
+            assert mop.due_dates == []
+            await hass.services.async_call(
+                const.DOMAIN, "complete", {"entity_id": "sensor.mop"}
+            )
+        await update
+    await hass.async_block_till_done()
+    # Forecast again after the completion, instead of the outdated result
+    assert mop.last_completed is not None
+    assert mop.due_dates == sorted(set(mop.schedule.due_dates(today)))
+    assert mop.next_due_date == date(2024, 3, 3)
+
+    hass.data[const.DOMAIN][const.BULK_RECOMPUTE]._executor.shutdown(wait=True)
+    await hass.async_stop()
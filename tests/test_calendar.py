@@ -0,0 +1,242 @@
+"""Test the chore calendars."""
+
+from datetime import date, timedelta
+
+from homeassistant.helpers import (
+    area_registry as ar,
+    entity_registry as er,
+    label_registry as lr,
+)
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+import pytest
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.chore_daily import DailySchedule
+from custom_components.chore_helper.chore_monthly import MonthlySchedule
+from custom_components.chore_helper.chore_weekly import WeeklySchedule
+from custom_components.chore_helper.chore_yearly import YearlySchedule
+
+from . import setup_chore
+
+
+async def _events(hass, start: date, end: date, entity_id: str = "calendar.chores"):
+    """Return the summary and start of the calendar events from start to end."""
+    calendar = hass.data["entity_components"]["calendar"].get_entity(entity_id)
+    events = await calendar.async_get_events(
+        hass,
+        dt_util.start_of_local_day(start),
+        dt_util.start_of_local_day(end),
+    )
+    return [(event.summary, event.start) for event in events]
+
+
+@pytest.mark.parametrize(
+    ("schedule_class", "options"),
+    [
+        (DailySchedule, {"frequency": "every-n-days", "period": 5}),
+        (
+            WeeklySchedule,
+            {"frequency": "every-n-weeks", "period": 2, "chore_day": "tue"},
+        ),
+        (
+            MonthlySchedule,
+            {
+                "frequency": "every-n-months",
+                "period": 1,
+                "chore_day": "fri",
+                "weekday_order_number": 2,
+                "first_month": "apr",
+                "last_month": "oct",
+            },
+        ),
+        (YearlySchedule, {"frequency": "every-n-years", "period": 1, "date": "02/29"}),
+    ],
+)
+def test_dates_between(schedule_class, options):
+    """The dates of a window are the forecast dates in the window."""
+    today = date(2024, 3, 2)
+    schedule = schedule_class(
+        {**options, "start_date": "2024-01-01", "forecast_dates": 500}
+    )
+    schedule.remove_dates = "2025-05-09"
+    schedule.offset_dates = "2025-06-13:3"
+    forecast = sorted(set(schedule.due_dates(today)))
+    for start, end in [
+        (date(2024, 1, 1), date(2024, 12, 31)),
+        (date(2025, 5, 1), date(2025, 6, 30)),
+        (date(2026, 2, 1), date(2026, 2, 1)),
+        (date(2027, 1, 1), date(2028, 6, 30)),
+    ]:
+        assert list(schedule.dates_between(start, end, today)) == [
+            day for day in forecast if start <= day <= end
+        ]
+
+
+async def test_window_beyond_forecast(hass, freezer):
+    """The calendar has the events of windows after the forecast dates."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Weekly", period=7, forecast_dates=2)
+    await setup_chore(
+        hass,
+        "Monthly",
+        frequency="every-n-months",
+        period=2,
+        day_of_month=5,
+        forecast_dates=1,
+    )
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    events = await _events(hass, date(2025, 1, 1), date(2025, 3, 1))
+    weekly = [date(2025, 1, 3) + timedelta(weeks=weeks) for weeks in range(9)]
+    assert sorted(day for summary, day in events if summary == "Weekly") == weekly
+    assert sorted(day for summary, day in events if summary == "Monthly") == [
+        date(2025, 1, 5)
+    ]
+    await hass.async_stop()
+
+
+async def test_cached_windows(hass, freezer):
+    """Windows are cached until a chore changes dates in them."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Weekly", period=7)
+    await setup_chore(
+        hass, "Monthly", frequency="every-n-months", period=2, day_of_month=5
+    )
+    await hass.async_start()
+    await hass.async_block_till_done()
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    data = hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+
+    january = await _events(hass, date(2025, 1, 1), date(2025, 2, 1))
+    february = await _events(hass, date(2025, 2, 1), date(2025, 3, 1))
+    assert len(data._cache) == 2
+    assert await _events(hass, date(2025, 1, 1), date(2025, 2, 1)) == january
+    assert len(data._cache) == 2
+
+    # Only the window with the added date is dropped
+    revision = data.revision
+    await chores["sensor.monthly"].add_date(date(2025, 2, 20))
+    assert data.revision > revision
+    assert len(data._cache) == 1
+    assert sorted(await _events(hass, date(2025, 2, 1), date(2025, 3, 1))) == sorted(
+        [*february, ("Monthly", date(2025, 2, 20))]
+    )
+
+    # A completion can move all later dates
+    await chores["sensor.weekly"].complete(dt_util.now())
+    assert not data._cache
+    await hass.async_stop()
+
+
+async def test_overdue_today_in_time_zone(hass, freezer):
+    """Overdue chores are shown on today of the Home Assistant time zone."""
+    hass.config.set_time_zone("Pacific/Kiritimati")
+    freezer.move_to("2024-03-02 12:00:00+00:00")  # March 3rd in Kiritimati
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, period=7, show_overdue_today=True)
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    assert await _events(hass, date(2024, 3, 1), date(2024, 3, 10)) == [
+        ("Sweep", date(2024, 3, 3)),
+        ("Sweep", date(2024, 3, 8)),
+    ]
+    await hass.async_stop()
+
+
+async def test_scoped_calendars(hass, freezer):
+    """Chores are in the calendars of their group, area and labels."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Sweep", group="Outdoor")
+    await setup_chore(hass, "Mop")
+    await setup_chore(hass, "Rake", group="Outdoor", period=4)
+    await setup_chore(hass, "Secret", group="Outdoor", hidden=True)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    start, end = date(2024, 3, 1), date(2024, 3, 8)
+
+    def summaries(events):
+        return sorted({summary for summary, _ in events})
+
+    assert summaries(await _events(hass, start, end)) == ["Mop", "Rake", "Sweep"]
+    outdoor = await _events(hass, start, end, "calendar.chores_outdoor")
+    assert summaries(outdoor) == ["Rake", "Sweep"]
+    index = hass.data[const.DOMAIN][const.CHORE_INDEX]
+    assert index.entities(const.SCOPE_GROUP, "Outdoor") == {
+        "sensor.sweep",
+        "sensor.rake",
+        "sensor.secret",
+    }
+
+    # Scoped calendars change with the chore dates too
+    await hass.services.async_call(
+        const.DOMAIN, "remove_date", {"entity_id": "sensor.rake"}, blocking=True
+    )
+    assert await _events(hass, start, end, "calendar.chores_outdoor") == [
+        event for event in outdoor if event != ("Rake", date(2024, 3, 1))
+    ]
+
+    area = ar.async_get(hass).async_create("Kitchen")
+    label = lr.async_get(hass).async_create("Wet")
+    er.async_get(hass).async_update_entity(
+        "sensor.mop", area_id=area.id, labels={label.label_id}
+    )
+    await hass.async_block_till_done()
+    assert summaries(await _events(hass, start, end, "calendar.chores_kitchen")) == [
+        "Mop"
+    ]
+    assert summaries(await _events(hass, start, end, "calendar.chores_wet")) == ["Mop"]
+
+    # The calendar of a scope without chores is removed
+    kitchen = hass.data["entity_components"]["calendar"].get_entity(
+        "calendar.chores_kitchen"
+    )
+    er.async_get(hass).async_update_entity("sensor.mop", area_id=None)
+    await hass.async_block_till_done()
+    assert "calendar.chores_kitchen" not in hass.states.async_entity_ids("calendar")
+    assert (
+        await kitchen.async_get_events(
+            hass, dt_util.start_of_local_day(start), dt_util.start_of_local_day(end)
+        )
+        == []
+    )
+    assert kitchen.event is None
+    await hass.async_stop()
+
+
+async def test_assignee_calendars(hass, freezer):
+    """The calendar of an assignee has the chores on their turns."""
+    freezer.move_to("2024-03-02 08:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Dishes", period=1, assignees=["Ann", "Bob"])
+    await setup_chore(hass, "Rent", period=7, assignees=["Bob"])
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    assert await _events(
+        hass, date(2024, 3, 1), date(2024, 3, 10), "calendar.chores_ann"
+    ) == [("Dishes", date(2024, 3, day)) for day in (1, 3, 5, 7, 9)]
+    calendar = hass.data["entity_components"]["calendar"].get_entity(
+        "calendar.chores_bob"
+    )
+    events = await calendar.async_get_events(
+        hass,
+        dt_util.start_of_local_day(date(2024, 3, 1)),
+        dt_util.start_of_local_day(date(2024, 3, 10)),
+    )
+    assert sorted((event.summary, event.start) for event in events) == [
+        ("Dishes", date(2024, 3, 2)),
+        ("Dishes", date(2024, 3, 4)),
+        ("Dishes", date(2024, 3, 6)),
+        ("Dishes", date(2024, 3, 8)),
+        ("Dishes", date(2024, 3, 10)),
+        ("Rent", date(2024, 3, 1)),
+        ("Rent", date(2024, 3, 8)),
+    ]
+    assert {event.description for event in events} == {"Assigned to Bob"}
+    await hass.async_stop()
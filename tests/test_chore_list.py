@@ -0,0 +1,133 @@
+"""Test the chore lists, many chores set up from one config entry."""
+
+import json
+
+from homeassistant.helpers import entity_platform, entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.config_flow import ChoreHelperConfigFlowHandler
+
+
+def _definitions(count: int, period: int = 2) -> list[dict]:
+    """Return the definitions of the chores of a list."""
+    return [
+        {
+            "unique_id": f"c{i}",
+            "name": f"Chore {i}",
+            "frequency": "every-n-days",
+            "period": period,
+            "start_date": "2024-01-01",
+        }
+        for i in range(count)
+    ]
+
+
+def _spacing(chore) -> set[int]:
+    """Return the days between the due dates of a chore."""
+    due_dates = chore.due_dates
+    return {(b - a).days for a, b in zip(due_dates, due_dates[1:])}
+
+
+async def _import(hass, path: str, chore_list: str) -> dict:
+    """Import the chores of a file to a chore list."""
+    result = await hass.services.async_call(
+        const.DOMAIN,
+        "import",
+        {"path": path, "chore_list": chore_list},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    return result
+
+
+async def test_chore_list(hass, tmp_path):
+    """The chores of a list are set up, updated and removed together."""
+    dated = {
+        "unique_id": "dated",
+        "name": "Dated",
+        "frequency": "blank",
+        "add_dates": ["2031-01-01"],
+    }
+    config = {
+        const.DOMAIN: {"chore_list": "House", "sensors": [*_definitions(50), dated]}
+    }
+    assert await async_setup_component(hass, const.DOMAIN, config)
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    [entry] = hass.config_entries.async_entries(const.DOMAIN)
+    assert entry.title == "House"
+    assert len(entry.options["chores"]) == 51
+    assert not ChoreHelperConfigFlowHandler.async_supports_options_flow(entry)
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    assert len(chores) == 51
+    assert chores["sensor.chore_3"].unique_id == "c3"
+    assert hass.states.get("sensor.chore_3").attributes["next_due_date"] is not None
+    assert chores["sensor.dated"].add_dates == "2031-01-01"
+    assert hass.states.get("calendar.chores") is not None
+
+    # Import again: one chore changed, two dropped and one added
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    path = tmp_path / "chores.json"
+    definitions = _definitions(50)
+    definitions[0]["period"] = 5
+    del definitions[1]
+    definitions.append(
+        {"unique_id": "extra", "name": "Extra", "frequency": "every-n-weeks"}
+    )
+    path.write_text(json.dumps(definitions))
+    result = await _import(hass, str(path), "House")
+    assert result["created"] == ["extra"]
+    assert result["updated"] == ["c0"]
+    assert sorted(result["removed"]) == ["c1", "dated"]
+    assert len(result["unchanged"]) == 48
+    registry = er.async_get(hass)
+    assert registry.async_get("sensor.chore_1") is None
+    assert registry.async_get("sensor.dated") is None
+    assert hass.states.get("sensor.extra") is not None
+    assert _spacing(chores["sensor.chore_0"]) == {5}
+
+    # Changed chores of the list are updated in place
+    chore_0 = chores["sensor.chore_0"]
+    definitions[0]["period"] = 6
+    path.write_text(json.dumps(definitions))
+    result = await _import(hass, str(path), "House")
+    assert result["updated"] == ["c0"]
+    assert chores["sensor.chore_0"] is chore_0
+    assert _spacing(chore_0) == {6}
+
+    # The chores of a list can't be imported to another list
+    result = await _import(hass, str(path), "Garden")
+    assert len(result["errors"]) == 50
+    assert not result["created"]
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not chores
+    await hass.async_stop()
+
+
+async def test_chores_added_at_once(hass, monkeypatch):
+    """The chores of a list are added to the sensor platform in one call."""
+    calls = []
+    add_entities = entity_platform.EntityPlatform._async_schedule_add_entities_for_entry
+
+    def count_entities(self, new_entities, update_before_add=False):
+        new_entities = list(new_entities)
+        if self.domain == "sensor" and self.config_entry is not None:
+            calls.append(len(new_entities))
+        return add_entities(self, new_entities, update_before_add)
+
+    monkeypatch.setattr(
+        entity_platform.EntityPlatform,
+        "_async_schedule_add_entities_for_entry",
+        count_entities,
+    )
+    config = {const.DOMAIN: {"chore_list": "House", "sensors": _definitions(20)}}
+    assert await async_setup_component(hass, const.DOMAIN, config)
+    await hass.async_block_till_done()
+    assert calls == [20]
+    await hass.async_stop()
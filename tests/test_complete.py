@@ -0,0 +1,71 @@
+"""Test completing chores."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.chore import Chore
+
+
+async def test_complete_during_recompute(hass):
+    """A completion waits for the running recompute of the chore dates."""
+    today = dt_util.now().date()
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title="Sweep",
+        options={
+            "frequency": "every-n-days",
+            "period": 3,
+            "forecast_dates": 5,
+            "start_date": today.isoformat(),
+        },
+        version=const.CONFIG_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.sweep"]
+    assert chore.next_due_date == today
+
+    load_due_dates = Chore._async_load_due_dates
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_load_due_dates(self):
+        loading.set()
+        await release.wait()
+        await load_due_dates(self)
+
+    with patch.object(Chore, "_async_load_due_dates", slow_load_due_dates):
+        recompute = hass.async_create_task(chore._async_update())
+        await loading.wait()
+        complete = hass.async_create_task(
+            hass.services.async_call(
+                const.DOMAIN, "complete", {"entity_id": "sensor.sweep"}, blocking=True
+            )
+        )
+        update_state = hass.async_create_task(
+            hass.services.async_call(
+                const.DOMAIN,
+                "update_state",
+                {"entity_id": "sensor.sweep"},
+                blocking=True,
+            )
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert chore.last_completed is None
+        assert not complete.done() and not update_state.done()
+
+        release.set()
+        await asyncio.gather(recompute, complete, update_state)
+    assert chore.last_completed is not None
+    assert chore.next_due_date == today + timedelta(days=3)
+    await hass.async_stop()
@@ -0,0 +1,94 @@
+"""Test the log of the chore completions."""
+
+from datetime import timedelta
+
+from homeassistant.core import Context
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.chore_helper import completion_log, const
+
+from . import setup_chore
+
+
+def _stored(hass_storage, key: str) -> list:
+    """Return the stored records of a key."""
+    return hass_storage[key]["data"]["records"]
+
+
+async def test_log_completions(hass, hass_storage, hass_admin_user, freezer):
+    """Completions are logged with the user, and expired records are dropped."""
+    freezer.move_to("2024-03-02 10:00:00")
+    expired = int((dt_util.utcnow() - timedelta(days=400)).timestamp())
+    hass_storage[completion_log.STORAGE_KEY] = {
+        "version": 1,
+        "key": completion_log.STORAGE_KEY,
+        "data": {"records": [["sensor.old", expired, None, 0]]},
+    }
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    log = hass.data[const.DOMAIN][const.COMPLETION_LOG]
+    assert len(log) == 0
+    await setup_chore(hass)
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        const.DOMAIN,
+        "complete",
+        {"entity_id": "sensor.sweep"},
+        blocking=True,
+        context=Context(user_id=hass_admin_user.id),
+    )
+    [(chore_id, completed, user_id, lateness)] = log.records()
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.sweep"]
+    assert chore_id == chore.unique_id
+    assert completed == dt_util.utcnow().replace(microsecond=0)
+    assert user_id == hass_admin_user.id
+    assert lateness == 1
+
+    freezer.tick(timedelta(seconds=completion_log.SAVE_DELAY + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(_stored(hass_storage, completion_log.STORAGE_KEY)) == 1
+    await hass.async_stop()
+
+
+async def test_log_rotation(hass, hass_storage, freezer):
+    """Saves write the recent records only, the older ones are archived."""
+    freezer.move_to("2024-03-02 10:00:00")
+    log = completion_log.CompletionLog(hass)
+    await log.async_load()
+    for _ in range(completion_log.SEGMENT_RECORDS + 2):
+        log.append("sensor.sweep", dt_util.utcnow())
+    assert len(log) == completion_log.SEGMENT_RECORDS + 2
+
+    # The saved data is a copy, records appended after are saved next time
+    data = log._data_to_save()
+    log.append("sensor.sweep", dt_util.utcnow())
+    assert len(data["records"]) == 2
+
+    freezer.tick(timedelta(seconds=completion_log.SAVE_DELAY + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(_stored(hass_storage, completion_log.STORAGE_KEY)) == 3
+    archived = _stored(hass_storage, completion_log.ARCHIVE_STORAGE_KEY)
+    assert len(archived) == completion_log.SEGMENT_RECORDS
+
+    # Another completion doesn't write the archive again
+    del hass_storage[completion_log.ARCHIVE_STORAGE_KEY]
+    log.append("sensor.sweep", dt_util.utcnow())
+    freezer.tick(timedelta(seconds=completion_log.SAVE_DELAY + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(_stored(hass_storage, completion_log.STORAGE_KEY)) == 4
+    assert completion_log.ARCHIVE_STORAGE_KEY not in hass_storage
+
+    reloaded = completion_log.CompletionLog(hass)
+    hass_storage[completion_log.ARCHIVE_STORAGE_KEY] = {
+        "version": 1,
+        "key": completion_log.ARCHIVE_STORAGE_KEY,
+        "data": {"records": archived},
+    }
+    await reloaded.async_load()
+    assert list(reloaded.records()) == list(log.records())
@@ -0,0 +1,75 @@
+"""Test the chores due at a time of the day."""
+
+import asyncio
+from datetime import datetime
+
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.chore_helper import const
+
+from . import setup_chore
+
+
+def _overdue(hass, entity_id: str) -> bool:
+    """Return if the chore is overdue."""
+    return hass.states.get(entity_id).attributes[const.ATTR_OVERDUE]
+
+
+async def test_overdue_at_due_time(hass, freezer):
+    """A chore is overdue from its due time, without waiting for the next poll."""
+    freezer.move_to("2024-03-02 08:00:00-08:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Sweep", start_date="2024-03-02", period=1, time="09:00")
+    await setup_chore(hass, "Mop", start_date="2024-03-02", period=1, time="10:00")
+    await setup_chore(hass, "Dust", start_date="2024-03-02", period=1)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    timers = hass.data[const.DOMAIN][const.DUE_TIMERS]
+    assert len(timers) == 2
+    assert not _overdue(hass, "sensor.sweep")
+
+    freezer.move_to("2024-03-02 09:00:01-08:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert _overdue(hass, "sensor.sweep")
+    assert not _overdue(hass, "sensor.mop")
+    assert not _overdue(hass, "sensor.dust")
+    assert len(timers) == 1
+
+    # Chores with a due time are timed events
+    calendar = hass.data["entity_components"]["calendar"].get_entity("calendar.chores")
+    today = dt_util.start_of_local_day(datetime(2024, 3, 2))
+    events = await calendar.async_get_events(hass, today, today)
+    starts = {event.summary: event.start for event in events}
+    assert starts["Sweep"] == datetime.fromisoformat("2024-03-02T09:00:00-08:00")
+    assert starts["Mop"] == datetime.fromisoformat("2024-03-02T10:00:00-08:00")
+    assert not isinstance(starts["Dust"], datetime)
+
+    # The timer of the next due date is set after a completion
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.sweep"}, blocking=True
+    )
+    assert len(timers) == 2
+    await hass.async_stop()
+
+
+async def test_due_time_waits_for_chore(hass, freezer):
+    """The state at the due time is updated once a running change is done."""
+    freezer.move_to("2024-03-02 08:00:00-08:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Sweep", start_date="2024-03-02", period=1, time="09:00")
+    await hass.async_start()
+    await hass.async_block_till_done()
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.sweep"]
+
+    async with chore._lock:
+        freezer.move_to("2024-03-02 09:00:01-08:00")
+        async_fire_time_changed(hass)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert not _overdue(hass, "sensor.sweep")
+    await hass.async_block_till_done()
+    assert _overdue(hass, "sensor.sweep")
+    await hass.async_stop()
@@ -0,0 +1,53 @@
+"""Test the iCalendar export of the chores."""
+
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_helper import const
+
+from . import setup_chore
+
+URL = "/api/chore_helper/calendar.ics"
+
+
+async def test_ics_export(hass, hass_client):
+    """The chores are exported, and the export is only sent again after changes."""
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Sweep", assignees=["Ann", "Bob"])
+    await setup_chore(
+        hass, "Mop, floor; kitchen", period=7, time="09:30", group="Downstairs"
+    )
+    await hass.async_start()
+    await hass.async_block_till_done()
+    client = await hass_client()
+
+    response = await client.get(URL)
+    assert response.status == 200
+    body = await response.text()
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.endswith("END:VCALENDAR\r\n")
+    assert "SUMMARY:Mop\\, floor\\; kitchen\r\n" in body
+    assert "DTSTART;VALUE=DATE:" in body  # All day chores
+    assert "DESCRIPTION:Assigned to Ann\r\n" in body
+    # Chores with a due time are exported in UTC
+    assert any(
+        line.startswith("DTSTART:") and line.endswith("Z")
+        for line in body.split("\r\n")
+    )
+
+    etag = response.headers["ETag"]
+    response = await client.get(URL, headers={"If-None-Match": etag})
+    assert response.status == 304
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.sweep"}, blocking=True
+    )
+    response = await client.get(URL, headers={"If-None-Match": etag})
+    assert response.status == 200
+    assert response.headers["ETag"] != etag
+
+    # The export of a scope, or an assignee
+    body = await (await client.get(f"{URL}?group=Downstairs")).text()
+    assert "SUMMARY:Sweep" not in body and "SUMMARY:Mop" in body
+    body = await (await client.get(f"{URL}?assignee=Bob")).text()
+    assert "Assigned to Ann" not in body and "Assigned to Bob" in body
+    assert (await client.get(f"{URL}?area=unknown")).status == 404
+    await hass.async_stop()
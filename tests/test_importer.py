@@ -0,0 +1,189 @@
+"""Test importing chores."""
+
+from datetime import date, timedelta
+
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from custom_components.chore_helper import const
+
+CHORES_YAML = """
+- unique_id: mow
+  name: Mow
+  frequency: every-n-weeks
+  period: 3
+  chore_day: sat
+  start_date: "2024-01-01"
+- unique_id: rent
+  name: Rent
+  frequency: every-n-months
+  weekday_order_number: 2
+  chore_day: mon
+- unique_id: broken
+  name: Broken
+  frequency: blank
+  extra: 1
+- unique_id: taxes
+  name: Taxes
+  frequency: every-n-years
+  date: "04/15"
+  add_dates: ["2024-05-01"]
+"""
+
+ONE_OFF_ICS = """BEGIN:VCALENDAR\r
+VERSION:2.0\r
+BEGIN:VEVENT\r
+UID:dentist-1\r
+SUMMARY:Dentist\r
+DTSTART;VALUE=DATE:{day}\r
+END:VEVENT\r
+END:VCALENDAR\r
+"""
+
+
+async def test_import_ics_one_off(hass, tmp_path):
+    """A one-off event becomes a due date of the chore, and a calendar event."""
+    day = dt_util.now().date() + timedelta(days=10)
+    hass.config.config_dir = str(tmp_path)
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    (tmp_path / "tasks.ics").write_text(
+        ONE_OFF_ICS.format(day=day.strftime("%Y%m%d")), newline=""
+    )
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    result = await hass.services.async_call(
+        const.DOMAIN,
+        "import",
+        {"path": "tasks.ics"},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    assert result["created"] == ["ics_dentist"]
+
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dentist"]
+    assert chore.next_due_date == day
+    state = hass.states.get("sensor.dentist")
+    assert state.attributes[const.ATTR_NEXT_DATE] == day
+    assert int(state.state) == 10
+
+    calendar = hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+    start = dt_util.start_of_local_day(day - timedelta(days=1))
+    events = await calendar.async_get_events(hass, start, start + timedelta(days=3))
+    assert [(event.summary, event.start) for event in events] == [("Dentist", day)]
+
+    # A removed date is no longer due
+    await hass.services.async_call(
+        const.DOMAIN,
+        "remove_date",
+        {"entity_id": "sensor.dentist", "date": day},
+        blocking=True,
+    )
+    assert list(chore.due_dates_between(date.min, date.max)) == []
+    assert chore.next_due_date is None
+    await hass.async_stop()
+
+
+async def test_import_yaml(hass, tmp_path, freezer):
+    """Chores are created from YAML, and updated from a file."""
+    freezer.move_to("2024-03-02 10:00:00")
+    config = {
+        const.DOMAIN: {
+            "sensors": [
+                {
+                    "unique_id": "mow",
+                    "name": "Mow",
+                    "frequency": "every-n-weeks",
+                    "period": 2,
+                    "chore_day": "sat",
+                    "start_date": "2024-01-01",
+                },
+                {"unique_id": "invalid", "name": "Invalid", "frequency": "sometimes"},
+                {
+                    "unique_id": "rent",
+                    "name": "Rent",
+                    "frequency": "every-n-months",
+                    "weekday_order_number": 2,
+                    "chore_day": "mon",
+                },
+            ]
+        }
+    }
+    assert await async_setup_component(hass, const.DOMAIN, config)
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+    entries = hass.config_entries.async_entries(const.DOMAIN)
+    assert sorted(entry.title for entry in entries) == ["Mow", "Rent"]
+    mow = next(entry for entry in entries if entry.title == "Mow")
+    assert mow.options["period"] == 2
+    assert hass.states.get("sensor.rent").attributes[const.ATTR_NEXT_DATE] == date(
+        2024, 3, 11
+    )
+
+    hass.config.config_dir = str(tmp_path)
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    (tmp_path / "chores.yaml").write_text(CHORES_YAML)
+    result = await hass.services.async_call(
+        const.DOMAIN,
+        "import",
+        {"path": "chores.yaml"},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    assert result["updated"] == ["mow"]
+    assert result["unchanged"] == ["rent"]
+    assert result["created"] == ["taxes"]
+    assert [error["unique_id"] for error in result["errors"]] == ["broken"]
+    assert mow.options["period"] == 3
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    assert chores["sensor.taxes"].add_dates == "2024-05-01"
+    assert chores["sensor.taxes"].due_dates[:2] == [date(2024, 4, 15), date(2024, 5, 1)]
+    await hass.async_stop()
+
+
+YEARLY_ICS = """BEGIN:VCALENDAR\r
+VERSION:2.0\r
+BEGIN:VEVENT\r
+UID:taxes\r
+SUMMARY:Taxes\r
+DTSTART;VALUE=DATE:20240415\r
+RRULE:FREQ=YEARLY\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:leap\r
+SUMMARY:Leap\r
+DTSTART;VALUE=DATE:20240229\r
+RRULE:FREQ=YEARLY\r
+END:VEVENT\r
+END:VCALENDAR\r
+"""
+
+
+async def test_import_ics_yearly(hass, tmp_path, freezer):
+    """Yearly events become yearly chores, unless the date is not in every year."""
+    freezer.move_to("2024-03-02 10:00:00")
+    hass.config.config_dir = str(tmp_path)
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    (tmp_path / "yearly.ics").write_text(YEARLY_ICS, newline="")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        const.DOMAIN, "import", {"path": "yearly.ics"}, blocking=True
+    )
+    await hass.async_block_till_done()
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    assert chores["sensor.taxes"].schedule.frequency == "every-n-years"
+    assert chores["sensor.taxes"].next_due_date == date(2024, 4, 15)
+    assert chores["sensor.leap"].schedule.frequency == "rrule"
+    assert chores["sensor.leap"].next_due_date == date(2024, 2, 29)
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.leap"}, blocking=True
+    )
+    assert chores["sensor.leap"].next_due_date == date(2028, 2, 29)
+    await hass.async_stop()
@@ -0,0 +1,104 @@
+"""Test the storage of the added, removed and offset dates."""
+
+from datetime import date
+
+from homeassistant.core import State
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    mock_restore_cache,
+)
+
+from custom_components.chore_helper import const, overrides
+
+from . import OPTIONS
+
+
+async def _setup_sweep(hass) -> None:
+    """Set up a chore with a known unique ID."""
+    entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title="Sweep",
+        entry_id="sweep",
+        options={**OPTIONS, "period": 7},
+        version=const.CONFIG_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_migrate_attributes(hass, hass_storage, freezer):
+    """Overrides in the restored attributes are moved to the storage."""
+    freezer.move_to("2024-03-02 10:00:00")
+    mock_restore_cache(
+        hass,
+        [
+            State(
+                "sensor.sweep",
+                "6",
+                {
+                    const.ATTR_ADD_DATES: "2024-03-05",
+                    const.ATTR_REMOVE_DATES: "",
+                    const.ATTR_OFFSET_DATES: "2024-03-08:2",
+                },
+            )
+        ],
+    )
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await _setup_sweep(hass)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.sweep"]
+    assert chore.add_dates == "2024-03-05"
+    assert chore.remove_dates is None
+    assert chore.offset_dates == "2024-03-08:2"
+
+    # The attributes have the number of overrides, instead of the dates
+    attributes = hass.states.get("sensor.sweep").attributes
+    assert attributes["overrides"] == {"added": 1, "removed": 0, "offset": 1}
+    assert const.ATTR_ADD_DATES not in attributes
+
+    await hass.services.async_call(
+        const.DOMAIN,
+        "remove_date",
+        {"entity_id": "sensor.sweep", "date": date(2024, 3, 15)},
+        blocking=True,
+    )
+    await hass.async_stop()
+    assert hass_storage[overrides.STORAGE_KEY]["data"] == {
+        "sweep": {
+            overrides.ADDED: [date(2024, 3, 5).toordinal()],
+            overrides.REMOVED: [date(2024, 3, 15).toordinal()],
+            overrides.OFFSET: [[date(2024, 3, 8).toordinal(), 2]],
+        }
+    }
+
+
+async def test_restore_from_storage(hass, hass_storage, freezer):
+    """The stored overrides take precedence over the restored attributes."""
+    freezer.move_to("2024-03-02 10:00:00")
+    mock_restore_cache(
+        hass, [State("sensor.sweep", "6", {const.ATTR_ADD_DATES: "2024-03-05"})]
+    )
+    hass_storage[overrides.STORAGE_KEY] = {
+        "version": overrides.STORAGE_VERSION,
+        "key": overrides.STORAGE_KEY,
+        "data": {"sweep": {overrides.REMOVED: [date(2024, 3, 1).toordinal()]}},
+    }
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await _setup_sweep(hass)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.sweep"]
+    assert chore.add_dates is None
+    assert chore.remove_dates == "2024-03-01"
+    await chore.async_update_ha_state(True)  # Restored chores wait for the poll
+    assert chore.next_due_date == date(2024, 3, 8)
+
+    # Chores without overrides are not stored
+    store = hass.data[const.DOMAIN][const.OVERRIDES]
+    store.set("sweep", None, None, None)
+    assert store.get("sweep") is None
+    await hass.async_stop()
+    assert hass_storage[overrides.STORAGE_KEY]["data"] == {}
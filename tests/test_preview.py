@@ -0,0 +1,146 @@
+"""Test the preview of the next due dates in the config and options flows."""
+
+from datetime import date
+import time
+
+from homeassistant import config_entries
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.blackout import BlackoutCalendar
+from custom_components.chore_helper.chore_daily import DailySchedule
+from custom_components.chore_helper.preview import (
+    PREVIEW_TIME_BUDGET,
+    PREVIEW_TIMEOUT,
+    next_due_dates,
+)
+
+from . import setup_chore
+
+
+async def _preview(client, flow_id: str, flow_type: str, user_input: dict):
+    """Start the preview, returning the due dates and if they are truncated."""
+    await client.send_json_auto_id(
+        {
+            "type": "chore_helper/start_preview",
+            "flow_id": flow_id,
+            "flow_type": flow_type,
+            "user_input": user_input,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"], msg
+    msg = await client.receive_json()
+    return msg["event"]["due_dates"], msg["event"]["truncated"]
+
+
+async def test_config_flow_preview(hass, hass_ws_client, freezer):
+    """The preview has the dates of the options entered in both steps."""
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    client = await hass_ws_client(hass)
+    freezer.move_to("2024-03-02 10:00:00")  # After the authentication
+    result = await hass.config_entries.flow.async_init(
+        const.DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"name": "Mow", "frequency": "every-n-months"}
+    )
+    assert result["step_id"] == "detail"
+    assert result["preview"] == const.DOMAIN
+
+    due_dates, truncated = await _preview(
+        client,
+        result["flow_id"],
+        "config_flow",
+        {
+            "period": 1,
+            "chore_day": "sat",
+            "weekday_order_number": "2",
+            "start_date": "2024-03-01",
+        },
+    )
+    assert due_dates[:3] == ["2024-03-09", "2024-04-13", "2024-05-11"]
+    assert len(due_dates) == 10 and not truncated
+
+    # Unknown flows and invalid options are errors
+    await client.send_json_auto_id(
+        {
+            "type": "chore_helper/start_preview",
+            "flow_id": "unknown",
+            "flow_type": "config_flow",
+            "user_input": {},
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["error"]["code"] == "flow_not_found"
+    await client.send_json_auto_id(
+        {
+            "type": "chore_helper/start_preview",
+            "flow_id": result["flow_id"],
+            "flow_type": "config_flow",
+            "user_input": {"period": 1, "date": "13/45"},
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["error"]["code"] == "invalid_user_input"
+
+
+async def test_options_flow_preview(hass, hass_ws_client, freezer):
+    """The preview of an options flow keeps the overrides of the chore."""
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    client = await hass_ws_client(hass)
+    freezer.move_to("2024-03-02 10:00:00")  # After the authentication
+    entry = await setup_chore(hass)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    await hass.services.async_call(
+        const.DOMAIN,
+        "remove_date",
+        {"entity_id": "sensor.sweep", "date": date(2024, 3, 5)},
+        blocking=True,
+    )
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"frequency": "every-n-days"}
+    )
+    due_dates, _ = await _preview(
+        client,
+        result["flow_id"],
+        "options_flow",
+        {"period": 2, "start_date": "2024-03-01"},
+    )
+    assert due_dates[:3] == ["2024-03-03", "2024-03-07", "2024-03-09"]
+    await hass.async_stop()
+
+
+def test_budget_without_dates():
+    """A schedule without dates is searched for the time budget only."""
+    schedule = DailySchedule(
+        {"frequency": "every-n-days", "period": 1, "start_date": "2024-01-01"}
+    )
+    schedule.blackouts = (BlackoutCalendar("always", ["2024-01-01/2199-12-31"]),)
+    started = time.monotonic()
+    assert next_due_dates(schedule, date(2024, 3, 2)) == ([], True)
+    assert time.monotonic() - started < PREVIEW_TIME_BUDGET + 0.2
+
+
+async def test_preview_rule_without_dates(hass, hass_ws_client):
+    """The preview of a recurrence rule without dates returns in time."""
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    client = await hass_ws_client(hass)
+    result = await hass.config_entries.flow.async_init(
+        const.DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"name": "Never", "frequency": "rrule"}
+    )
+    started = time.monotonic()
+    due_dates, truncated = await _preview(
+        client,
+        result["flow_id"],
+        "config_flow",
+        {"rrule": "FREQ=DAILY;BYMONTH=2;BYMONTHDAY=30", "start_date": "2024-03-01"},
+    )
+    assert due_dates == [] and truncated
+    assert time.monotonic() - started < PREVIEW_TIMEOUT + 0.5
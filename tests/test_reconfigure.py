@@ -0,0 +1,87 @@
+"""Test changing the options of a chore in place."""
+
+from datetime import time, timedelta
+
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper import const
+
+OPTIONS = {
+    "frequency": "every-n-days",
+    "period": 3,
+    "forecast_dates": 5,
+    "assignees": ["alice", "bob"],
+}
+
+
+async def _setup_chore(hass):
+    """Set up a chore starting today, returning its config entry."""
+    today = dt_util.now().date()
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title="Sweep",
+        options={**OPTIONS, "start_date": today.isoformat()},
+        version=const.CONFIG_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    return entry
+
+
+async def _events(hass):
+    """Return the start of the chore events in the next week."""
+    calendar = hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+    start = dt_util.start_of_local_day()
+    events = await calendar.async_get_events(hass, start, start + timedelta(days=7))
+    return [event.start for event in events]
+
+
+async def test_reconfigure_time(hass):
+    """A new time changes the cached calendar events and the revision."""
+    entry = await _setup_chore(hass)
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    chore = chores["sensor.sweep"]
+    schedule = chore.schedule
+    calendar = hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+    today = dt_util.now().date()
+    assert await _events(hass) == [
+        today,
+        today + timedelta(days=3),
+        today + timedelta(days=6),
+    ]
+    revision = calendar._revision
+
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, "time": "08:00:00"}
+    )
+    await hass.async_block_till_done()
+    assert chores["sensor.sweep"] is chore and chore.schedule is schedule
+    assert calendar._revision > revision
+    assert [(start.date(), start.time()) for start in await _events(hass)] == [
+        (today + timedelta(days=days), time(8)) for days in (0, 3, 6)
+    ]
+    await hass.async_stop()
+
+
+async def test_reconfigure_assignees(hass):
+    """New assignees replace the assignee scopes of the chore."""
+    entry = await _setup_chore(hass)
+    index = hass.data[const.DOMAIN][const.CHORE_INDEX]
+    calendars = hass.data[const.DOMAIN][const.SCOPED_CALENDARS]
+    assert {("assignee", "alice"), ("assignee", "bob")} <= index.scopes("sensor.sweep")
+
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, "assignees": ["carol"]}
+    )
+    await hass.async_block_till_done()
+    scopes = index.scopes("sensor.sweep")
+    assert ("assignee", "carol") in scopes
+    assert ("assignee", "alice") not in scopes and ("assignee", "bob") not in scopes
+    assert ("assignee", "carol") in calendars
+    assert ("assignee", "alice") not in calendars
+    await hass.async_stop()
@@ -0,0 +1,222 @@
+"""Test the chore schedules, independent of Home Assistant."""
+
+from array import array
+from datetime import date, datetime
+import tracemalloc
+
+import pytest
+
+from custom_components.chore_helper import vectorized
+from custom_components.chore_helper.blackout import BlackoutCalendar
+from custom_components.chore_helper.chore_daily import DailySchedule
+from custom_components.chore_helper.chore_monthly import MonthlySchedule
+from custom_components.chore_helper.chore_rrule import RRuleSchedule
+from custom_components.chore_helper.chore_weekly import WeeklySchedule
+from custom_components.chore_helper.chore_yearly import YearlySchedule
+from custom_components.chore_helper.schedule import forecast_schedules
+
+TODAY = date(2024, 3, 2)
+FREQUENCIES = [
+    (DailySchedule, {"frequency": "every-n-days"}),
+    (WeeklySchedule, {"frequency": "every-n-weeks", "chore_day": "sat"}),
+    (MonthlySchedule, {"frequency": "every-n-months", "day_of_month": 15}),
+    (MonthlySchedule, {"frequency": "after-n-months", "chore_day": "mon"}),
+    (YearlySchedule, {"frequency": "every-n-years", "date": "04/01"}),
+]
+
+
+def _schedules(count: int, forecast_dates: int = 20) -> list:
+    """Create a mix of schedules."""
+    schedules = []
+    for i in range(count):
+        schedule_class, options = FREQUENCIES[i % len(FREQUENCIES)]
+        schedules.append(
+            schedule_class(
+                {
+                    **options,
+                    "period": i % 3 + 1,
+                    "forecast_dates": forecast_dates,
+                    "start_date": date(2024, 1, i % 28 + 1).isoformat(),
+                }
+            )
+        )
+    return schedules
+
+
+def _bytes_per_chore(build) -> float:
+    """Return the memory retained per chore by the built due dates."""
+    tracemalloc.start()
+    try:
+        due_dates = build()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return retained / len(due_dates)
+
+
+def test_forecast_ordinals():
+    """The forecast is a sorted array of the day ordinals of the due dates."""
+    schedule = DailySchedule(
+        {
+            "frequency": "every-n-days",
+            "period": 3,
+            "forecast_dates": 4,
+            "start_date": "2024-03-01",
+        }
+    )
+    schedule.add_dates = "2024-03-02"
+    forecast = schedule.forecast(TODAY)
+    assert isinstance(forecast, array) and forecast.typecode == "i"
+    assert [date.fromordinal(day) for day in forecast] == [
+        date(2024, 3, 1),
+        date(2024, 3, 2),
+        date(2024, 3, 4),
+        date(2024, 3, 7),
+        date(2024, 3, 10),
+        date(2024, 3, 13),
+    ]
+
+
+def test_forecast_memory():
+    """Ordinals take a fraction of the memory of dates, per chore."""
+    schedules = _schedules(500)
+    forecasts = [schedule.forecast(TODAY) for schedule in schedules]
+    as_dates = _bytes_per_chore(
+        lambda: [[date.fromordinal(day) for day in f] for f in forecasts]
+    )
+    as_ordinals = _bytes_per_chore(lambda: [f[:] for f in forecasts])
+    # 21 dates a chore: a list of date objects, or an array of 4 byte integers
+    report = f"{as_dates:.0f} bytes/chore as dates, {as_ordinals:.0f} as ordinals"
+    assert as_ordinals < 256, report
+    assert as_ordinals * 3 < as_dates, report
+
+
+def _turns(schedule, today: date, count: int) -> list[tuple[date, str | None]]:
+    """Return the first due dates with their assignees."""
+    return [
+        (due_date, schedule.assignee(due_date, today))
+        for due_date in sorted(schedule.due_dates(today))[:count]
+    ]
+
+
+def test_turns_of_moved_dates():
+    """Offsets and blackout shifts move a date without changing whose turn it is."""
+    today = date(2024, 1, 1)
+    schedule = DailySchedule(
+        {
+            "frequency": "every-n-days",
+            "period": 7,
+            "start_date": "2024-01-01",
+            "assignees": ["Ann", "Bob"],
+            "forecast_dates": 10,
+        }
+    )
+    schedule.offset_dates = "2024-01-08:-1"
+    assert _turns(schedule, today, 4) == [
+        (date(2024, 1, 1), "Ann"),
+        (date(2024, 1, 7), "Bob"),
+        (date(2024, 1, 15), "Ann"),
+        (date(2024, 1, 22), "Bob"),
+    ]
+
+    schedule.offset_dates = None
+    schedule.blackouts = (BlackoutCalendar("Trip", ["2024-01-14/2024-01-16"]),)
+    schedule.blackout_policy = "shift_back"
+    assert _turns(schedule, today, 4) == [
+        (date(2024, 1, 1), "Ann"),
+        (date(2024, 1, 8), "Bob"),
+        (date(2024, 1, 13), "Ann"),
+        (date(2024, 1, 22), "Bob"),
+    ]
+
+    # The due date offset of monthly chores can move a date to another month
+    monthly = MonthlySchedule(
+        {
+            "frequency": "every-n-months",
+            "period": 1,
+            "day_of_month": 1,
+            "due_date_offset": -3,
+            "start_date": "2024-01-01",
+            "assignees": ["Ann", "Bob"],
+            "forecast_dates": 10,
+        }
+    )
+    monthly.offset_dates = "2024-03-29:5"
+    assert [turn for _, turn in _turns(monthly, today, 4)] == [
+        "Ann",
+        "Bob",
+        "Ann",
+        "Bob",
+    ]
+
+
+def test_rule_turns():
+    """The turns of a recurrence rule follow its occurrences from the start."""
+    schedule = RRuleSchedule(
+        {
+            "frequency": "rrule",
+            "rrule": "FREQ=WEEKLY;BYDAY=MO",
+            "start_date": "2024-01-01",
+            "assignees": ["Ann", "Bob"],
+            "forecast_dates": 10,
+        }
+    )
+    assert _turns(schedule, date(2024, 1, 1), 6) == [
+        (date(2024, 1, 1), "Ann"),
+        (date(2024, 1, 8), "Bob"),
+        (date(2024, 1, 15), "Ann"),
+        (date(2024, 1, 22), "Bob"),
+        (date(2024, 1, 29), "Ann"),
+        (date(2024, 2, 5), "Bob"),
+    ]
+
+
+VECTORIZED_FREQUENCIES = [
+    *FREQUENCIES,
+    (DailySchedule, {"frequency": "after-n-days"}),
+    (WeeklySchedule, {"frequency": "after-n-weeks"}),
+    (WeeklySchedule, {"frequency": "every-n-weeks", "first_week": 2}),
+    (
+        MonthlySchedule,
+        {"frequency": "every-n-months", "chore_day": "fri", "weekday_order_number": -1},
+    ),
+    (
+        MonthlySchedule,
+        {"frequency": "every-n-months", "day_of_month": 31, "due_date_offset": 2},
+    ),
+    (YearlySchedule, {"frequency": "after-n-years", "date": "02/29"}),
+]
+
+
+@pytest.mark.skipif(not vectorized.AVAILABLE, reason="NumPy is not installed")
+def test_vectorized_forecast():
+    """The forecasts of the arrays are the forecasts one date at a time."""
+    schedules = []
+    for i in range(240):
+        schedule_class, options = VECTORIZED_FREQUENCIES[
+            i % len(VECTORIZED_FREQUENCIES)
+        ]
+        schedule = schedule_class(
+            {
+                **options,
+                "period": i % 4 + 1,
+                "forecast_dates": 15,
+                "start_date": date(2023, i % 12 + 1, i % 28 + 1).isoformat(),
+                "first_month": ("jan", "apr", "nov")[i % 3],
+                "last_month": ("dec", "sep", "feb")[i % 3],
+            }
+        )
+        if i % 5 == 1:
+            schedule.last_completed = datetime(2024, 2, i % 28 + 1, 18)
+        if i % 7 == 2:
+            schedule.remove_dates = "2024-03-04 2024-04-01 2024-05-15"
+        if i % 7 == 3:
+            schedule.offset_dates = "2024-03-09:2 2024-04-15:-3 2024-06-01:1"
+        if i % 11 == 4:
+            schedule.add_dates = "2024-03-20"
+        schedules.append(schedule)
+    # Most are forecast with arrays, the rest one date at a time
+    assert sum(s.forecast_plan(TODAY) is not None for s in schedules) > 150
+
+    expected = [schedule.forecast(TODAY) for schedule in schedules]
+    assert forecast_schedules(schedules, TODAY) == expected
@@ -0,0 +1,36 @@
+"""Test the chore sensors."""
+
+from datetime import date
+
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_helper import const
+
+from . import setup_chore
+
+
+async def test_cached_attributes(hass, freezer):
+    """The attributes are built again only after the chore changed."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.sweep"]
+
+    attributes = chore.extra_state_attributes
+    assert chore.extra_state_attributes is attributes
+    assert attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 1)
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.sweep"}, blocking=True
+    )
+    assert chore.extra_state_attributes is not attributes
+    assert chore.extra_state_attributes[const.ATTR_LAST_COMPLETED] is not None
+    assert chore.extra_state_attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 4)
+
+    # The time of the last update changes with every update, and is not recorded
+    state = hass.states.get("sensor.sweep")
+    assert const.ATTR_LAST_UPDATED in state.attributes
+    assert const.ATTR_LAST_UPDATED in state.state_info["unrecorded_attributes"]
+    assert const.ATTR_NEXT_DATE not in state.state_info["unrecorded_attributes"]
+    await hass.async_stop()
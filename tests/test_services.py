@@ -0,0 +1,131 @@
+"""Test the chore services."""
+
+from datetime import date
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import (
+    area_registry as ar,
+    entity_registry as er,
+    label_registry as lr,
+)
+from homeassistant.setup import async_setup_component
+import pytest
+import voluptuous as vol
+
+from custom_components.chore_helper import const
+
+from . import setup_chore
+
+
+async def test_targets(hass, freezer):
+    """Services target the chores of a group, area or label."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Sweep", group="Outdoor")
+    await setup_chore(hass, "Rake", group="Outdoor")
+    await setup_chore(hass, "Dust")
+    await setup_chore(hass, "Cook")
+    await setup_chore(hass, "Wash")
+    area = ar.async_get(hass).async_create("Kitchen")
+    label = lr.async_get(hass).async_create("Wet")
+    er.async_get(hass).async_update_entity("sensor.cook", area_id=area.id)
+    er.async_get(hass).async_update_entity("sensor.wash", labels={label.label_id})
+    await hass.async_start()
+    await hass.async_block_till_done()
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+
+    for target, offset in (
+        ({"group": "Outdoor"}, 2),
+        ({"area_id": area.id}, 1),
+        ({"label_id": label.label_id}, 3),
+    ):
+        await hass.services.async_call(
+            const.DOMAIN, "offset_date", {**target, "offset": offset}, blocking=True
+        )
+    await hass.async_block_till_done()
+    assert {entity_id: chore.offset_dates for entity_id, chore in chores.items()} == {
+        "sensor.sweep": "2024-03-01:2",
+        "sensor.rake": "2024-03-01:2",
+        "sensor.dust": None,
+        "sensor.cook": "2024-03-01:1",
+        "sensor.wash": "2024-03-01:3",
+    }
+
+    # A target is required
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            const.DOMAIN, "offset_date", {"offset": 2}, blocking=True
+        )
+    await hass.async_stop()
+
+
+async def _get_schedule(hass, **data) -> dict:
+    """Call the get_schedule service."""
+    return await hass.services.async_call(
+        const.DOMAIN, "get_schedule", data, blocking=True, return_response=True
+    )
+
+
+async def test_get_schedule(hass, freezer):
+    """The schedule has the next dates, or the dates of a window, up to a limit."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Sweep", group="Indoor", period=3)
+    await setup_chore(hass, "Dust", group="Indoor", period=7, forecast_dates=2)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    sweep = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.sweep"]
+
+    response = await _get_schedule(hass, group="Indoor", start="2024-03-01", count=4)
+    assert response == {
+        "sensor.sweep": {
+            "name": "Sweep",
+            "due_dates": ["2024-03-01", "2024-03-04", "2024-03-07", "2024-03-10"],
+        },
+        "sensor.dust": {
+            "name": "Dust",
+            "due_dates": ["2024-03-01", "2024-03-08", "2024-03-15", "2024-03-22"],
+        },
+    }
+
+    # Windows past the forecast have the calculated dates
+    response = await _get_schedule(
+        hass, entity_id="sensor.sweep", start="2024-03-01", end="2024-12-31"
+    )
+    assert response["sensor.sweep"]["due_dates"] == [
+        day.isoformat()
+        for day in sweep.due_dates_between(date(2024, 3, 1), date(2024, 12, 31))
+    ]
+    assert "truncated" not in response["sensor.sweep"]
+
+    # The total number of dates is limited
+    response = await _get_schedule(
+        hass, group="Indoor", start="2024-03-01", end="2034-01-01"
+    )
+    assert list(response) == ["sensor.dust", "sensor.sweep"]
+    assert len(response["sensor.dust"]["due_dates"]) == 514
+    assert "truncated" not in response["sensor.dust"]
+    assert len(response["sensor.sweep"]["due_dates"]) == 486
+    assert response["sensor.sweep"]["truncated"]
+
+    # The schedule follows the changed dates
+    await hass.services.async_call(
+        const.DOMAIN,
+        "remove_date",
+        {"entity_id": "sensor.sweep", "date": date(2024, 3, 4)},
+        blocking=True,
+    )
+    response = await _get_schedule(
+        hass, entity_id="sensor.sweep", start="2024-03-01", count=2
+    )
+    assert response["sensor.sweep"]["due_dates"] == ["2024-03-01", "2024-03-07"]
+
+    with pytest.raises(HomeAssistantError):
+        await _get_schedule(
+            hass, entity_id="sensor.sweep", start="2024-03-01", end="2024-02-01"
+        )
+    with pytest.raises(HomeAssistantError):
+        await _get_schedule(
+            hass, entity_id="sensor.sweep", start="2024-03-01", end="2035-01-01"
+        )
+    await hass.async_stop()
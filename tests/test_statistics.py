@@ -0,0 +1,89 @@
+"""Test the completion statistics of the chores."""
+
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.chore_helper import const, statistics
+
+from . import setup_chore
+
+
+def _statistics(hass) -> dict:
+    """Return the statistics attributes of the chore."""
+    attributes = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][
+        "sensor.sweep"
+    ].extra_state_attributes
+    return {
+        key: attributes[key]
+        for key in (
+            const.ATTR_ON_TIME_RATE,
+            const.ATTR_AVERAGE_LATENESS,
+            const.ATTR_CURRENT_STREAK,
+            const.ATTR_BEST_STREAK,
+            const.ATTR_RECENT_COMPLETIONS,
+        )
+    }
+
+
+async def _complete(hass) -> None:
+    """Complete the chore now."""
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.sweep"}, blocking=True
+    )
+
+
+async def _move_to(hass, freezer, time: str) -> None:
+    """Move the time, and update the chore."""
+    freezer.move_to(time)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    await hass.data[const.DOMAIN][const.SENSOR_PLATFORM][
+        "sensor.sweep"
+    ].async_update_ha_state(True)
+
+
+async def test_statistics(hass, hass_storage, freezer):
+    """Completions count towards the rate and streaks, missed dates end the streak."""
+    freezer.move_to("2024-03-02 10:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, period=1, start_date="2024-03-02")
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    assert _statistics(hass) == {
+        const.ATTR_ON_TIME_RATE: None,
+        const.ATTR_AVERAGE_LATENESS: None,
+        const.ATTR_CURRENT_STREAK: 0,
+        const.ATTR_BEST_STREAK: 0,
+        const.ATTR_RECENT_COMPLETIONS: 0,
+    }
+    await _complete(hass)
+    await _complete(hass)  # Early for March 3rd
+    assert _statistics(hass) == {
+        const.ATTR_ON_TIME_RATE: 100.0,
+        const.ATTR_AVERAGE_LATENESS: 0.0,
+        const.ATTR_CURRENT_STREAK: 2,
+        const.ATTR_BEST_STREAK: 2,
+        const.ATTR_RECENT_COMPLETIONS: 2,
+    }
+
+    # March 3rd passed without a completion
+    await _move_to(hass, freezer, "2024-03-05 10:00:00")
+    assert _statistics(hass)[const.ATTR_CURRENT_STREAK] == 0
+    assert _statistics(hass)[const.ATTR_BEST_STREAK] == 2
+    await _complete(hass)  # Two days late
+    assert _statistics(hass) == {
+        const.ATTR_ON_TIME_RATE: 66.7,
+        const.ATTR_AVERAGE_LATENESS: 0.7,
+        const.ATTR_CURRENT_STREAK: 0,
+        const.ATTR_BEST_STREAK: 2,
+        const.ATTR_RECENT_COMPLETIONS: 3,
+    }
+
+    # Only the recent completions expire
+    await _move_to(hass, freezer, "2024-04-10 10:00:00")
+    assert _statistics(hass)[const.ATTR_RECENT_COMPLETIONS] == 0
+    assert _statistics(hass)[const.ATTR_ON_TIME_RATE] == 66.7
+    await hass.async_stop()
+    [stored] = hass_storage[statistics.STORAGE_KEY]["data"].values()
+    assert stored[:6] == [3, 3, 2, 2, 0, 2] and stored[-1] == []
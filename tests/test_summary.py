@@ -0,0 +1,65 @@
+"""Test the summary sensors of all chores."""
+
+from datetime import timedelta
+
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from custom_components.chore_helper import const
+
+from . import setup_chore
+
+
+async def test_summary(hass, freezer):
+    """The summary counts the chores by due date, and follows their changes."""
+    freezer.move_to("2024-03-10 10:00:00")
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Old", start_date="2024-03-01", period=30)
+    await setup_chore(hass, "Older", start_date="2024-02-20", period=60)
+    await setup_chore(hass, "Today", start_date="2024-03-10", period=30)
+    await setup_chore(hass, "Soon", start_date="2024-03-13", period=30)
+    await setup_chore(hass, "Later", start_date="2024-04-13", period=30)
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    overdue = hass.states.get("sensor.chores_overdue")
+    assert overdue.state == "2"
+    assert [
+        (chore["entity_id"], chore["overdue_days"])
+        for chore in overdue.attributes["most_overdue"]
+    ] == [("sensor.older", 19), ("sensor.old", 9)]
+    assert hass.states.get("sensor.chores_due_today").state == "1"
+    assert hass.states.get("sensor.chores_due_this_week").state == "2"
+
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.older"}, blocking=True
+    )
+    await hass.async_block_till_done()
+    overdue = hass.states.get("sensor.chores_overdue")
+    assert overdue.state == "1"
+    assert [chore["entity_id"] for chore in overdue.attributes["most_overdue"]] == [
+        "sensor.old"
+    ]
+
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.old"}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.chores_overdue").state == "0"
+    await hass.async_stop()
+
+
+async def test_summary_of_removed_chore(hass):
+    """A removed chore is no longer counted."""
+    start_date = dt_util.now().date() - timedelta(days=5)
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    entry = await setup_chore(hass, start_date=start_date.isoformat(), period=30)
+    await hass.async_start()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.chores_overdue").state == "1"
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.chores_overdue").state == "0"
+    assert hass.states.get("sensor.chores_overdue").attributes["most_overdue"] == []
+    await hass.async_stop()
@@ -0,0 +1,64 @@
+"""Test the websocket subscription to the chore changes."""
+
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_helper import const
+
+from . import setup_chore
+
+
+async def _change(client) -> dict:
+    """Return the next change sent to the subscription."""
+    return (await client.receive_json())["event"]["change"]
+
+
+async def test_subscribe(hass, hass_ws_client):
+    """Subscribers get all chores, then the changes as they happen."""
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await setup_chore(hass, "Sweep")
+    await hass.async_start()
+    await hass.async_block_till_done()
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "chore_helper/subscribe"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    subscription = msg["id"]
+    snapshot = (await client.receive_json())["event"]["snapshot"]
+    assert list(snapshot) == ["sensor.sweep"]
+    assert snapshot["sensor.sweep"]["next_due_date"] is not None
+
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.sweep"}, blocking=True
+    )
+    completed = await _change(client)
+    assert completed["entity_id"] == "sensor.sweep"
+    assert completed["change"] == "completed"
+    assert completed["last_completed"] is not None
+    assert (await _change(client))["change"] == "schedule"
+
+    await hass.services.async_call(
+        const.DOMAIN,
+        "add_date",
+        {"entity_id": "sensor.sweep", "date": "2099-01-01"},
+        blocking=True,
+    )
+    change = await _change(client)
+    assert change["change"] == "dates"
+    assert change["add_dates"] == "2099-01-01"
+
+    await setup_chore(hass, "Mop")
+    change = await _change(client)
+    assert (change["entity_id"], change["change"]) == ("sensor.mop", "added")
+
+    # No changes are sent after unsubscribing
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscription}
+    )
+    assert (await client.receive_json())["success"]
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.sweep"}, blocking=True
+    )
+    await client.send_json_auto_id({"type": "ping"})
+    assert (await client.receive_json())["type"] == "pong"
+    await hass.async_stop()